@@ -17,13 +17,16 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.ai_transformer import HybridProcessor, check_internet
 from utils.image_processor import ImageProcessor
+from utils.processed_db import ProcessedDB
 
 # 카메라 모듈 (gphoto2 없으면 None)
 try:
     from utils.camera import CameraConnection
+    from utils.pipeline import Pipeline, pipeline_options
     CAMERA_AVAILABLE = True
 except ImportError:
     CameraConnection = None
+    Pipeline = None
     CAMERA_AVAILABLE = False
 
 
@@ -35,20 +38,6 @@ def load_config(config_path: str = "config.json") -> dict:
     return {}
 
 
-def save_processed_files(processed_files: set, filepath: str):
-    """처리된 파일 목록 저장"""
-    with open(filepath, 'w') as f:
-        json.dump(list(processed_files), f)
-
-
-def load_processed_files(filepath: str) -> set:
-    """처리된 파일 목록 로드"""
-    if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return set(json.load(f))
-    return set()
-
-
 def process_single_file(processor: HybridProcessor, input_path: str, output_dir: str) -> bool:
     """단일 파일 처리"""
     if not os.path.exists(input_path):
@@ -80,7 +69,7 @@ def kill_camera_daemons():
 
 
 def monitor_camera(processor: HybridProcessor, config: dict, interval: float = 5.0):
-    """카메라 모니터링 모드 - 카메라에서 직접 파일 가져와서 처리"""
+    """카메라 모니터링 모드 - 촬영 즉시 카메라에서 파일 가져와서 처리"""
     if not CAMERA_AVAILABLE:
         print("❌ gphoto2가 설치되지 않아 카메라 모니터링 불가")
         print("   폴더 모니터링 모드를 사용하세요: python3 cli.py monitor-folder")
@@ -89,103 +78,76 @@ def monitor_camera(processor: HybridProcessor, config: dict, interval: float = 5
     download_dir = config.get('paths', {}).get('original_folder', 'downloaded_photos')
     output_dir = config.get('paths', {}).get('output_folder', 'processed_photos')
     processed_db = config.get('monitoring', {}).get('processed_files_db', 'processed_files.json')
+    full_rescan = config.get('camera', {}).get('full_rescan_seconds', CameraConnection.FULL_RESCAN_SECONDS)
 
     os.makedirs(download_dir, exist_ok=True)
     os.makedirs(output_dir, exist_ok=True)
 
-    processed_files = load_processed_files(processed_db)
+    processed_files = ProcessedDB(processed_db)
 
     print("=" * 50)
     print("📸 카메라 모니터링 모드")
     print("=" * 50)
     print(f"📁 다운로드: {download_dir}")
     print(f"📁 출력: {output_dir}")
-    print(f"⏱️  확인 간격: {interval}초")
+    print(f"⏱️  폴링 간격 (이벤트 미지원 시): {interval}초")
     print("   Ctrl+C로 중지\n")
 
     # 카메라 데몬 종료
     print("🔧 카메라 데몬 종료 중...")
     kill_camera_daemons()
 
-    camera = None
-    retry_count = 0
-    max_retries = 3
+    # 파이프라인: 감지 → 다운로드 → 변환 → 게시 (단계별 대기열)
+    def on_download(job):
+        print(f"\n🆕 새 파일: {job['file_info']['name']} ({pipeline.mode})")
+        print(f"   📥 다운로드 완료: {job['input_path']}")
+
+    def on_publish(job):
+        filename = job['file_info']['name']
+        if job['upgrade']:
+            # 프로그레시브 모드: 오버레이 → AI 결과 교체
+            mark = "🤖" if job['success'] else "⚠️"
+            print(f"   {mark} {filename} AI 교체 {'완료' if job['success'] else '실패'}: {job['message']}")
+            processed_files.record_job(filename, job)
+        elif job['success']:
+            print(f"   ✅ {filename} 처리 완료 [{job['method']}]: {job['message']}")
+            processed_files.record_job(filename, job)
+        else:
+            print(f"   ❌ {filename} 처리 실패 [{job['method']}]: {job['message']}")
+            pipeline.forget(job['file_info'])
+
+    camera = CameraConnection(full_rescan_seconds=full_rescan)
+    pipeline = Pipeline(
+        camera, processor, download_dir, output_dir,
+        on_publish=on_publish,
+        on_download=on_download,
+        is_processed=lambda file_info: file_info['name'] in processed_files,
+        poll_interval=interval,
+        **pipeline_options(config)
+    )
+    print(f"🧵 워커: 다운로드 {pipeline.workers['download']}, 변환 {pipeline.workers['transform']}\n")
+    pipeline.start()
+
+    # 이전 실행에서 AI 교체를 기다리던 파일 (프로그레시브 모드)
+    resumed = pipeline.resume_upgrades(processed_files.pending_upgrades())
+    if resumed:
+        print(f"🔁 AI 교체 대기 {resumed}건 다시 제출\n")
 
     try:
+        # 단계별 대기열 표시 (변경될 때만)
+        last_status = None
         while True:
-            # 카메라 연결
-            if camera is None:
-                print("📷 카메라 연결 시도...")
-                camera = CameraConnection()
-                if camera.connect():
-                    print(f"✅ 카메라 연결: {camera.camera_name}")
-                    retry_count = 0
-                else:
-                    retry_count += 1
-                    if retry_count >= max_retries:
-                        print(f"❌ 카메라 연결 실패 ({max_retries}회 시도)")
-                        print("   USB 케이블을 확인하고 다시 시도하세요")
-                        kill_camera_daemons()
-                        retry_count = 0
-                    camera = None
-                    time.sleep(interval)
-                    continue
-
-            # 카메라에서 파일 목록 가져오기
-            try:
-                camera_files = camera.get_all_files()
-            except Exception as e:
-                print(f"⚠️ 파일 목록 가져오기 실패: {e}")
-                camera.disconnect()
-                camera = None
-                continue
-
-            # 새 파일 확인 및 처리
-            for file_info in camera_files:
-                # file_info는 dict: {'path': ..., 'name': ..., 'full_path': ...}
-                filename = file_info['name']
-
-                # 이미 처리된 파일 스킵
-                if filename in processed_files:
-                    continue
-
-                # JPG만 처리
-                if not filename.lower().endswith(('.jpg', '.jpeg')):
-                    continue
-
-                print(f"\n🆕 새 파일 발견: {filename}")
-
-                # 다운로드
-                local_path = os.path.join(download_dir, filename)
-                try:
-                    if camera.download_file(file_info, download_dir):
-                        print(f"   📥 다운로드 완료: {local_path}")
-                    else:
-                        print(f"   ❌ 다운로드 실패")
-                        continue
-                except Exception as e:
-                    print(f"   ❌ 다운로드 오류: {e}")
-                    continue
-
-                # 처리
-                output_path = os.path.join(output_dir, filename)
-                success, method, message = processor.process_image(local_path, output_path)
-
-                if success:
-                    print(f"   ✅ 처리 완료 [{method}]: {message}")
-                    processed_files.add(filename)
-                    save_processed_files(processed_files, processed_db)
-                else:
-                    print(f"   ❌ 처리 실패 [{method}]: {message}")
-
-            time.sleep(interval)
+            status = pipeline.status_text()
+            if status != last_status:
+                print(f"   📊 {status}")
+                last_status = status
+            time.sleep(0.5)
 
     except KeyboardInterrupt:
         print("\n\n🛑 모니터링 중지")
     finally:
-        if camera:
-            camera.disconnect()
-            print("📷 카메라 연결 해제")
+        pipeline.stop()
+        print("📷 카메라 연결 해제")
 
 
 def monitor_folder(processor: HybridProcessor, input_dir: str, output_dir: str,
@@ -199,7 +161,7 @@ def monitor_folder(processor: HybridProcessor, input_dir: str, output_dir: str,
     print(f"⏱️  확인 간격: {interval}초")
     print("   Ctrl+C로 중지\n")
 
-    processed_files = load_processed_files(processed_file)
+    processed_files = ProcessedDB(processed_file)
     os.makedirs(output_dir, exist_ok=True)
     os.makedirs(input_dir, exist_ok=True)
 
@@ -220,8 +182,9 @@ def monitor_folder(processor: HybridProcessor, input_dir: str, output_dir: str,
 
                 if success:
                     print(f"✅ 완료 [{method}]: {message}")
-                    processed_files.add(filename)
-                    save_processed_files(processed_files, processed_file)
+                    processed_files.record_job(filename, {
+                        'success': success, 'method': method, 'output_path': output_path
+                    })
                 else:
                     print(f"❌ 실패 [{method}]: {message}")
 
@@ -272,7 +235,7 @@ def show_status(config: dict):
 def main():
     parser = argparse.ArgumentParser(description='이미지 처리 CLI')
     parser.add_argument('--config', '-c', default='config.json', help='설정 파일 경로')
-    parser.add_argument('--mode', '-m', choices=['ai', 'overlay', 'hybrid'], help='처리 모드')
+    parser.add_argument('--mode', '-m', choices=['ai', 'overlay', 'hybrid', 'progressive'], help='처리 모드')
     parser.add_argument('--status', '-s', action='store_true', help='상태 확인')
 
     subparsers = parser.add_subparsers(dest='command')
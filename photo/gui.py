@@ -16,6 +16,7 @@ import queue
 import sys
 import os
 import json
+import time
 import subprocess
 from datetime import datetime
 # PIL 제외 (macOS 버전 호환성 문제)
@@ -23,13 +24,16 @@ from datetime import datetime
 # 카메라 모듈 (gphoto2 없으면 None)
 try:
     from utils.camera import CameraConnection
+    from utils.pipeline import Pipeline, pipeline_options
     CAMERA_AVAILABLE = True
 except ImportError:
     CameraConnection = None
+    Pipeline = None
     CAMERA_AVAILABLE = False
     print("⚠️ gphoto2 미설치 - 카메라 기능 비활성화 (수동 모드 사용)")
 
 from utils.ai_transformer import HybridProcessor, check_internet
+from utils.processed_db import ProcessedDB
 
 
 def kill_camera_processes():
@@ -57,6 +61,7 @@ class PhotoProcessorGUI:
         # 상태 변수
         self.is_monitoring = False
         self.monitor_thread = None
+        self.pipeline = None
         self.log_queue = queue.Queue()
 
         # 통계
@@ -69,6 +74,7 @@ class PhotoProcessorGUI:
 
         # 상태 업데이트 타이머
         self.status_update_job = None
+        self.pipeline_update_job = None
 
         # 설정 로드
         self.load_config()
@@ -91,6 +97,7 @@ class PhotoProcessorGUI:
         self.overlay_image = self.config['paths']['overlay_image']
         self.output_folder = self.config['paths']['output_folder']
         self.check_interval = self.config['camera']['check_interval_seconds']
+        self.full_rescan_seconds = self.config['camera'].get('full_rescan_seconds', 60)
         self.processed_files_db = self.config['monitoring']['processed_files_db']
 
         # AI 설정
@@ -150,6 +157,7 @@ class PhotoProcessorGUI:
 
         modes = [
             ("하이브리드 (AI 우선, 오프라인 시 오버레이)", "hybrid"),
+            ("프로그레시브 (오버레이 즉시, AI 완료 시 교체)", "progressive"),
             ("AI 전용 (인터넷 필수)", "ai"),
             ("오버레이 전용 (오프라인 가능)", "overlay")
         ]
@@ -195,6 +203,10 @@ class PhotoProcessorGUI:
         self.errors_label = ttk.Label(stats_grid, text="0", font=("Helvetica", 12, "bold"), foreground="red")
         self.errors_label.grid(row=0, column=7, padx=5)
 
+        # 파이프라인 단계별 대기열 (대기/처리 중)
+        self.pipeline_label = ttk.Label(stats_frame, text="대기열: -", font=("Helvetica", 10))
+        self.pipeline_label.pack(pady=(5, 0))
+
         # 컨트롤 프레임
         control_frame = ttk.Frame(parent, padding="10")
         control_frame.pack(fill=tk.X)
@@ -478,6 +490,15 @@ class PhotoProcessorGUI:
         self.overlay_processed_label.config(text=str(self.stats['overlay_processed']))
         self.errors_label.config(text=str(self.stats['errors']))
 
+    def update_pipeline_status(self):
+        """파이프라인 대기열 표시 (0.5초마다)"""
+        pipeline = self.pipeline
+        self.pipeline_label.config(text=f"대기열: {pipeline.status_text()}" if pipeline else "대기열: -")
+        if self.is_monitoring:
+            self.pipeline_update_job = self.root.after(500, self.update_pipeline_status)
+        else:
+            self.pipeline_update_job = None
+
     def clear_log(self):
         """로그 지우기"""
         self.log_text.delete(1.0, tk.END)
@@ -502,6 +523,7 @@ class PhotoProcessorGUI:
 
         # 상태 자동 업데이트 시작
         self.schedule_status_update()
+        self.update_pipeline_status()
 
     def stop_monitoring(self):
         """모니터링 종료"""
@@ -515,6 +537,9 @@ class PhotoProcessorGUI:
 
         # 상태 업데이트 타이머 취소
         self.cancel_status_update()
+        if self.pipeline_update_job:
+            self.root.after_cancel(self.pipeline_update_job)
+            self.pipeline_update_job = None
 
         self.log("=" * 50)
         self.log("모니터링 종료")
@@ -522,10 +547,8 @@ class PhotoProcessorGUI:
 
     def monitoring_loop(self):
         """모니터링 루프 (백그라운드)"""
-        import time
-
         # 처리된 파일 목록 로드
-        processed_files = self.load_processed_files()
+        processed_files = ProcessedDB(self.processed_files_db)
 
         # 최신 설정 로드
         self.load_config()
@@ -538,8 +561,8 @@ class PhotoProcessorGUI:
         self.log(f"  AI 상태: {status['ai_reason']}")
         self.log(f"  오버레이 상태: {'준비됨' if status['overlay_available'] else '미설정'}")
 
-        # 카메라 연결 (한 번만)
-        camera = CameraConnection()
+        # 파이프라인: 감지 → 다운로드 → 변환 → 게시 (단계별 대기열)
+        camera = CameraConnection(full_rescan_seconds=self.full_rescan_seconds)
         if not camera.connect():
             self.log("❌ 카메라 연결 실패")
             self.root.after(0, self.stop_monitoring)
@@ -547,98 +570,66 @@ class PhotoProcessorGUI:
 
         self.log(f"✅ 카메라 연결 유지: {camera.camera_name}")
 
-        while self.is_monitoring:
-            new_files = []
+        def on_download(job):
+            self.stats['downloaded'] += 1
+            self.log(f"  ✅ {job['file_info']['name']} 다운로드 완료 ({pipeline.mode})")
+            self.root.after(0, self.update_stats)
 
-            try:
-                self.log(f"🔍 카메라 스캔 중... ({self.check_interval}초 간격)")
-                
-                # 연결 상태 확인
-                if not camera.is_connected:
-                    self.log("⚠️ 카메라 연결 끊김, 재연결 시도...")
-                    if not camera.connect():
-                        self.log("❌ 재연결 실패")
-                        time.sleep(self.check_interval)
-                        continue
-
-                # 새 파일 확인 및 다운로드
-                all_files = camera.get_all_files()
-                self.log(f"  📁 카메라 파일 수: {len(all_files)}개")
-                
-                # 파일이 0개면 연결 문제일 수 있음 - 재연결 시도
-                if len(all_files) == 0 and camera.is_connected:
-                    self.log("⚠️ 파일 0개 - 연결 확인 중...")
-                    camera.is_connected = False
-                    if camera.connect():
-                        self.log("✅ 재연결 성공")
-                        all_files = camera.get_all_files()
-                        self.log(f"  📁 재스캔 파일 수: {len(all_files)}개")
-                    else:
-                        self.log("❌ 재연결 실패")
-                        time.sleep(self.check_interval)
-                        continue
-
-                for file_info in all_files:
-                    if file_info['full_path'] in processed_files:
-                        continue
-
-                    if camera.download_file(file_info, self.original_folder):
-                        new_files.append(file_info['name'])
-                        processed_files.add(file_info['full_path'])
-                        self.stats['downloaded'] += 1
-                        self.log(f"  ✅ {file_info['name']} 다운로드 완료")
-
-                # 이미지 처리 (하이브리드)
-                if new_files:
-                    self.log(f"✅ 새 파일 {len(new_files)}개 발견!")
-
-                    for filename in new_files:
-                        input_path = os.path.join(self.original_folder, filename)
-                        output_path = os.path.join(self.output_folder, filename)
-
-                        success, method, msg = processor.process_image(input_path, output_path)
-
-                        if success:
-                            if method == 'ai':
-                                self.stats['ai_processed'] += 1
-                                self.log(f"  🤖 {filename} AI 변환 완료")
-                            else:
-                                self.stats['overlay_processed'] += 1
-                                self.log(f"  🖼️ {filename} 오버레이 합성 ({msg})")
-                            # 미리보기 업데이트 (메인 스레드에서)
-                            self.root.after(0, lambda p=output_path, m=method: self.update_preview(p, m))
-                        else:
-                            self.stats['errors'] += 1
-                            self.log(f"  ❌ {filename} 처리 실패: {msg}")
-
-                    self.root.after(0, self.update_stats)
-                    self.save_processed_files(processed_files)
+        def on_publish(job):
+            filename = job['file_info']['name']
+            processed_files.record_job(job['file_info']['full_path'], job)
 
-            except Exception as e:
-                self.log(f"❌ 오류: {e}")
+            if job['upgrade']:
+                # 프로그레시브 모드: 오버레이 → AI 결과 교체
+                if job['success']:
+                    # 이전 실행에서 재개한 교체는 이번 오버레이 수에 없음
+                    self.stats['overlay_processed'] = max(self.stats['overlay_processed'] - 1, 0)
+                    self.stats['ai_processed'] += 1
+                    self.log(f"  🤖 {filename} AI 결과로 교체")
+                    self.root.after(0, lambda p=job['output_path']: self.update_preview(p, 'ai'))
+                else:
+                    self.log(f"  ⚠️ {filename} AI 교체 실패, 오버레이 유지: {job['message']}")
+            elif job['success']:
+                if job['method'] == 'ai':
+                    self.stats['ai_processed'] += 1
+                    self.log(f"  🤖 {filename} AI 변환 완료")
+                else:
+                    self.stats['overlay_processed'] += 1
+                    self.log(f"  🖼️ {filename} 오버레이 합성 ({job['message']})")
+                # 미리보기 업데이트 (메인 스레드에서)
+                self.root.after(0, lambda p=job['output_path'], m=job['method']: self.update_preview(p, m))
+            else:
                 self.stats['errors'] += 1
-                self.root.after(0, self.update_stats)
-                # 오류 시 연결 상태 리셋
-                camera.is_connected = False
+                self.log(f"  ❌ {filename} 처리 실패: {job['message']}")
+
+            self.root.after(0, self.update_stats)
+
+        pipeline = Pipeline(
+            camera, processor, self.original_folder, self.output_folder,
+            on_publish=on_publish,
+            on_download=on_download,
+            is_processed=lambda file_info: file_info['full_path'] in processed_files,
+            poll_interval=self.check_interval,
+            log=self.log,
+            **pipeline_options(self.config)
+        )
+        pipeline.start()
+        self.pipeline = pipeline
+        self.log(f"🧵 워커: 다운로드 {pipeline.workers['download']}, 변환 {pipeline.workers['transform']}")
 
-            # 대기
-            time.sleep(self.check_interval)
+        # 이전 실행에서 AI 교체를 기다리던 파일 (프로그레시브 모드)
+        resumed = pipeline.resume_upgrades(processed_files.pending_upgrades())
+        if resumed:
+            self.log(f"🔁 AI 교체 대기 {resumed}건 다시 제출")
+        self.log("🔍 촬영 대기 중... (새 사진 이벤트 감지)")
 
-        # 모니터링 종료 시 연결 해제
-        camera.disconnect()
-        self.log("📴 카메라 연결 해제")
+        while self.is_monitoring:
+            time.sleep(0.5)
 
-    def load_processed_files(self):
-        """처리된 파일 목록 로드"""
-        if os.path.exists(self.processed_files_db):
-            with open(self.processed_files_db, 'r') as f:
-                return set(json.load(f))
-        return set()
-
-    def save_processed_files(self, processed_files):
-        """처리된 파일 목록 저장"""
-        with open(self.processed_files_db, 'w') as f:
-            json.dump(list(processed_files), f, indent=2)
+        # 모니터링 종료 시 파이프라인 중지 및 연결 해제
+        self.pipeline = None
+        pipeline.stop()
+        self.log("📴 카메라 연결 해제")
 
     def browse_folder(self, var, config_key):
         """폴더 선택 다이얼로그"""
@@ -5,15 +5,24 @@ AI 이미지 변환 모듈 (Gemini 2.5 Flash Image)
 - 온라인: AI 변환
 - 오프라인: 오버레이 합성 폴백
 
+프로그레시브 모드: 오버레이를 즉시 저장하고, AI 결과가 오면 원자적으로 교체
+
 requests 기반 직접 API 호출 (google-genai SDK 미사용)
 - pydantic 의존성 제거
 - macOS 버전 호환성 문제 해결
+
+동시 실행: AITransformPool이 여러 이미지의 AI 요청을 동시에 보냅니다
+(동시 요청 수 / 요청 속도 제한, 재시도, 이미지별 마감)
 """
 
 import os
+import queue
 import socket
 import base64
 import json
+import threading
+import time
+from concurrent.futures import Future
 from typing import Optional, Tuple
 
 import requests
@@ -30,6 +39,31 @@ def check_internet(host: str = "8.8.8.8", port: int = 53, timeout: float = 3.0)
         return False
 
 
+def is_transient_error(error: Exception) -> bool:
+    """
+    재시도할 만한 일시적 오류인지 판별
+
+    - API 오류 (HTTP 상태 코드 code): 요청 한도(429), 서버 오류(5xx)만
+    - 네트워크 오류: 연결 실패, 시간 초과, DNS, SDK 전송 오류(httpx)
+    입력 파일 없음, 이미지 디코딩 실패, API 키/설정 오류 등은 다시 보내도
+    같은 결과이므로 재시도하지 않습니다.
+    """
+    code = getattr(error, 'code', None)
+    if isinstance(code, int):
+        return code == 429 or code >= 500
+
+    network = [
+        ConnectionError, TimeoutError, socket.gaierror,
+        requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+    ]
+    try:
+        import httpx  # google-genai의 전송 계층
+        network.append(httpx.TransportError)
+    except ImportError:
+        pass
+    return isinstance(error, tuple(network))
+
+
 class AITransformer:
     """AI 이미지 변환 클래스 (Gemini SDK 방식)"""
 
@@ -92,10 +126,22 @@ class AITransformer:
         Returns:
             (성공 여부, 결과 메시지)
         """
+        success, message, _ = self.try_transform(input_path, output_path)
+        return success, message
+
+    def try_transform(self, input_path: str, output_path: str) -> Tuple[bool, str, bool]:
+        """
+        AI 변환 1회 시도
+
+        Returns:
+            (성공 여부, 결과 메시지, 재시도 가능 여부)
+            재시도 가능: 요청 한도(429), 서버 오류(5xx), 네트워크 오류, 이미지 없는 응답
+            (is_transient_error), 그 외 오류는 즉시 실패
+        """
         # 사전 검증
         available, reason = self.is_available()
         if not available:
-            return False, f"AI 변환 불가: {reason}"
+            return False, f"AI 변환 불가: {reason}", False
 
         try:
             from google import genai
@@ -128,14 +174,14 @@ class AITransformer:
                     with open(output_path, "wb") as f:
                         f.write(image_data)
 
-                    return True, "AI 변환 완료"
+                    return True, "AI 변환 완료", False
 
-            return False, "API 응답에 이미지 없음"
+            return False, "API 응답에 이미지 없음", True
 
         except ImportError:
-            return False, "google-genai 패키지 미설치"
+            return False, "google-genai 패키지 미설치", False
         except Exception as e:
-            return False, f"AI 변환 실패: {str(e)}"
+            return False, f"AI 변환 실패: {str(e)}", is_transient_error(e)
 
     def update_prompt(self, new_prompt: str):
         """프롬프트 업데이트"""
@@ -153,6 +199,154 @@ class AITransformer:
                 print(f"⚠️ API 키 업데이트 실패: {e}")
 
 
+class TokenBucket:
+    """
+    토큰 버킷 요청 속도 제한기
+
+    초당 rate개씩 토큰이 채워져 최대 capacity개까지 쌓입니다.
+    쌓인 만큼은 연속 요청(버스트)이 가능하고, 그 뒤로는 rate 속도로 제한됩니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """토큰 1개 획득 (없으면 대기). deadline(monotonic)까지 얻지 못하면 False"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class _AIJob:
+    """AI 변환 작업 1건 (API 결과와 마감 중 먼저 온 쪽이 결과 확정)"""
+
+    def __init__(self, input_path: str, output_path: str, deadline: float):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.temp_path = f"{output_path}.ai.part"
+        self.deadline = deadline
+        self.future = Future()
+        self.settled = False
+        self.lock = threading.Lock()
+
+    def settle(self, success: bool, message: str, from_api: bool = False) -> bool:
+        """
+        결과 확정 (이미 확정됐으면 False)
+
+        API 결과는 확정되는 순간 임시 파일을 출력 경로로 원자적 교체합니다.
+        마감 뒤에 도착한 결과는 버립니다.
+        """
+        with self.lock:
+            if self.settled:
+                if from_api and os.path.exists(self.temp_path):
+                    os.remove(self.temp_path)
+                return False
+            self.settled = True
+            if from_api and success:
+                os.replace(self.temp_path, self.output_path)
+        self.future.set_result((success, message))
+        return True
+
+
+class AITransformPool:
+    """
+    AI 변환 동시 실행기
+
+    - 동시 요청 수 제한: max_in_flight (가득 차면 submit이 자리가 날 때까지 대기)
+    - 요청 속도 제한: 토큰 버킷 (requests_per_minute, burst)
+    - 일시적 오류는 지수 백오프로 재시도 (backoff_seconds × 2^n, 최대 max_retries회)
+    - 이미지별 마감 (deadline_seconds, 기본 timeout_seconds): 지나면 실패로 확정하고
+      늦게 도착한 API 결과는 버립니다 (HybridProcessor가 오버레이로 폴백)
+    """
+
+    MAX_IN_FLIGHT = 10  # 동시 AI 요청 수 기본값
+    REQUESTS_PER_MINUTE = 60  # 분당 요청 수 기본값
+    BURST = 10  # 연속 요청 허용 수 기본값
+    MAX_RETRIES = 3  # 재시도 횟수 기본값
+    BACKOFF_SECONDS = 2.0  # 첫 재시도 대기 (초)
+
+    def __init__(self, transformer: AITransformer, config: dict):
+        """
+        Args:
+            transformer: AI 변환기
+            config: AI 설정 딕셔너리 (max_in_flight, requests_per_minute, burst,
+                    max_retries, backoff_seconds, deadline_seconds)
+        """
+        self.transformer = transformer
+        self.max_in_flight = config.get('max_in_flight', self.MAX_IN_FLIGHT)
+        self.max_retries = config.get('max_retries', self.MAX_RETRIES)
+        self.backoff_seconds = config.get('backoff_seconds', self.BACKOFF_SECONDS)
+        self.deadline_seconds = config.get('deadline_seconds', transformer.timeout)
+        self.bucket = TokenBucket(
+            config.get('requests_per_minute', self.REQUESTS_PER_MINUTE) / 60.0,
+            config.get('burst', self.BURST)
+        )
+        self.slots = threading.BoundedSemaphore(self.max_in_flight)
+
+    def submit(self, input_path: str, output_path: str) -> Future:
+        """
+        AI 변환 제출 (동시 요청 수가 가득 차면 대기)
+
+        Returns:
+            Future → (성공 여부, 결과 메시지)
+        """
+        self.slots.acquire()
+        job = _AIJob(input_path, output_path, time.monotonic() + self.deadline_seconds)
+
+        timer = threading.Timer(
+            self.deadline_seconds,
+            lambda: job.settle(False, f"AI 변환 마감 초과 ({self.deadline_seconds:.0f}초)")
+        )
+        timer.daemon = True
+        timer.start()
+
+        def run():
+            try:
+                success, message = self._transform(job)
+                job.settle(success, message, from_api=True)
+            except Exception as e:
+                job.settle(False, f"AI 변환 실패: {e}")
+            finally:
+                timer.cancel()
+                self.slots.release()
+
+        threading.Thread(target=run, name='ai-transform', daemon=True).start()
+        return job.future
+
+    def _transform(self, job: _AIJob) -> Tuple[bool, str]:
+        """속도 제한 + 재시도 (마감 또는 확정 시 중단)"""
+        attempt = 0
+        while True:
+            if not self.bucket.acquire(job.deadline):
+                return False, "AI 요청 한도 대기 중 마감"
+
+            success, message, retryable = self.transformer.try_transform(job.input_path, job.temp_path)
+            if success or not retryable or attempt >= self.max_retries or job.settled:
+                return success, message
+
+            delay = self.backoff_seconds * 2 ** attempt
+            if time.monotonic() + delay >= job.deadline:
+                return False, message
+
+            attempt += 1
+            print(f"⚠️ {message} - {delay:g}초 후 재시도 ({attempt}/{self.max_retries})")
+            time.sleep(delay)
+
+
 class HybridProcessor:
     """하이브리드 이미지 처리기 (AI + 오버레이 폴백)"""
 
@@ -163,8 +357,12 @@ class HybridProcessor:
         """
         self.config = config
         self.ai_transformer = None
+        self.ai_pool = None
         self.image_processor = None
-        self.mode = config.get('processing', {}).get('mode', 'hybrid')  # ai, overlay, hybrid
+        self.mode = config.get('processing', {}).get('mode', 'hybrid')  # ai, overlay, hybrid, progressive
+        # 프로그레시브 AI 교체 대기열 (첫 교체 예약 때 제출 스레드와 함께 생성)
+        self._upgrades = None
+        self._upgrade_lock = threading.Lock()
 
         self._init_processors()
 
@@ -174,6 +372,7 @@ class HybridProcessor:
         ai_config = self.config.get('ai', {})
         if ai_config.get('api_key'):
             self.ai_transformer = AITransformer(ai_config)
+            self.ai_pool = AITransformPool(self.ai_transformer, ai_config)
 
         # 오버레이 프로세서 초기화 (폴백용)
         from utils.image_processor import ImageProcessor
@@ -183,7 +382,9 @@ class HybridProcessor:
 
     def process_image(self, input_path: str, output_path: str) -> Tuple[bool, str, str]:
         """
-        이미지 처리 (하이브리드)
+        이미지 처리 (하이브리드, 완료까지 대기)
+
+        프로그레시브 모드도 AI 교체까지 기다려 최종 결과를 반환합니다.
 
         Args:
             input_path: 입력 이미지 경로
@@ -192,13 +393,145 @@ class HybridProcessor:
         Returns:
             (성공 여부, 사용된 방식, 결과 메시지)
         """
+        if not self._progressive_ready():
+            return self.submit_image(input_path, output_path).result()
+
+        first, upgrade = self._submit_progressive(input_path, output_path)
+        if upgrade is None:
+            return first.result()
+        success, method, msg = upgrade.result()
+        return (success, method, msg) if success else (True, 'overlay', msg)
+
+    def submit_image(self, input_path: str, output_path: str, on_upgrade=None) -> Future:
+        """
+        이미지 처리 제출 (AI는 동시 실행기에서 진행, 여러 장이 동시에 변환됨)
+
+        AI 동시 요청 수가 가득 차면 자리가 날 때까지 대기합니다.
+        오버레이 전용 / AI 미설정이면 바로 처리합니다.
+
+        프로그레시브 모드에서는 오버레이를 즉시 저장해 방식 'preview'로 결과를
+        확정하고, AI 결과가 오면 on_upgrade((성공 여부, 'ai', 메시지))를 호출합니다
+        (성공 시 출력 파일은 이미 AI 결과로 교체된 상태, 실패 시 오버레이 유지).
+
+        Returns:
+            Future → (성공 여부, 사용된 방식, 결과 메시지)
+        """
+        if self._progressive_ready():
+            first, upgrade = self._submit_progressive(input_path, output_path)
+            if upgrade is not None and on_upgrade:
+                upgrade.add_done_callback(lambda f: on_upgrade(f.result()))
+            return first
+
+        result = Future()
+
+        if self.mode == 'overlay' or not self.ai_pool:
+            result.set_result(self._process_without_ai(input_path, output_path))
+            return result
+
+        def on_ai_done(ai_future: Future):
+            try:
+                result.set_result(self._after_ai(ai_future.result(), input_path, output_path))
+            except Exception as e:
+                result.set_result((False, 'none', str(e)))
+
+        self.ai_pool.submit(input_path, output_path).add_done_callback(on_ai_done)
+        return result
+
+    def _progressive_ready(self) -> bool:
+        """프로그레시브 처리 가능 여부 (AI와 오버레이 모두 필요, 아니면 하이브리드로 동작)"""
+        return self.mode == 'progressive' and self.ai_pool is not None and self.image_processor is not None
+
+    def _submit_progressive(self, input_path: str, output_path: str) -> Tuple[Future, Optional[Future]]:
+        """
+        오버레이 즉시 저장 + AI 교체 예약
+
+        Returns:
+            (첫 결과 Future, AI 교체 Future 또는 None)
+            오버레이 합성에 실패하면 하이브리드처럼 AI 결과를 기다립니다 (교체 없음).
+        """
+        first = Future()
+        if not self._composite_atomic(input_path, output_path):
+            print("⚠️ 오버레이 합성 실패, AI 결과 대기...")
+
+            def on_ai_only(ai_future: Future):
+                success, msg = ai_future.result()
+                first.set_result((success, 'ai', msg))
+
+            self.ai_pool.submit(input_path, output_path).add_done_callback(on_ai_only)
+            return first, None
+
+        first.set_result((True, 'preview', "오버레이 먼저 저장 (AI 변환 대기 중)"))
+        return first, self._queue_upgrade(input_path, output_path)
+
+    def can_upgrade(self) -> bool:
+        """AI 교체 가능 여부 (프로그레시브 모드 + AI + 오버레이)"""
+        return self._progressive_ready()
+
+    def submit_upgrade(self, input_path: str, output_path: str) -> Future:
+        """
+        AI 교체만 예약 (이전 실행에서 끝나지 않은 프로그레시브 작업 재개용, can_upgrade일 때)
+
+        출력 경로에는 이미 오버레이가 저장되어 있다고 봅니다.
+
+        Returns:
+            Future → (성공 여부, 'ai', 결과 메시지)
+        """
+        return self._queue_upgrade(input_path, output_path)
+
+    def _queue_upgrade(self, input_path: str, output_path: str) -> Future:
+        """
+        AI 교체 예약 (오버레이 게시는 기다리지 않음)
+
+        제출 스레드 하나가 예약 순서(촬영 순서)대로 AI 실행기에 제출합니다.
+        동시 요청 수가 가득 차면 대기열에서 기다리므로 스레드가 늘지 않습니다.
+        """
+        upgrade = Future()
+        with self._upgrade_lock:
+            if self._upgrades is None:
+                self._upgrades = queue.Queue()
+                threading.Thread(target=self._submit_upgrades, name='ai-upgrade', daemon=True).start()
+            self._upgrades.put((input_path, output_path, upgrade))
+        return upgrade
+
+    def _submit_upgrades(self):
+        """AI 교체 제출 스레드 (대기열 순서대로, 실행기에 자리가 나면 다음 제출)"""
+        while True:
+            input_path, output_path, upgrade = self._upgrades.get()
+
+            def on_ai_done(ai_future: Future, upgrade=upgrade):
+                success, msg = ai_future.result()
+                upgrade.set_result((success, 'ai', msg if success else f"오버레이 유지 ({msg})"))
+
+            try:
+                self.ai_pool.submit(input_path, output_path).add_done_callback(on_ai_done)
+            except Exception as e:
+                upgrade.set_result((False, 'ai', f"오버레이 유지 ({e})"))
+
+    def _composite_atomic(self, input_path: str, output_path: str) -> bool:
+        """오버레이 합성을 임시 파일에 저장 후 출력 경로로 원자적 교체"""
+        temp_path = f"{output_path}.overlay.part"
+        if not self.image_processor.composite_image(input_path, temp_path):
+            return False
+        os.replace(temp_path, output_path)
+        return True
+
+    def _after_ai(self, ai_result: Tuple[bool, str], input_path: str, output_path: str) -> Tuple[bool, str, str]:
+        """AI 결과 처리 (하이브리드 모드는 실패/마감 시 오버레이 폴백)"""
+        success, msg = ai_result
+        if success:
+            return True, 'ai', msg
+        if self.mode == 'ai':
+            return False, 'ai', msg
+
+        # AI 실패 시 폴백
+        print(f"⚠️ AI 변환 실패 ({msg}), 오버레이 폴백 시도...")
+        return self._overlay_fallback(input_path, output_path)
+
+    def _process_without_ai(self, input_path: str, output_path: str) -> Tuple[bool, str, str]:
+        """오버레이 전용 모드 / AI 변환기 미설정 시 처리"""
         # AI 전용 모드
         if self.mode == 'ai':
-            if self.ai_transformer:
-                success, msg = self.ai_transformer.transform_image(input_path, output_path)
-                return success, 'ai', msg
-            else:
-                return False, 'ai', "AI 변환기 미설정"
+            return False, 'ai', "AI 변환기 미설정"
 
         # 오버레이 전용 모드
         if self.mode == 'overlay':
@@ -208,16 +541,10 @@ class HybridProcessor:
             else:
                 return False, 'overlay', "오버레이 프로세서 미설정"
 
-        # 하이브리드 모드: AI 우선, 실패 시 오버레이 폴백
-        if self.ai_transformer:
-            success, msg = self.ai_transformer.transform_image(input_path, output_path)
-            if success:
-                return True, 'ai', msg
-
-            # AI 실패 시 폴백
-            print(f"⚠️ AI 변환 실패 ({msg}), 오버레이 폴백 시도...")
+        return self._overlay_fallback(input_path, output_path)
 
-        # 오버레이 폴백
+    def _overlay_fallback(self, input_path: str, output_path: str) -> Tuple[bool, str, str]:
+        """오버레이 폴백"""
         if self.image_processor:
             success = self.image_processor.composite_image(input_path, output_path)
             if success:
@@ -247,6 +574,6 @@ class HybridProcessor:
         return status
 
     def set_mode(self, mode: str):
-        """처리 모드 설정 (ai, overlay, hybrid)"""
-        if mode in ('ai', 'overlay', 'hybrid'):
+        """처리 모드 설정 (ai, overlay, hybrid, progressive)"""
+        if mode in ('ai', 'overlay', 'hybrid', 'progressive'):
             self.mode = mode
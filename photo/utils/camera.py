@@ -2,8 +2,11 @@
 Canon 100D 카메라 연결 및 파일 관리 모듈
 """
 
+import functools
 import os
+import queue
 import subprocess
+import threading
 import time
 import gphoto2 as gp
 from typing import List, Dict, Optional
@@ -17,15 +20,40 @@ def kill_camera_processes():
     subprocess.run(['pkill', '-9', '-f', 'cameracaptured'], stderr=subprocess.DEVNULL)
 
 
+def _locked(method):
+    """카메라 접근 직렬화 (스캔/다운로드 단계가 서로 다른 스레드에서 호출)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class CameraConnection:
-    """Canon 카메라 연결 및 파일 관리 클래스"""
+    """
+    Canon 카메라 연결 및 파일 관리 클래스
+
+    gphoto2 카메라 객체는 동시 호출을 지원하지 않으므로 카메라를 건드리는
+    메서드는 self.lock으로 직렬화됩니다 (여러 스레드에서 호출 가능).
+    """
 
     TARGET_CAMERA = "Canon EOS 100D"  # 연결할 카메라 모델명
+    FULL_RESCAN_SECONDS = 60  # 전체 재스캔 주기 기본값 (초)
 
-    def __init__(self):
+    def __init__(self, full_rescan_seconds: float = FULL_RESCAN_SECONDS):
         self.camera = None
         self.is_connected = False
         self.camera_name = "Unknown"
+        self.lock = threading.RLock()
+
+        # 증분 스캔 인덱스 (폴더별 파일 수 / JPG 정보)
+        self.full_rescan_seconds = full_rescan_seconds
+        self.folder_counts: Dict[str, int] = {}
+        self.folder_files: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self.dcim_folders: Dict[str, List[str]] = {}
+        self.newest_folder: Optional[str] = None
+        self.last_full_scan = 0.0
+        self.last_scan_mode = None
 
     def _find_canon_camera(self):
         """Canon EOS 100D 카메라를 찾아서 포트 반환"""
@@ -38,6 +66,7 @@ class CameraConnection:
             pass
         return None, None
 
+    @_locked
     def connect(self) -> bool:
         """카메라 연결 (Canon EOS 100D 명시적 지정, 3회 재시도)"""
         MAX_ATTEMPTS = 3
@@ -70,6 +99,8 @@ class CameraConnection:
 
                 # Canon 카메라인지 확인
                 if "Canon" in self.camera_name:
+                    # 연결이 바뀌었으므로 다음 스캔은 전체 재스캔
+                    self.newest_folder = None
                     print(f"✅ 카메라 연결됨: {self.camera_name}")
                     return True
                 else:
@@ -89,6 +120,7 @@ class CameraConnection:
         print(f"❌ 카메라 연결 실패: {MAX_ATTEMPTS}회 시도 모두 실패")
         return False
 
+    @_locked
     def disconnect(self):
         """카메라 연결 해제"""
         if self.camera and self.is_connected:
@@ -96,6 +128,7 @@ class CameraConnection:
             self.is_connected = False
             print("📴 카메라 연결 해제됨")
 
+    @_locked
     def refresh_connection(self) -> bool:
         """캐시 무효화를 위한 빠른 재연결 (프로세스 kill 없이)"""
         if not self.camera:
@@ -112,13 +145,23 @@ class CameraConnection:
             self.is_connected = False
             return False
 
+    @_locked
     def get_all_files(self) -> List[Dict[str, any]]:
-        """카메라 내 모든 JPG 파일 목록 조회 (매번 새로고침)"""
+        """
+        카메라 내 모든 JPG 파일 목록 조회 (증분 스캔)
+
+        평상시에는 가장 최근 DCIM 폴더 하나만 나열하고 새 파일만 file_get_info로
+        조회합니다. 나머지 폴더는 인덱스에 기억된 목록을 그대로 사용합니다.
+        전체 재스캔 조건:
+        - 첫 스캔 / 재연결 직후
+        - DCIM 폴더 구성 변경 또는 최근 폴더의 파일 수·이름 불일치 (삭제, 카드 교체)
+        - 마지막 전체 스캔 후 full_rescan_seconds 경과
+        """
         if not self.is_connected:
             print("⚠️ 카메라가 연결되지 않았습니다.")
             return []
 
-        # 스캔 전 연결 새로고침으로 캐시 무효화
+        # 스캔 전 연결 새로고침으로 캐시 무효화 (libgphoto2 파일시스템 캐시)
         if not self.refresh_connection():
             print("⚠️ 연결 새로고침 실패, 재연결 시도...")
             # 새로고침 실패 시 전체 재연결 시도
@@ -126,30 +169,83 @@ class CameraConnection:
                 print("❌ 재연결 실패")
                 return []
 
-        files_list = []
+        due = time.time() - self.last_full_scan >= self.full_rescan_seconds
+        if self.newest_folder is None or due or not self._scan_newest_folder():
+            self._scan_all_folders()
+
+        return [info for files in self.folder_files.values() for info in files.values()]
+
+    @staticmethod
+    def _names(camera_list) -> List[str]:
+        """gphoto2 CameraList의 이름 목록"""
+        return [camera_list.get_name(i) for i in range(camera_list.count())]
+
+    def _update_folder(self, path: str, names: List[str]):
+        """폴더 인덱스 갱신 (새 JPG만 file_get_info 조회)"""
+        known = self.folder_files.get(path, {})
+        files = {}
+        for filename in names:
+            if not filename.lower().endswith(('.jpg', '.jpeg')):
+                continue
+            if filename in known:
+                files[filename] = known[filename]
+                continue
+            files[filename] = self.file_entry(path, filename)
+        self.folder_counts[path] = len(names)
+        self.folder_files[path] = files
+
+    def file_entry(self, path: str, filename: str) -> Dict[str, any]:
+        """파일 정보 dict (file_get_info 1회)"""
+        file_info = self.camera.file_get_info(path, filename)
+        return {
+            'path': path,
+            'name': filename,
+            'size': file_info.file.size / (1024 * 1024),
+            'full_path': f"{path}/{filename}"
+        }
+
+    @_locked
+    def wait_for_file(self, timeout_ms: int) -> Optional[Dict[str, any]]:
+        """
+        카메라 이벤트를 기다려 새로 촬영된 JPG 정보 반환
+
+        GP_EVENT_FILE_ADDED가 오면 즉시 반환하고 인덱스에도 추가합니다.
+        그 외 이벤트나 timeout_ms 경과 시 None.
+
+        Raises:
+            gp.GPhoto2Error: 이벤트 미지원 (GP_ERROR_NOT_SUPPORTED) 또는 연결 오류
+        """
+        event_type, event_data = self.camera.wait_for_event(timeout_ms)
+        if event_type != gp.GP_EVENT_FILE_ADDED:
+            return None
+        if not event_data.name.lower().endswith(('.jpg', '.jpeg')):
+            return None
+
+        path = event_data.folder
+        entry = self.file_entry(path, event_data.name)
+        if path in self.folder_files:
+            self.folder_files[path][event_data.name] = entry
+            self.folder_counts[path] = self.folder_counts.get(path, 0) + 1
+        return entry
+
+    def _scan_all_folders(self):
+        """루트부터 전체 탐색 (인덱스 재구성)"""
+        self.folder_counts = {}
+        previous = self.folder_files
+        self.folder_files = {}
+        self.dcim_folders = {}
 
         def scan_folder(path: str):
             """재귀적으로 폴더 스캔"""
             try:
-                # 폴더 목록 가져오기
-                folder_list = self.camera.folder_list_folders(path)
-                folders = [folder_list.get_name(i) for i in range(folder_list.count())]
-
-                # 파일 목록 가져오기
-                file_list = self.camera.folder_list_files(path)
-                files = [file_list.get_name(i) for i in range(file_list.count())]
-
-                # JPG 파일 수집
-                for filename in files:
-                    if filename.lower().endswith(('.jpg', '.jpeg')):
-                        file_info = self.camera.file_get_info(path, filename)
-                        size_mb = file_info.file.size / (1024 * 1024)
-                        files_list.append({
-                            'path': path,
-                            'name': filename,
-                            'size': size_mb,
-                            'full_path': f"{path}/{filename}"
-                        })
+                folders = self._names(self.camera.folder_list_folders(path))
+                files = self._names(self.camera.folder_list_files(path))
+                # 이름이 같은 파일은 이전 조회 결과 재사용
+                self.folder_files[path] = previous.get(path, {})
+                self._update_folder(path, files)
+
+                if path.rsplit('/', 1)[-1] == 'DCIM':
+                    self.dcim_folders[path] = sorted(folders)
 
                 # 하위 폴더 재귀 탐색
                 for folder_name in folders:
@@ -159,10 +255,44 @@ class CameraConnection:
             except gp.GPhoto2Error:
                 pass
 
-        # 루트부터 전체 탐색
         scan_folder("/")
-        return files_list
 
+        # 가장 최근 DCIM 폴더 (100CANON, 101CANON, ... 중 마지막)
+        newest = [
+            f"{dcim}/{folders[-1]}" for dcim, folders in self.dcim_folders.items() if folders
+        ]
+        self.newest_folder = max(newest, key=lambda p: p.rsplit('/', 1)[-1]) if newest else None
+        self.last_full_scan = time.time()
+        self.last_scan_mode = 'full'
+
+    def _scan_newest_folder(self) -> bool:
+        """
+        최근 DCIM 폴더만 스캔
+
+        Returns:
+            bool: 인덱스와 일치하면 True, 전체 재스캔이 필요하면 False
+        """
+        try:
+            # 폴더 구성 확인 (새 폴더 생성 감지)
+            for dcim, known_folders in self.dcim_folders.items():
+                folders = self._names(self.camera.folder_list_folders(dcim))
+                if sorted(folders) != known_folders:
+                    return False
+
+            files = self._names(self.camera.folder_list_files(self.newest_folder))
+            known = self.folder_files.get(self.newest_folder, {})
+            # 파일이 줄었거나 기억한 이름이 사라졌으면 불일치 (삭제, 카드 교체)
+            if len(files) < self.folder_counts.get(self.newest_folder, 0) or not set(known) <= set(files):
+                return False
+
+            self._update_folder(self.newest_folder, files)
+        except gp.GPhoto2Error:
+            return False
+
+        self.last_scan_mode = 'incremental'
+        return True
+
+    @_locked
     def download_file(self, file_info: Dict[str, any], output_folder: str) -> bool:
         """특정 파일 다운로드"""
         if not self.is_connected:
@@ -216,3 +346,114 @@ class CameraConnection:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
         self.disconnect()
+
+
+class CameraWatcher:
+    """
+    새 사진 감시 스레드 (이벤트 기반, 폴링 대체) - 파이프라인의 스캔 단계
+
+    wait_for_event의 GP_EVENT_FILE_ADDED로 방금 촬영한 파일을 감지해
+    queue에 file_info를 넣습니다 (다운로드는 다음 단계가 담당).
+    연결/재연결 직후에는 한 번 전체 목록을 확인해 놓친 파일을 따라잡고,
+    카메라가 이벤트를 지원하지 않으면 poll_interval 간격 폴링으로 동작합니다.
+
+    queue에 아직 다운로드되지 않은 파일이 있으면 이벤트 대기를 잠시 쉬어
+    다운로드 단계가 카메라 잠금을 먼저 얻도록 양보합니다.
+    """
+
+    EVENT_TIMEOUT_MS = 200  # wait_for_event 대기 (다운로드 양보 / 중지 확인 주기)
+    YIELD_SECONDS = 0.05  # 다운로드 대기 중 이벤트 대기를 쉬는 간격
+    ERROR_BACKOFF_SECONDS = 1.0  # 오류 후 재시도 대기 (연속 오류마다 2배)
+    MAX_BACKOFF_SECONDS = 30.0  # 재시도 대기 상한
+
+    def __init__(self, camera: CameraConnection, out_queue: Optional[queue.Queue] = None,
+                 is_processed=None, poll_interval: float = 5.0, log=print):
+        self.camera = camera
+        self.queue = out_queue if out_queue is not None else queue.Queue()
+        self.is_processed = is_processed or (lambda file_info: False)
+        self.poll_interval = poll_interval
+        self.log = log
+
+        self.mode = 'event'
+        self._queued = set()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """감시 스레드 시작"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='camera-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """감시 스레드 중지 후 카메라 연결 해제"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.EVENT_TIMEOUT_MS / 1000 + 10)
+            self._thread = None
+        self.camera.disconnect()
+
+    def forget(self, file_info: Dict[str, any]):
+        """다운로드/처리에 실패한 파일을 다음 확인 때 다시 가져오도록 표시 해제"""
+        self._queued.discard(file_info['full_path'])
+
+    def _run(self):
+        """감시 루프 (오류가 나도 스레드는 멈추지 않고 대기 후 재시도)"""
+        catch_up = True
+        backoff = self.ERROR_BACKOFF_SECONDS
+        while not self._stop.is_set():
+            try:
+                if not self.camera.is_connected:
+                    if not self.camera.connect():
+                        self._stop.wait(self.poll_interval)
+                        continue
+                    catch_up = True
+
+                if catch_up or self.mode == 'polling':
+                    # 놓친 파일 확인 (연결 직후 / 폴링 모드)
+                    for file_info in self.camera.get_all_files():
+                        self._push(file_info)
+                    catch_up = False
+                    backoff = self.ERROR_BACKOFF_SECONDS
+                    if self.mode == 'polling':
+                        self._stop.wait(self.poll_interval)
+                    continue
+
+                if self.queue.unfinished_tasks:
+                    # 다운로드 대기 중 - 카메라 잠금 양보
+                    self._stop.wait(self.YIELD_SECONDS)
+                    continue
+
+                file_info = self.camera.wait_for_file(self.EVENT_TIMEOUT_MS)
+                if file_info is not None:
+                    self._push(file_info)
+                backoff = self.ERROR_BACKOFF_SECONDS
+
+            except gp.GPhoto2Error as e:
+                if e.code == gp.GP_ERROR_NOT_SUPPORTED and self.mode == 'event':
+                    self.log("⚠️ 카메라 이벤트 미지원 - 폴링 모드로 전환")
+                    self.mode = 'polling'
+                    continue
+                self.log(f"⚠️ 카메라 오류, {backoff:g}초 후 재연결 시도: {e}")
+                self.camera.is_connected = False
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
+            except Exception as e:
+                # 예상하지 못한 오류로 감시 스레드가 죽으면 새 사진을 더 못 받음
+                self.log(f"❌ 감시 오류, {backoff:g}초 후 재시도: {type(e).__name__}: {e}")
+                catch_up = True
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
+
+    def _push(self, file_info: Dict[str, any]):
+        """새 파일을 queue에 추가 (이미 처리/대기 중이면 건너뜀, 가득 차면 대기)"""
+        if file_info['full_path'] in self._queued or self.is_processed(file_info):
+            return
+
+        self._queued.add(file_info['full_path'])
+        while not self._stop.is_set():
+            try:
+                self.queue.put(file_info, timeout=self.EVENT_TIMEOUT_MS / 1000)
+                return
+            except queue.Full:
+                continue
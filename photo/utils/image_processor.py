@@ -21,6 +21,7 @@ class ImageProcessor:
         # 오버레이 이미지 로드
         if os.path.exists(overlay_path):
             self.overlay_image = Image.open(overlay_path)
+            self.overlay_image.load()  # 변환 워커들이 동시에 copy()하므로 미리 디코딩
             print(f"✅ 오버레이 이미지 로드: {overlay_path}")
         else:
             print(f"⚠️ 오버레이 이미지를 찾을 수 없습니다: {overlay_path}")
@@ -0,0 +1,280 @@
+"""
+촬영 → 다운로드 → 변환 → 게시 단계별 처리 파이프라인
+
+각 단계는 자기 입력 대기열(크기 제한)과 워커 스레드를 가집니다.
+느린 AI 변환(최대 timeout_seconds)이 진행되는 동안에도 다음 사진의 감지와
+다운로드가 계속되고, 대기열이 가득 차면 앞 단계가 기다립니다 (역압).
+CLI와 GUI가 같은 파이프라인을 사용합니다.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+from utils.camera import CameraConnection, CameraWatcher
+
+
+# 단계 순서와 표시 이름 (scan은 CameraWatcher 스레드, 입력 대기열 없음)
+STAGES = ('scan', 'download', 'transform', 'publish')
+STAGE_NAMES = {
+    'scan': '감지',
+    'download': '다운로드',
+    'transform': '변환',
+    'publish': '게시',
+}
+
+
+def pipeline_options(config: dict) -> dict:
+    """설정의 pipeline 항목 → Pipeline 인자 (workers, queue_size)"""
+    section = config.get('pipeline', {})
+    workers = {
+        stage: section[f'{stage}_workers']
+        for stage in Pipeline.WORKERS
+        if f'{stage}_workers' in section
+    }
+    return {'workers': workers, 'queue_size': section.get('queue_size', Pipeline.QUEUE_SIZE)}
+
+
+class Pipeline:
+    """
+    카메라 사진 처리 파이프라인
+
+    - scan: CameraWatcher가 새 파일을 감지해 download 대기열에 file_info 추가
+    - download: 카메라에서 파일을 받아 transform 대기열에 작업 추가
+    - transform: processor.submit_image (AI는 동시 실행기, 여러 장 동시 변환)
+    - publish: on_publish(job) 호출 (처리 목록 저장, 통계, 미리보기)
+
+    작업(job)은 딕셔너리입니다:
+        file_info, input_path, output_path, success, method, message, upgrade
+
+    프로그레시브 모드에서는 한 파일이 두 번 게시됩니다: 오버레이 (method 'preview')
+    후 AI 교체 결과 (upgrade=True).
+
+    scan과 publish는 워커 1개로 고정입니다 (카메라 이벤트는 하나의 스트림이고,
+    처리 목록 저장은 한 스레드에서만 합니다). download 워커는 여러 개여도
+    카메라 잠금으로 직렬화되므로 보통 1개면 충분합니다. transform 워커는 제출만
+    하므로 AI 동시 요청 수는 AITransformPool (ai.max_in_flight)이 정합니다.
+    """
+
+    WORKERS = {'download': 1, 'transform': 2}  # 단계별 워커 수 기본값
+    QUEUE_SIZE = 8  # 단계별 대기열 크기 기본값
+    POLL_SECONDS = 0.2  # 대기열 확인 주기 (중지 요청 확인)
+
+    def __init__(self, camera: CameraConnection, processor, download_dir: str, output_dir: str,
+                 on_publish, on_download=None, is_processed=None, poll_interval: float = 5.0,
+                 workers: Optional[Dict[str, int]] = None, queue_size: int = QUEUE_SIZE, log=print):
+        """
+        Args:
+            camera: 카메라 연결
+            processor: submit_image(input, output) -> Future를 가진 처리기 (HybridProcessor)
+            download_dir: 원본 저장 폴더
+            output_dir: 결과 저장 폴더
+            on_publish: 처리 결과 콜백 (publish 스레드에서 호출)
+            on_download: 다운로드 완료 콜백 (선택, download 스레드에서 호출)
+            is_processed: 이미 처리된 파일 판별 함수 (file_info -> bool)
+            poll_interval: 이벤트 미지원 카메라의 폴링 간격 (초)
+            workers: 단계별 워커 수 ({'download': n, 'transform': n})
+            queue_size: 단계별 대기열 크기
+            log: 로그 함수
+        """
+        self.camera = camera
+        self.processor = processor
+        self.download_dir = download_dir
+        self.output_dir = output_dir
+        self.on_publish = on_publish
+        self.on_download = on_download
+        self.log = log
+
+        self.workers = {'scan': 1, **self.WORKERS, **(workers or {}), 'publish': 1}
+        self.queues = {stage: queue.Queue(maxsize=queue_size) for stage in STAGES[1:]}
+        self.active = {stage: 0 for stage in STAGES[1:]}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+        self.watcher = CameraWatcher(
+            camera, self.queues['download'],
+            is_processed=is_processed,
+            poll_interval=poll_interval,
+            log=log
+        )
+
+    @property
+    def mode(self) -> str:
+        """감지 방식 ('event' / 'polling')"""
+        return self.watcher.mode
+
+    def start(self):
+        """감지 스레드와 단계별 워커 시작"""
+        self._stop.clear()
+        handlers = {
+            'download': self._download,
+            'transform': self._transform,
+            'publish': self._publish,
+        }
+        for stage, handler in handlers.items():
+            for index in range(max(self.workers[stage], 1)):
+                thread = threading.Thread(
+                    target=self._work, args=(stage, handler),
+                    name=f'pipeline-{stage}-{index}', daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        self.watcher.start()
+
+    def stop(self):
+        """
+        파이프라인 중지 후 카메라 연결 해제
+
+        진행 중인 다운로드는 끝까지 기다리고, 진행 중인 변환은 기다리지 않습니다
+        (처리 목록에 없으므로 다음 실행 때 다시 처리됩니다).
+        """
+        self._stop.set()
+        for thread in self._threads:
+            if thread.name.startswith('pipeline-download'):
+                thread.join(timeout=30)
+        self._threads = []
+        self.watcher.stop()
+
+    def forget(self, file_info: Dict[str, any]):
+        """실패한 파일을 다음 확인 때 다시 가져오도록 표시 해제"""
+        self.watcher.forget(file_info)
+
+    def resume_upgrades(self, keys) -> int:
+        """
+        이전 실행에서 AI 교체를 기다리던 파일 다시 제출 (처리 목록의 pending)
+
+        키(파일명 또는 카메라 전체 경로)로 원본/출력 경로를 다시 만들고, 결과는
+        upgrade=True 작업으로 게시됩니다. 원본이나 오버레이 파일이 없으면 교체
+        실패로 게시합니다. 프로그레시브 처리가 불가능하면 pending으로 남겨 둡니다.
+
+        Returns:
+            int: 다시 제출한 파일 수
+        """
+        if not self.processor.can_upgrade():
+            return 0
+
+        resumed = 0
+        for key in keys:
+            name = os.path.basename(key)
+            job = {
+                'file_info': {'name': name, 'full_path': key},
+                'input_path': os.path.join(self.download_dir, name),
+                'output_path': os.path.join(self.output_dir, name),
+                'upgrade': True,
+            }
+            if not (os.path.exists(job['input_path']) and os.path.exists(job['output_path'])):
+                job.update(success=False, method='ai', message="원본 또는 오버레이 파일 없음")
+                self._put('publish', job)
+                continue
+
+            upgrade = self.processor.submit_upgrade(job['input_path'], job['output_path'])
+
+            def on_upgrade(future: Future, job=job):
+                success, method, message = future.result()
+                self._put('publish', dict(job, success=success, method=method, message=message))
+
+            upgrade.add_done_callback(on_upgrade)
+            resumed += 1
+        return resumed
+
+    def depths(self) -> Dict[str, tuple]:
+        """단계별 (대기 수, 처리 중 수)"""
+        with self._lock:
+            return {stage: (self.queues[stage].qsize(), self.active[stage]) for stage in STAGES[1:]}
+
+    def status_text(self) -> str:
+        """단계별 대기열 표시 문자열 (대기/처리 중)"""
+        stages = [f"{STAGE_NAMES['scan']} {self.mode}"] + [
+            f"{STAGE_NAMES[stage]} {waiting}/{busy}"
+            for stage, (waiting, busy) in self.depths().items()
+        ]
+        return " → ".join(stages)
+
+    def _work(self, stage: str, handler):
+        """
+        워커 루프: 입력 대기열에서 꺼내 처리
+
+        handler가 Future를 반환하면 (AI 동시 변환) 완료될 때까지 처리 중으로 셉니다.
+        """
+        source = self.queues[stage]
+        while not self._stop.is_set():
+            try:
+                item = source.get(timeout=self.POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+            with self._lock:
+                self.active[stage] += 1
+            pending = None
+            try:
+                pending = handler(item)
+            except Exception as e:
+                self.log(f"❌ {STAGE_NAMES[stage]} 단계 오류: {e}")
+
+            if pending is None:
+                self._finish(stage)
+            else:
+                pending.add_done_callback(lambda _, stage=stage: self._finish(stage))
+
+    def _finish(self, stage: str):
+        with self._lock:
+            self.active[stage] -= 1
+        self.queues[stage].task_done()
+
+    def _put(self, stage: str, item):
+        """다음 단계 대기열에 추가 (가득 차면 자리가 날 때까지 대기)"""
+        while not self._stop.is_set():
+            try:
+                self.queues[stage].put(item, timeout=self.POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _download(self, file_info: Dict[str, any]):
+        """카메라에서 받아 변환 대기열에 추가 (실패하면 다음 확인 때 다시 가져옴)"""
+        try:
+            if not self.camera.download_file(file_info, self.download_dir):
+                self.forget(file_info)
+                return
+
+            job = {
+                'file_info': file_info,
+                'input_path': os.path.join(self.download_dir, file_info['name']),
+                'output_path': os.path.join(self.output_dir, file_info['name']),
+            }
+            if self.on_download:
+                self.on_download(job)
+        except Exception:
+            # 예외도 실패와 같이 표시 해제 (오류 로그는 _work가 남김)
+            self.forget(file_info)
+            raise
+        self._put('transform', job)
+
+    def _transform(self, job: Dict[str, any]) -> Future:
+        """
+        변환 제출 (AI는 동시 실행기에서 진행, 완료되면 publish 대기열로)
+
+        프로그레시브 모드의 AI 교체 결과는 upgrade=True인 작업으로 한 번 더 게시됩니다.
+        """
+        def on_done(future: Future):
+            try:
+                success, method, message = future.result()
+            except Exception as e:
+                success, method, message = False, 'none', str(e)
+            job.update(success=success, method=method, message=message)
+            self._put('publish', job)
+
+        def on_upgrade(result):
+            success, method, message = result
+            self._put('publish', dict(job, success=success, method=method, message=message, upgrade=True))
+
+        job['upgrade'] = False
+        future = self.processor.submit_image(job['input_path'], job['output_path'], on_upgrade=on_upgrade)
+        future.add_done_callback(on_done)
+        return future
+
+    def _publish(self, job: Dict[str, any]):
+        self.on_publish(job)
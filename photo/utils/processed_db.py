@@ -0,0 +1,84 @@
+"""
+처리된 파일 추적 DB (JSON)
+
+파일별로 게시된 결과를 기록합니다:
+    {"<파일 키>": {"overlay": "<출력 경로>", "ai": "<출력 경로>",
+                   "ai_status": "pending" | "done" | "failed", "updated": "..."}}
+
+프로그레시브 모드는 오버레이 게시 시 ai_status를 pending으로, AI 교체 후
+done(ai 경로 기록) 또는 failed로 갱신합니다. 종료 등으로 pending에 남은 파일은
+다음 카메라 모니터링 시작 때 AI 교체를 다시 제출합니다 (Pipeline.resume_upgrades).
+예전 형식(키 목록)도 읽습니다.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+
+class ProcessedDB:
+    """처리된 파일 추적 DB (키: 파일명 또는 카메라 전체 경로)"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.entries: Dict[str, Dict[str, any]] = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, any]]:
+        """DB 로드 (예전 형식: 처리된 키 목록)"""
+        if not os.path.exists(self.filepath):
+            return {}
+
+        with open(self.filepath, 'r') as f:
+            data = json.load(f)
+
+        if isinstance(data, list):
+            return {key: {} for key in data}
+        return data
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def pending_upgrades(self) -> List[str]:
+        """AI 교체를 기다리던 파일 키 목록 (기록 순서)"""
+        with self._lock:
+            return [key for key, entry in self.entries.items() if entry.get('ai_status') == 'pending']
+
+    def record(self, key: str, **fields):
+        """파일 결과 기록 (기존 항목에 병합) 후 저장"""
+        with self._lock:
+            entry = self.entries.setdefault(key, {})
+            entry.update(fields, updated=datetime.now().isoformat(timespec='seconds'))
+            self._save()
+
+    def record_job(self, key: str, job: Dict[str, any]):
+        """
+        처리 결과 기록 (파이프라인 작업 또는 success/method/output_path 딕셔너리)
+
+        - preview: 오버레이 경로, AI 대기 중
+        - ai / overlay: 해당 방식의 경로
+        - AI 교체(upgrade) 실패: ai_status failed (오버레이 유지)
+        - 그 외 실패: 오류 메시지
+        """
+        path = job['output_path']
+        if not job['success']:
+            fields = {'ai_status': 'failed'} if job.get('upgrade') else {'error': job.get('message', '')}
+        elif job['method'] == 'preview':
+            fields = {'overlay': path, 'ai_status': 'pending'}
+        elif job['method'] == 'ai':
+            fields = {'ai': path, 'ai_status': 'done'}
+        else:
+            fields = {job['method']: path}
+        self.record(key, **fields)
+
+    def _save(self):
+        """임시 파일에 쓴 뒤 원자적 교체 (저장 중 종료되어도 DB 유지)"""
+        temp_path = f"{self.filepath}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.filepath)
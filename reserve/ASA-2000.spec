@@ -42,10 +42,14 @@ a = Analysis(
         'matplotlib.backends.backend_qt5agg',
         'matplotlib.figure',
         'matplotlib.patches',
+        'pyqtgraph_backend',
         'numpy',
         'pydub',
+        'pydub.utils',
+        'pydub.exceptions',
         'audioop',
         'pygame',
+        'pygame.mixer',
         'scipy',
         'scipy.signal',
         'PIL',
@@ -0,0 +1,157 @@
+"""
+Decoded Audio Cache for Reserve Audio Analyzer
+Persistent memory-mapped PCM, envelope and spectrum per source file
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+
+from config import CACHE_DIR, CACHE_MAX_BYTES
+
+
+class DecodedAudioCache:
+    """
+    On-disk cache of decoded audio and analysis results
+
+    Each source file gets one entry directory, keyed by path + mtime + size,
+    holding .npy arrays (opened with mmap_mode='r', so a hit costs a page
+    mapping instead of an ffmpeg decode) and a small JSON of attributes per
+    artifact. Entries are evicted least-recently-used once the cache grows
+    beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key_for(file_path):
+        """Cache key of a source file (changes when the file is modified)"""
+        stat = os.stat(file_path)
+        identity = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key, name):
+        """
+        Load an artifact
+
+        Args:
+            key: entry key from key_for()
+            name: artifact name (e.g. 'pcm', 'envelope', 'spectrogram')
+
+        Returns:
+            tuple: (arrays dict of read-only memmaps, attrs dict), or None
+        """
+        entry = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry, f"{name}.json"), 'r') as f:
+                attrs = json.load(f)
+            arrays = {
+                field: np.load(os.path.join(entry, f"{name}.{field}.npy"), mmap_mode='r')
+                for field in attrs.pop('_fields')
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+
+        self._touch(entry)
+        return arrays, attrs
+
+    def store(self, key, name, arrays, attrs=None):
+        """
+        Store an artifact (arrays first, attributes last, each atomically)
+
+        Args:
+            key: entry key from key_for()
+            name: artifact name
+            arrays: dict of field name -> numpy array, or a callable writing
+                the whole .npy file to a binary file (arrays too large to
+                build in memory first)
+            attrs: JSON-serialisable attributes
+        """
+        entry = self._entry_dir(key)
+        try:
+            os.makedirs(entry, exist_ok=True)
+            for field, array in arrays.items():
+                self._write_atomic(
+                    os.path.join(entry, f"{name}.{field}.npy"),
+                    array if callable(array) else
+                    lambda f, array=array: np.save(f, np.ascontiguousarray(array))
+                )
+            meta = dict(attrs or {}, _fields=list(arrays))
+            self._write_atomic(
+                os.path.join(entry, f"{name}.json"),
+                lambda f: f.write(json.dumps(meta).encode('utf-8'))
+            )
+        except OSError:
+            return  # Cache is best-effort (disk full, read-only volume)
+
+        self.evict(keep=key)
+
+    def get_or_build(self, key, name, build, encode, decode):
+        """
+        Load an artifact or build and store it
+
+        Args:
+            build: callable returning the object on a miss
+            encode: callable(obj) -> (arrays, attrs)
+            decode: callable(arrays, attrs) -> obj
+        """
+        if key is not None:
+            cached = self.load(key, name)
+            if cached is not None:
+                return decode(*cached)
+
+        obj = build()
+        if key is not None and obj is not None:
+            self.store(key, name, *encode(obj))
+        return obj
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        entries = []
+        total = 0
+        for name in names:
+            entry = os.path.join(self.cache_dir, name)
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry)
+                )
+                entries.append((os.path.getmtime(entry), size, name))
+            except OSError:
+                continue  # Not an entry, or removed concurrently
+            total += size
+
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            total -= size
+
+    @staticmethod
+    def _touch(entry):
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _write_atomic(path, write):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
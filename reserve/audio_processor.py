@@ -4,14 +4,37 @@ Handles audio file loading, reversing, and format conversion
 """
 
 import os
+import struct
 import sys
+import subprocess
 import tempfile
-from pydub import AudioSegment
+import threading
+import wave
 import numpy as np
 
+from config import (
+    DECODE_MODE, PIPE_SAMPLE_WIDTH, STRETCH_CHUNK_FRAMES, NORMALIZE_CHUNK_FRAMES, PLANAR_MEMORY_FRAMES
+)
+from time_stretch import PhaseVocoder
+
+
+# pydub sample width (bytes) -> numpy dtype of its raw_data
+SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# Frames per write when streaming a WAV export
+WAV_CHUNK_FRAMES = 1 << 20
+
+
+_ffmpeg_ready = False
+
 
 def _setup_ffmpeg():
-    """Set ffmpeg path for pydub (for bundled macOS app)"""
+    """Set ffmpeg path for pydub (for bundled macOS app), once"""
+    global _ffmpeg_ready
+    if _ffmpeg_ready:
+        return
+    _ffmpeg_ready = True
+
     # Check if running as bundled app (PyInstaller)
     if getattr(sys, 'frozen', False):
         bundle_dir = os.path.dirname(sys.executable)
@@ -32,14 +55,280 @@ def _setup_ffmpeg():
         os.environ["PATH"] = home_bin + ":" + os.environ.get("PATH", "")
 
 
-# Setup ffmpeg on module load
-_setup_ffmpeg()
+def load_pydub():
+    """
+    Import pydub on first use
+
+    Deferred so neither the pydub import nor the PATH setup runs at app
+    startup. ffmpeg must be on PATH first: pydub looks it up at import.
+    """
+    _setup_ffmpeg()
+    import pydub
+    import pydub.exceptions
+    import pydub.utils
+    return pydub
+
+
+def _decode_pcm_pipe(file_path):
+    """
+    Decode a compressed file straight to raw PCM through an ffmpeg pipe
+
+    Returns:
+        tuple: (pcm_bytes, sample_rate, channels, sample_width)
+    """
+    pydub = load_pydub()
+    CouldntDecodeError = pydub.exceptions.CouldntDecodeError
+
+    info = pydub.utils.mediainfo_json(file_path)
+    streams = [s for s in info.get('streams', []) if s.get('codec_type') == 'audio']
+    if not streams:
+        raise CouldntDecodeError(f"No audio stream found in {os.path.basename(file_path)}")
+
+    sample_rate = int(streams[0]['sample_rate'])
+    channels = int(streams[0]['channels'])
+    codec = f"pcm_s{PIPE_SAMPLE_WIDTH * 8}le"
+
+    command = [
+        pydub.utils.get_encoder_name(), '-v', 'error', '-nostdin',
+        '-i', file_path,
+        '-vn', '-sn',
+        '-f', codec[4:], '-acodec', codec,
+        '-ar', str(sample_rate), '-ac', str(channels),
+        '-'
+    ]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise CouldntDecodeError(
+            f"Could not decode {os.path.basename(file_path)}: "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+
+    # Drop a trailing partial frame so the buffer reshapes cleanly
+    frame_width = PIPE_SAMPLE_WIDTH * channels
+    pcm = result.stdout
+    if len(pcm) % frame_width:
+        pcm = pcm[:len(pcm) - len(pcm) % frame_width]
+
+    return pcm, sample_rate, channels, PIPE_SAMPLE_WIDTH
+
+
+def _open_wav_memmap(file_path):
+    """
+    Memory-map the sample data of a PCM WAV file
+
+    Only the RIFF header is read; samples stay on disk and are paged in on
+    access. Returns None for layouts numpy cannot map directly (8/24-bit,
+    float, compressed) and for truncated headers, which then go through
+    pydub.
+
+    Returns:
+        tuple: (samples memmap, sample_rate, sample_width) or None
+    """
+    file_size = os.path.getsize(file_path)
+    fmt = None
+
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12:
+            return None
+        riff, _, form = struct.unpack('<4sI4s', header)
+        if riff != b'RIFF' or form != b'WAVE':
+            return None
+
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size)
+                if len(fmt) < chunk_size:
+                    return None
+                f.seek(chunk_size % 2, os.SEEK_CUR)
+            elif chunk_id == b'data':
+                data_offset = f.tell()
+                break
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    if fmt is None or len(fmt) < 16:
+        return None
+
+    audio_format, channels, sample_rate, _, block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+    if audio_format == 0xFFFE and len(fmt) >= 26:
+        # WAVE_FORMAT_EXTENSIBLE: real format code starts the SubFormat GUID
+        audio_format = struct.unpack('<H', fmt[24:26])[0]
+
+    sample_width = bits // 8
+    if (audio_format != 1 or sample_width not in (2, 4) or channels == 0
+            or block_align != sample_width * channels):
+        return None
+
+    # Streamed WAVs may carry a placeholder size; trust the file length
+    data_size = min(chunk_size, file_size - data_offset)
+    n_frames = data_size // block_align
+    if n_frames == 0:
+        return None
+
+    samples = np.memmap(
+        file_path,
+        dtype=np.dtype(SAMPLE_DTYPES[sample_width]).newbyteorder('<'),
+        mode='r',
+        offset=data_offset,
+        shape=(n_frames, channels) if channels > 1 else (n_frames,)
+    )
+    return samples, sample_rate, sample_width
+
+
+def pcm_view(raw_data, sample_width, channels):
+    """
+    Wrap raw PCM bytes in a numpy array without copying
+
+    Returns:
+        Read-only array of shape (n_frames,) for mono or (n_frames, channels)
+    """
+    samples = np.frombuffer(raw_data, dtype=SAMPLE_DTYPES[sample_width])
+    if channels > 1:
+        samples = samples.reshape((-1, channels))
+    return samples
+
+
+def full_scale(dtype):
+    """
+    Magnitude of digital full scale for a PCM container dtype
+
+    Integer PCM is scaled by its container: 8-bit (pydub stores it signed),
+    16-bit, and 32-bit, which also carries 24-bit PCM left-justified (pydub
+    widens 24-bit samples by a low padding byte). Float PCM is already
+    normalized.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return 1.0
+    return float(1 << (dtype.itemsize * 8 - 1))
+
+
+def normalize_pcm(samples, chunk_frames=NORMALIZE_CHUNK_FRAMES):
+    """
+    PCM samples as normalized float32, channel-planar
+
+    Converted chunk by chunk straight into the float32 result, so neither a
+    float64 temporary nor a full integer copy of a memory-mapped file is
+    made.
+
+    Args:
+        samples: PCM array, (n_frames,) or (n_frames, channels)
+
+    Returns:
+        float32 array of shape (channels, n_frames), full scale at 1.0
+    """
+    frames = samples[:, np.newaxis] if samples.ndim == 1 else samples
+    scale = np.float32(1.0 / full_scale(samples.dtype))
+    planar = np.empty((frames.shape[1], len(frames)), dtype=np.float32)
+
+    for start in range(0, len(frames), chunk_frames):
+        chunk = planar[:, start:start + chunk_frames]
+        chunk[...] = frames[start:start + chunk_frames].T
+        chunk *= scale
+    return planar
+
+
+def write_planar(samples, f, chunk_frames=NORMALIZE_CHUNK_FRAMES, header=True):
+    """
+    Write normalize_pcm(samples) to a binary file, chunk by chunk
+
+    Only one chunk is converted at a time and it is written with plain file
+    writes (no writable mapping), so memory stays bounded for any length.
+
+    Args:
+        samples: PCM array, (n_frames,) or (n_frames, channels)
+        f: binary file object opened for writing, positioned at the start
+        header: write a .npy header (np.load-able), else raw float32 data
+    """
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    n_frames = len(samples)
+    if header:
+        np.lib.format.write_array_header_1_0(f, {
+            'descr': np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+            'fortran_order': False,
+            'shape': (channels, n_frames),
+        })
+    base = f.tell()
+    itemsize = np.dtype(np.float32).itemsize
+
+    for start in range(0, n_frames, chunk_frames):
+        chunk = normalize_pcm(samples[start:start + chunk_frames], chunk_frames)
+        for channel in range(channels):
+            f.seek(base + (channel * n_frames + start) * itemsize)
+            f.write(chunk[channel])
+
+
+def temp_planar(samples, chunk_frames=NORMALIZE_CHUNK_FRAMES):
+    """normalize_pcm(samples) in an unlinked temporary file, memory-mapped read-only"""
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    with tempfile.TemporaryFile(prefix='asa-planar-') as f:
+        write_planar(samples, f, chunk_frames, header=False)
+        f.flush()
+        return np.memmap(f, dtype=np.float32, mode='r', shape=(channels, len(samples)))
+
+
+class PlanarSamples:
+    """
+    Normalized float32 planar form of a loaded signal, built on first use
+
+    Shared by a processor and its clones. Analysis jobs on several worker
+    threads may ask for it at once; the lock makes them wait for a single
+    conversion. With a DecodedAudioCache the result is stored there and
+    memory-mapped back. Signals longer than PLANAR_MEMORY_FRAMES are never
+    built in memory: they are written chunk by chunk to the cache file, or
+    to a temporary file without a cache.
+    """
+
+    def __init__(self, samples, cache=None, cache_key=None):
+        self.samples = samples
+        self.cache = cache
+        self.cache_key = cache_key
+        self.array = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self.array is None:
+                self.array = self._build()
+            return self.array
+
+    def _build(self):
+        short = len(self.samples) <= PLANAR_MEMORY_FRAMES
+        planar = None
+
+        if self.cache is not None and self.cache_key is not None:
+            cached = self.cache.load(self.cache_key, 'planar')
+            if cached is None:
+                if short:
+                    planar = normalize_pcm(self.samples)
+                    contents = planar
+                else:
+                    contents = lambda f: write_planar(self.samples, f)
+                self.cache.store(self.cache_key, 'planar', {'samples': contents})
+                cached = self.cache.load(self.cache_key, 'planar')
+            if cached is not None:
+                return cached[0]['samples']
+
+        if planar is not None:
+            return planar
+        return normalize_pcm(self.samples) if short else temp_planar(self.samples)
 
 
 class AudioProcessor:
-    def __init__(self):
-        self.audio = None
-        self.reversed_audio = None
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.cache_key = None
+        self._audio = None
+        self.samples = None
+        self.planar_samples = None
+        self.reversed_samples = None
+        self._reversed_audio = None
         self.file_path = None
         self.sample_rate = None
         self.channels = None
@@ -47,90 +336,330 @@ class AudioProcessor:
         self.duration_ms = None
         self.bitrate = None
 
-    def load_audio(self, file_path):
-        """Load audio file (M4A, MP3, WAV)"""
+    def load_audio(self, file_path, decode_mode=DECODE_MODE):
+        """
+        Load audio file (M4A, MP3, WAV)
+
+        decode_mode: 'pipe' decodes M4A/MP3 once through an ffmpeg pipe into a
+        single PCM buffer shared by the AudioSegment and the numpy view,
+        'pydub' uses pydub's own decoder (temporary WAV round-trip)
+
+        With a DecodedAudioCache, a previously decoded file is memory-mapped
+        from the cache instead of being decoded again. 16/32-bit PCM WAV
+        files are memory-mapped in place, so hour-long recordings load with
+        bounded resident memory.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in ('.m4a', '.mp3', '.wav'):
+            raise ValueError("Unsupported file format. Only M4A, MP3, and WAV are supported.")
+
+        self.cache_key = self.cache.key_for(file_path) if self.cache else None
+        cached = self.cache.load(self.cache_key, 'pcm') if self.cache else None
+        mapped = _open_wav_memmap(file_path) if file_ext == '.wav' and cached is None else None
 
-        if file_ext == '.m4a':
-            self.audio = AudioSegment.from_file(file_path, format='m4a')
-        elif file_ext == '.mp3':
-            self.audio = AudioSegment.from_mp3(file_path)
-        elif file_ext == '.wav':
-            self.audio = AudioSegment.from_wav(file_path)
+        if mapped is not None:
+            # Samples stay in the file; nothing to cache for the PCM itself
+            samples, sample_rate, sample_width = mapped
+            self._audio = None
+            self._set_samples(samples, sample_rate, sample_width)
+        elif cached is not None:
+            arrays, attrs = cached
+            self._audio = None
+            self._set_samples(arrays['samples'], attrs['sample_rate'], attrs['sample_width'])
         else:
-            raise ValueError("Unsupported file format. Only M4A, MP3, and WAV are supported.")
+            AudioSegment = load_pydub().AudioSegment
+            if file_ext in ('.m4a', '.mp3') and decode_mode == 'pipe':
+                pcm, sample_rate, channels, sample_width = _decode_pcm_pipe(file_path)
+                # AudioSegment keeps a reference to the same bytes object (no copy)
+                audio = AudioSegment(
+                    data=pcm,
+                    sample_width=sample_width,
+                    frame_rate=sample_rate,
+                    channels=channels
+                )
+            elif file_ext == '.m4a':
+                audio = AudioSegment.from_file(file_path, format='m4a')
+            elif file_ext == '.mp3':
+                audio = AudioSegment.from_mp3(file_path)
+            else:
+                audio = AudioSegment.from_wav(file_path)
 
-        self.file_path = file_path
-        self.sample_rate = self.audio.frame_rate
-        self.channels = self.audio.channels
-        self.sample_width = self.audio.sample_width
-        self.duration_ms = len(self.audio)
-        self.bitrate = self.audio.frame_rate * self.audio.channels * self.audio.sample_width * 8
+            self._audio = audio
+            self._set_samples(
+                pcm_view(audio.raw_data, audio.sample_width, audio.channels),
+                audio.frame_rate,
+                audio.sample_width
+            )
+            if self.cache:
+                self.cache.store(
+                    self.cache_key, 'pcm',
+                    {'samples': self.samples},
+                    {'sample_rate': self.sample_rate, 'sample_width': self.sample_width}
+                )
 
+        self.file_path = file_path
         return True
 
+    def clone(self):
+        """
+        Processor over the same samples (shared, not copied), without the
+        reverse state, so several tracks of one file can differ in direction
+        """
+        clone = AudioProcessor(cache=self.cache)
+        clone.cache_key = self.cache_key
+        clone._audio = self._audio
+        clone._set_samples(self.samples, self.sample_rate, self.sample_width)
+        clone.planar_samples = self.planar_samples
+        clone.file_path = self.file_path
+        return clone
+
+    def _set_samples(self, samples, sample_rate, sample_width):
+        """Adopt a PCM array as the loaded signal and derive its metadata"""
+        self.samples = samples
+        self.planar_samples = PlanarSamples(samples, self.cache, self.cache_key)
+        self.reversed_samples = None
+        self._reversed_audio = None
+        self.sample_rate = sample_rate
+        self.channels = samples.shape[1] if samples.ndim > 1 else 1
+        self.sample_width = sample_width
+        # Same rounding as len(AudioSegment)
+        self.duration_ms = round(1000 * len(samples) / sample_rate)
+        self.bitrate = sample_rate * self.channels * sample_width * 8
+
+    @property
+    def is_loaded(self):
+        return self.samples is not None
+
+    @property
+    def audio(self):
+        """
+        Forward AudioSegment
+
+        Cached (memory-mapped) loads have no segment until an export or
+        resampling path asks for one; it is then built from the samples.
+        """
+        if self._audio is None and self.samples is not None:
+            self._audio = self._segment(self.samples)
+        return self._audio
+
+    @property
+    def planar(self):
+        """
+        Forward signal as normalized float32, shape (channels, n_frames)
+
+        Built once per file (shared with clones) on first access; analysis
+        reads this instead of rescaling the integer PCM itself.
+        """
+        return None if self.planar_samples is None else self.planar_samples.get()
+
+    @property
+    def is_reversed(self):
+        """True once reverse_audio() has been applied to the loaded file"""
+        return self.reversed_samples is not None
+
+    @property
+    def reversed_audio(self):
+        """
+        Reversed AudioSegment, materialised lazily from the reversed view
+
+        Only export/resampling paths need real bytes; visualization reads
+        reversed_samples directly.
+        """
+        if self.reversed_samples is None:
+            return None
+
+        if self._reversed_audio is None:
+            self._reversed_audio = self._segment(self.reversed_samples)
+        return self._reversed_audio
+
+    def _segment(self, samples):
+        """AudioSegment over samples in the loaded file's format"""
+        return load_pydub().AudioSegment(
+            data=np.ascontiguousarray(samples).tobytes(),
+            sample_width=self.sample_width,
+            frame_rate=self.sample_rate,
+            channels=self.channels
+        )
+
     def reverse_audio(self):
-        """Reverse the loaded audio"""
-        if self.audio is None:
+        """
+        Reverse the loaded audio
+
+        Returns a negative-stride view over the original buffer: O(1) in
+        time and memory. Frames are reversed as a whole, so channel order
+        is preserved.
+        """
+        if not self.is_loaded:
             raise ValueError("No audio loaded. Please load an audio file first.")
 
-        self.reversed_audio = self.audio.reverse()
-        return self.reversed_audio
+        self.reversed_samples = self.samples[::-1]
+        self._reversed_audio = None
+        return self.reversed_samples
 
     def change_speed(self, speed_factor):
         """
-        Change playback speed of reversed audio
+        Change playback speed of reversed audio, keeping the pitch
         speed_factor: 0.5 = half speed, 1.0 = normal, 2.0 = double speed
         """
-        if self.reversed_audio is None:
+        if not self.is_reversed:
             raise ValueError("No reversed audio available. Please reverse audio first.")
 
-        # Change frame rate to alter speed without changing pitch
-        new_sample_rate = int(self.sample_rate * speed_factor)
-        speed_changed = self.reversed_audio._spawn(
-            self.reversed_audio.raw_data,
-            overrides={'frame_rate': new_sample_rate}
-        )
-        # Convert back to original sample rate for consistent playback
-        return speed_changed.set_frame_rate(self.sample_rate)
+        if speed_factor == 1.0:
+            return self.reversed_audio
+
+        return self._segment(np.concatenate(list(self.iter_speed_chunks(speed_factor))))
+
+    def iter_speed_chunks(self, speed_factor, chunk_frames=STRETCH_CHUNK_FRAMES):
+        """
+        Time-stretch the reversed audio chunk by chunk (phase vocoder)
+
+        Each chunk is ready as soon as its input has been processed, so
+        playback or export can start before the whole file is stretched.
+
+        Yields:
+            sample arrays in the loaded file's dtype and channel layout
+        """
+        if not self.is_reversed:
+            raise ValueError("No reversed audio available. Please reverse audio first.")
+
+        dtype = self.reversed_samples.dtype
+        scale = full_scale(dtype)
+        mono = self.reversed_samples.ndim == 1
+        vocoder = PhaseVocoder(speed_factor, self.channels)
+        # Reversed view over the normalized signal
+        planar = self.planar[:, ::-1]
+
+        # Clip limits of the container; scaled and clipped in float64, since
+        # float32 rounds 2**31 - 1 up and int32 overshoot would then wrap
+        limits = np.iinfo(dtype) if np.dtype(dtype).kind in 'iu' else np.finfo(dtype)
+        low, high = float(limits.min), float(limits.max)
+
+        def to_pcm(stretched):
+            stretched = np.clip(stretched.astype(np.float64) * scale, low, high).astype(dtype)
+            return stretched[:, 0] if mono else stretched
+
+        for start in range(0, planar.shape[1], chunk_frames):
+            stretched = vocoder.process(planar[:, start:start + chunk_frames].T)
+            if len(stretched):
+                yield to_pcm(stretched)
+
+        stretched = vocoder.flush()
+        if len(stretched):
+            yield to_pcm(stretched)
+
+    def get_playback_buffer(self, speed_factor=1.0, max_channels=2):
+        """
+        Reversed PCM for in-memory playback (pygame.mixer.Sound(buffer=...))
+
+        At speed 1.0 the reversed view is used as-is (no resample, no temp
+        file); the only copy is making it C-contiguous for the mixer.
+
+        Returns:
+            C-contiguous int16 array of shape (n_frames, channels)
+        """
+        if not self.is_reversed:
+            raise ValueError("No reversed audio available. Please reverse audio first.")
+
+        if speed_factor == 1.0:
+            return self._mixer_format(self.reversed_samples, max_channels)
+
+        return np.concatenate(list(self.iter_playback_chunks(speed_factor, max_channels)))
+
+    def iter_playback_chunks(self, speed_factor, max_channels=2):
+        """
+        Streaming variant of get_playback_buffer for speed != 1.0
+
+        Yields:
+            C-contiguous int16 arrays of shape (n_frames, channels)
+        """
+        for chunk in self.iter_speed_chunks(speed_factor):
+            yield self._mixer_format(chunk, max_channels)
+
+    @staticmethod
+    def _mixer_format(samples, max_channels):
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+        samples = samples[:, :max_channels]
+
+        # Mixer runs at 16-bit; rescale other widths
+        if samples.dtype == np.int8:
+            samples = samples.astype(np.int16) << 8
+        elif samples.dtype == np.int32:
+            samples = (samples >> 16).astype(np.int16)
+
+        return np.ascontiguousarray(samples, dtype=np.int16)
 
     def get_audio_data(self, audio_segment=None):
-        """Get audio data as numpy array for visualization"""
-        if audio_segment is None:
-            audio_segment = self.reversed_audio if self.reversed_audio else self.audio
+        """
+        Get audio data as numpy array for visualization
 
+        Returns the normalized float32 planar signal, (channels, n_frames),
+        in playback direction: the reversed signal is a view over the one
+        built at load, so repeated redraws neither copy nor rescale it. An
+        explicit audio_segment is converted on each call.
+        """
         if audio_segment is None:
-            return None
+            planar = self.planar
+            if planar is None:
+                return None
+            return planar[:, ::-1] if self.is_reversed else planar
 
-        # Convert to numpy array
-        samples = np.array(audio_segment.get_array_of_samples())
+        return normalize_pcm(pcm_view(audio_segment.raw_data, audio_segment.sample_width, audio_segment.channels))
 
-        # If stereo, reshape to (n_samples, 2)
-        if self.channels == 2:
-            samples = samples.reshape((-1, 2))
+    def export_reversed(self, output_path=None, format='wav', speed_factor=1.0):
+        """
+        Export reversed audio to file
 
-        return samples
+        format: 'wav' or 'mp3' (mp3 needs ffmpeg)
+        speed_factor: passed to change_speed() when not 1.0
 
-    def export_reversed(self, output_path=None):
-        """Export reversed audio to file"""
-        if self.reversed_audio is None:
+        WAV output is streamed chunk by chunk (from the reversed view at
+        1.0x, from the time-stretcher otherwise), without materialising an
+        AudioSegment.
+        """
+        if not self.is_reversed:
             raise ValueError("No reversed audio available. Please reverse audio first.")
 
         if output_path is None:
             # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f'.{format}')
             output_path = temp_file.name
             temp_file.close()
 
-        self.reversed_audio.export(output_path, format='wav')
+        if format == 'wav':
+            if speed_factor != 1.0:
+                chunks = self.iter_speed_chunks(speed_factor)
+            else:
+                chunks = (
+                    self.reversed_samples[start:start + WAV_CHUNK_FRAMES]
+                    for start in range(0, len(self.reversed_samples), WAV_CHUNK_FRAMES)
+                )
+            self._write_wav(output_path, chunks)
+        elif speed_factor != 1.0:
+            self.change_speed(speed_factor).export(output_path, format=format)
+        else:
+            self.reversed_audio.export(output_path, format=format)
         return output_path
 
+    def _write_wav(self, output_path, chunks):
+        """Write an iterable of PCM sample chunks to a WAV file"""
+        with wave.open(output_path, 'wb') as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(self.sample_width)
+            wav_file.setframerate(self.sample_rate)
+            for chunk in chunks:
+                chunk = np.ascontiguousarray(chunk)
+                if self.sample_width == 1:
+                    # WAV stores 8-bit samples unsigned
+                    chunk = (chunk.astype(np.int16) + 128).astype(np.uint8)
+                wav_file.writeframes(chunk.tobytes())
+
     def get_metadata(self):
         """Get audio metadata for display"""
-        if self.audio is None:
+        if not self.is_loaded:
             return None
 
         return {
@@ -28,6 +28,16 @@ cp qt_scope.py "$BUILD_TMP/"
 cp audio_processor.py "$BUILD_TMP/"
 cp config.py "$BUILD_TMP/"
 cp visualization.py "$BUILD_TMP/"
+cp spectrogram.py "$BUILD_TMP/"
+cp playback.py "$BUILD_TMP/"
+cp workers.py "$BUILD_TMP/"
+cp audio_cache.py "$BUILD_TMP/"
+cp time_stretch.py "$BUILD_TMP/"
+cp pyqtgraph_backend.py "$BUILD_TMP/"
+cp startup.py "$BUILD_TMP/"
+cp live_input.py "$BUILD_TMP/"
+cp session.py "$BUILD_TMP/"
+cp metering.py "$BUILD_TMP/"
 cp requirements.txt "$BUILD_TMP/"
 cp ASA-2000.spec "$BUILD_TMP/"
 
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Reserve Batch CLI
+- GUI(PyQt5) 없이 오디오 파일 일괄 역재생 + 배속 변환
+- 프로세스 풀로 병렬 처리, 파일별 처리 속도 리포트
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 현재 디렉토리를 모듈 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio_processor import AudioProcessor
+
+SUPPORTED_EXTENSIONS = ('.m4a', '.mp3', '.wav')
+# 이 CLI가 만든 출력 파일 (<이름>_reversed[_x1.5]) - 다시 입력으로 쓰지 않음
+REVERSED_STEM = re.compile(r'_reversed(_x[0-9.]+)?$')
+
+
+def glob_root(pattern):
+    """glob 패턴에서 와일드카드 앞의 고정 폴더 부분"""
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def collect_files(inputs, recursive=False, exclude_dir=None):
+    """
+    입력(파일/폴더/glob 패턴)에서 지원 오디오 파일 목록 수집
+
+    exclude_dir(출력 폴더) 안의 파일과 이전 실행의 출력(_reversed)은 제외
+
+    Returns:
+        list: (파일 절대 경로, 출력 하위 폴더) - 폴더/glob 입력은 기준 폴더의
+        상대 경로를 유지해 다른 폴더의 같은 이름 파일이 서로 덮어쓰지 않음
+    """
+    exclude_dir = os.path.abspath(exclude_dir) + os.sep if exclude_dir else None
+    files = {}
+    for item in inputs:
+        if os.path.isdir(item):
+            root = item
+            pattern = os.path.join(item, '**', '*') if recursive else os.path.join(item, '*')
+            candidates = glob.glob(pattern, recursive=recursive)
+        elif os.path.isfile(item):
+            root = os.path.dirname(item) or os.curdir
+            candidates = [item]
+        else:
+            root = glob_root(item)
+            candidates = glob.glob(item, recursive=True)
+
+        for path in candidates:
+            if not (os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS)):
+                continue
+            full_path = os.path.abspath(path)
+            if exclude_dir and full_path.startswith(exclude_dir):
+                continue
+            if REVERSED_STEM.search(os.path.splitext(os.path.basename(path))[0]):
+                continue
+            subdir = os.path.relpath(os.path.dirname(full_path), os.path.abspath(root))
+            # 중복 제거 (처음 입력 기준)
+            files.setdefault(full_path, '' if subdir == os.curdir else subdir)
+
+    return sorted(files.items())
+
+
+def output_path_for(input_path, output_dir, fmt, speed):
+    """출력 파일 경로 생성: <이름>_reversed[_x1.5].<fmt>"""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    suffix = '_reversed' if speed == 1.0 else f'_reversed_x{speed:g}'
+    return os.path.join(output_dir, f"{stem}{suffix}.{fmt}")
+
+
+def find_collisions(files, output_dir, fmt, speed):
+    """같은 출력 경로로 가는 입력 목록 {출력: [입력, ...]} (2개 이상만)"""
+    targets = {}
+    for path, subdir in files:
+        output_path = output_path_for(path, os.path.join(output_dir, subdir), fmt, speed)
+        targets.setdefault(output_path, []).append(path)
+    return {output: paths for output, paths in targets.items() if len(paths) > 1}
+
+
+def reverse_file(input_path, output_dir, fmt='wav', speed=1.0):
+    """
+    단일 파일 역재생 + 내보내기 (프로세스 풀 워커)
+
+    Returns:
+        dict: input, output, duration(s), elapsed(s), error
+    """
+    started = time.perf_counter()
+    result = {'input': input_path, 'output': None, 'duration': 0.0, 'elapsed': 0.0, 'error': None}
+
+    try:
+        processor = AudioProcessor()
+        processor.load_audio(input_path)
+        processor.reverse_audio()
+
+        output_path = output_path_for(input_path, output_dir, fmt, speed)
+        os.makedirs(output_dir, exist_ok=True)
+        processor.export_reversed(output_path, format=fmt, speed_factor=speed)
+
+        result['output'] = output_path
+        result['duration'] = processor.duration_ms / 1000.0
+    except Exception as e:
+        result['error'] = str(e)
+
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def format_result(result):
+    """파일별 처리 결과 한 줄 요약"""
+    name = os.path.basename(result['input'])
+    if result['error']:
+        return f"❌ {name}: {result['error']}"
+
+    realtime = result['duration'] / result['elapsed'] if result['elapsed'] > 0 else 0.0
+    return (f"✅ {name} → {os.path.basename(result['output'])} "
+            f"| {result['duration']:.1f}s 오디오 / {result['elapsed']:.2f}s "
+            f"| {realtime:.1f}x 실시간")
+
+
+def run_batch(files, output_dir, fmt='wav', speed=1.0, workers=None):
+    """
+    프로세스 풀로 일괄 처리, 결과 리스트 반환
+
+    Args:
+        files: collect_files 결과 (입력 경로, 출력 하위 폴더) 목록
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(reverse_file, path, os.path.join(output_dir, subdir), fmt, speed)
+            for path, subdir in files
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(format_result(result))
+    wall_time = time.perf_counter() - started
+
+    succeeded = [r for r in results if not r['error']]
+    total_audio = sum(r['duration'] for r in succeeded)
+
+    print()
+    print("=" * 50)
+    print(f"📊 완료: {len(succeeded)}/{len(results)} 파일")
+    print(f"⏱️  오디오 {total_audio:.1f}s / 경과 {wall_time:.2f}s "
+          f"({total_audio / wall_time if wall_time > 0 else 0:.1f}x 실시간)")
+    print("=" * 50)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ASA-2000 역재생 일괄 처리 CLI')
+    parser.add_argument('inputs', nargs='+', help='입력 파일, 폴더 또는 glob 패턴 (예: "clues/*.m4a")')
+    parser.add_argument('--output-dir', '-o', default='reversed', help='출력 폴더')
+    parser.add_argument('--format', '-f', choices=['wav', 'mp3'], default='wav', help='출력 포맷')
+    parser.add_argument('--speed', '-s', type=float, default=1.0, help='배속 (0.5 ~ 2.0)')
+    parser.add_argument('--workers', '-j', type=int, default=None, help='동시 처리 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--recursive', '-r', action='store_true', help='하위 폴더 포함')
+
+    args = parser.parse_args()
+
+    if args.speed <= 0:
+        parser.error('--speed는 0보다 커야 합니다')
+
+    files = collect_files(args.inputs, recursive=args.recursive, exclude_dir=args.output_dir)
+    if not files:
+        print("❌ 처리할 오디오 파일이 없습니다 (M4A/MP3/WAV)")
+        sys.exit(1)
+
+    collisions = find_collisions(files, args.output_dir, args.format, args.speed)
+    if collisions:
+        print(f"❌ 출력 파일 이름이 겹칩니다 ({len(collisions)}건) - 입력을 나눠서 실행하세요")
+        for output_path, paths in collisions.items():
+            print(f"   - {output_path} ← {', '.join(paths)}")
+        sys.exit(1)
+
+    print(f"🎧 {len(files)}개 파일 역재생 → {args.output_dir} ({args.format.upper()}, {args.speed:g}x)\n")
+    results = run_batch(files, args.output_dir, args.format, args.speed, args.workers)
+
+    if any(r['error'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@ Configuration Constants for Reserve Audio Analyzer
 Colors, fonts, layout settings, and display parameters
 """
 
+import os
+
 # ════════════════════════════════════════════════════════════════
 # COLOR PALETTE - Oscilloscope Theme
 # ════════════════════════════════════════════════════════════════
@@ -23,6 +25,9 @@ class Colors:
     YELLOW = '#ffff00'          # Warnings, reverse button
     RED = '#ff0000'             # Errors, stop button
 
+    # Session tracks: active trace first, then overlays in order
+    TRACKS = ('#00ff41', '#00e5ff', '#ff55ff', '#ffaa00')
+
     # Aliases for semantic use
     PRIMARY = GREEN_BRIGHT
     SECONDARY = GREEN_MEDIUM
@@ -91,16 +96,72 @@ class Layout:
 # ════════════════════════════════════════════════════════════════
 
 # Waveform display
-DISPLAY_SAMPLES = 4000          # Number of samples for waveform display
+DISPLAY_SAMPLES = 4000          # Max envelope columns for waveform display
+ENVELOPE_BASE_BLOCK = 16        # Samples per min/max block at pyramid level 0
+ENVELOPE_CHUNK_BLOCKS = 65536   # Level-0 blocks per streaming chunk (1M samples)
 WINDOW_SIZE_MS = 2000           # Animation window size (2 seconds)
 
 # Animation settings
-ANIMATION_INTERVAL_MS = 100     # Animation update interval (10fps)
-PLAYBACK_STEP_MS = 100          # Playback position increment per update
+ANIMATION_INTERVAL_MS = 100     # Slowest animation interval under load (10fps)
+ANIMATION_MIN_INTERVAL_MS = 16  # Fastest interval when refresh rate is unknown (~60fps)
+FRAME_BUDGET_RATIO = 0.6        # Share of the frame interval rendering may use
+
+# Scope render backend
+RENDER_BACKEND = 'auto'         # 'auto' (pyqtgraph if installed), 'pyqtgraph' or 'matplotlib'
+SCOPE_OPENGL = True             # pyqtgraph: draw through a QOpenGL viewport
+PHOSPHOR_TRAILS = 4             # pyqtgraph: previous traces kept on screen
+PHOSPHOR_DECAY = 0.5            # Brightness ratio between successive trails
 
 # FFT settings
-FFT_SIZE = 16384                # FFT computation size
-SAVGOL_WINDOW = 51              # Savitzky-Golay filter window size
+FFT_SIZE = 4096                 # STFT frame size (~93ms at 44.1kHz)
+SAVGOL_WINDOW = 13              # Savitzky-Golay filter window size (bins)
+STFT_HOP_MS = 50                # Spectrogram hop between frames
+STFT_BATCH_FRAMES = 256         # Frames transformed per rfft batch
+STFT_DYNAMIC_RANGE_DB = 100     # Spectrogram display range above noise floor
+STFT_CACHE_ENTRIES = 4          # Spectrograms kept in memory (per file)
+
+# Level metering (status bar)
+METER_BLOCK_MS = 100            # Timeline resolution (BS.1770 gating sub-block)
+METER_OVERSAMPLE = 4            # True-peak interpolation factor
+METER_CHUNK_BLOCKS = 100        # Blocks per streaming chunk (10 seconds)
+METER_FLOOR_DB = -120.0         # Level shown for digital silence
+
+
+# Time-stretch (phase vocoder) settings
+PLAYBACK_SPEED = 1.0            # Playback speed factor (pitch preserved)
+STRETCH_FFT_SIZE = 2048         # Phase vocoder frame size
+STRETCH_HOP = 512               # Synthesis hop (FFT_SIZE / 4 overlap)
+STRETCH_BATCH_FRAMES = 128      # Frames per vectorized rfft batch
+STRETCH_CHUNK_FRAMES = 44100    # Input frames per streamed chunk (~1s)
+
+
+# Live input settings
+LIVE_SOURCE = 'mic'             # 'mic', 'synthetic', or an audio file path (looped)
+LIVE_SAMPLE_RATE = 44100        # Capture rate for mic / synthetic input
+LIVE_CHANNELS = 1               # Capture channels for mic / synthetic input
+LIVE_BLOCK_FRAMES = 512         # Frames per capture block (~12ms latency bound)
+LIVE_BUFFER_SECONDS = 30        # Rolling capture kept in the ring buffer
+LIVE_REVERSE_SECONDS = 5        # Live REVERSE plays the last N seconds backwards
+
+
+# ════════════════════════════════════════════════════════════════
+# AUDIO DECODING
+# ════════════════════════════════════════════════════════════════
+
+DECODE_MODE = 'pipe'            # 'pipe' (ffmpeg -> raw PCM, zero-copy) or 'pydub'
+PIPE_SAMPLE_WIDTH = 2           # Bytes per sample for piped decode (16-bit)
+WORKER_THREADS = 2              # Background threads for decode/analysis jobs
+NORMALIZE_CHUNK_FRAMES = 1 << 20  # Frames per step of the float32 planar conversion
+PLANAR_MEMORY_FRAMES = 1 << 22    # Longer signals get a disk-backed planar copy (~95 s at 44.1 kHz)
+
+# Decoded audio cache (memory-mapped PCM, envelope, spectrogram per file)
+CACHE_ENABLED = True
+CACHE_DIR = os.path.join(os.path.expanduser('~'), 'Library', 'Caches', 'ASA-2000')
+CACHE_MAX_BYTES = 2 * 1024 ** 3  # LRU eviction above 2 GB
+
+# Multi-track session (A/B comparison)
+SESSION_MAX_TRACKS = 4          # Loaded tracks (one per Colors.TRACKS entry)
+SESSION_MEMORY_BUDGET = 1024 ** 3  # Resident PCM + envelopes + spectrograms (LRU above 1 GB)
 
 
 # ════════════════════════════════════════════════════════════════
@@ -205,7 +266,7 @@ def get_stylesheet():
         border: 2px solid {Colors.BORDER};
     }}
 
-    #statusLabel, #timeLabel {{
+    #statusLabel, #timeLabel, #levelLabel {{
         color: {Colors.GREEN_BRIGHT};
     }}
     """
@@ -0,0 +1,479 @@
+"""
+Live Input Module for Reserve Audio Analyzer
+Lock-free capture ring buffer, input sources and incremental scope feeds
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from config import (
+    FFT_SIZE, SAVGOL_WINDOW, STFT_DYNAMIC_RANGE_DB,
+    ENVELOPE_BASE_BLOCK, WINDOW_SIZE_MS,
+    LIVE_SOURCE, LIVE_SAMPLE_RATE, LIVE_CHANNELS, LIVE_BLOCK_FRAMES, LIVE_BUFFER_SECONDS,
+    LIVE_REVERSE_SECONDS
+)
+
+
+class RingBuffer:
+    """
+    Single-producer / single-consumer ring of audio frames, without locks
+
+    Storage is mirrored: frame i is written at i % capacity and again
+    capacity further on, so any span of up to `capacity` recent frames is
+    one contiguous slice and can be handed out as a view (reversed views
+    included) without copying.
+
+    The writer announces the span it is about to overwrite (`_reserved`),
+    writes, then publishes it by advancing `written`. Readers only look at
+    published frames and check `_reserved` again after copying, so frames
+    the writer lapped during the copy are dropped instead of returned torn.
+    """
+
+    def __init__(self, capacity, channels=1, dtype=np.float32):
+        if capacity <= 0:
+            raise ValueError("Ring capacity must be positive")
+
+        self.capacity = int(capacity)
+        self.channels = channels
+        self._storage = np.zeros((2 * self.capacity, channels), dtype=dtype)
+        self.written = 0
+        self._reserved = 0
+
+    @property
+    def dtype(self):
+        return self._storage.dtype
+
+    @property
+    def oldest(self):
+        """Absolute index of the oldest frame still held"""
+        return max(self.written - self.capacity, 0)
+
+    def write(self, frames):
+        """
+        Append frames (producer side)
+
+        Args:
+            frames: array of shape (n, channels) or (n,) for mono
+        """
+        frames = np.asarray(frames, dtype=self._storage.dtype).reshape(-1, self.channels)
+        count = len(frames)
+        if count == 0:
+            return
+
+        start = self.written
+        # A block longer than the ring only leaves its tail
+        if count > self.capacity:
+            frames = frames[-self.capacity:]
+            start += count - self.capacity
+
+        self._reserved = self.written + count
+
+        capacity = self.capacity
+        offset = start % capacity
+        first = min(len(frames), capacity - offset)
+        rest = len(frames) - first
+        for base in (0, capacity):
+            self._storage[base + offset:base + offset + first] = frames[:first]
+            if rest:
+                self._storage[base:base + rest] = frames[first:]
+
+        self.written = self._reserved
+
+    def view(self, start, stop):
+        """
+        Frames [start, stop) as a view over the storage (no copy)
+
+        The view is only valid until the writer laps it; copy it, or use it
+        within (capacity - (stop - start)) frames of further writing.
+        """
+        if not self.oldest <= start <= stop <= self.written:
+            raise IndexError(f"Frames [{start}, {stop}) are not in the ring")
+
+        offset = start % self.capacity
+        return self._storage[offset:offset + (stop - start)]
+
+    def read(self, start, stop=None):
+        """
+        Copy frames [start, stop) (consumer side)
+
+        Frames already overwritten are skipped, so the result may be shorter
+        than asked for; it always ends at `stop`.
+
+        Returns:
+            array of shape (m, channels) holding frames [stop - m, stop)
+        """
+        written = self.written
+        stop = written if stop is None else min(stop, written)
+        start = min(max(start, self.oldest), stop)
+
+        data = self.view(start, stop).copy()
+
+        # Writer may have started overwriting the head while we copied
+        lapped = self._reserved - self.capacity - start
+        if lapped > 0:
+            data = data[min(lapped, len(data)):]
+        return data
+
+    def latest(self, count):
+        """Copy of the newest `count` frames (fewer right after start)"""
+        return self.read(self.written - count)
+
+
+# ════════════════════════════════════════════════════════════════
+# INPUT SOURCES
+# ════════════════════════════════════════════════════════════════
+
+class InputSource(ABC):
+    """
+    Audio input delivering float32 blocks of shape (frames, channels)
+
+    start(on_frames) begins delivery on the source's own thread; samples
+    are in -1.0 .. 1.0.
+    """
+
+    name = 'input'
+
+    def __init__(self, sample_rate=LIVE_SAMPLE_RATE, channels=LIVE_CHANNELS,
+                 block_frames=LIVE_BLOCK_FRAMES):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_frames = block_frames
+
+    @abstractmethod
+    def start(self, on_frames):
+        """Begin calling on_frames(block) from the source's thread"""
+
+    @abstractmethod
+    def stop(self):
+        """Stop delivery; no on_frames call follows once this returns"""
+
+
+class MicrophoneSource(InputSource):
+    """Default input device through sounddevice (PortAudio callback thread)"""
+
+    name = 'MIC'
+
+    def __init__(self, device=None, **kwargs):
+        super().__init__(**kwargs)
+        self.device = device
+        self._stream = None
+
+    def start(self, on_frames):
+        try:
+            import sounddevice
+        except ImportError as e:
+            raise RuntimeError("Microphone input needs the sounddevice package") from e
+
+        def callback(indata, frames, time_info, status):
+            on_frames(indata)
+
+        self._stream = sounddevice.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            blocksize=self.block_frames,
+            dtype='float32',
+            device=self.device,
+            callback=callback
+        )
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+class PacedSource(InputSource):
+    """
+    Source generating blocks on a thread at the real-time rate
+
+    Subclasses implement generate(first_frame, count). When the thread
+    falls behind (e.g. the machine was suspended) it skips ahead instead
+    of bursting the backlog into the ring.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._thread = None
+        self._running = threading.Event()
+
+    @abstractmethod
+    def generate(self, first_frame, count):
+        """Return float32 frames first_frame .. first_frame + count, shape (count, channels)"""
+
+    def start(self, on_frames):
+        self._running.set()
+        self._thread = threading.Thread(
+            target=self._run, args=(on_frames,), name=f'asa-live-{self.name.lower()}', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, on_frames):
+        block_s = self.block_frames / self.sample_rate
+        frame = 0
+        deadline = time.perf_counter()
+
+        while self._running.is_set():
+            on_frames(self.generate(frame, self.block_frames))
+            frame += self.block_frames
+            deadline += block_s
+
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -4 * block_s:
+                deadline = time.perf_counter()
+
+
+class SyntheticSource(PacedSource):
+    """
+    Voice-like test signal: harmonic tone with a gliding pitch, syllable
+    envelope and a little noise
+    """
+
+    name = 'SYNTH'
+
+    def __init__(self, pitch_hz=140.0, **kwargs):
+        super().__init__(**kwargs)
+        self.pitch_hz = pitch_hz
+        self._rng = np.random.default_rng(0)
+        self._phase = 0.0
+
+    def generate(self, first_frame, count):
+        t = (first_frame + np.arange(count)) / self.sample_rate
+
+        # Pitch glides +-20% over 3 s; phase accumulates across blocks
+        pitch = self.pitch_hz * (1.0 + 0.2 * np.sin(2 * np.pi * t / 3.0))
+        phase = self._phase + 2 * np.pi * np.cumsum(pitch) / self.sample_rate
+        self._phase = float(phase[-1] % (2 * np.pi))
+
+        tone = sum(np.sin(k * phase) / k for k in range(1, 8))
+        syllables = np.clip(np.sin(2 * np.pi * 3.0 * t), 0.0, None) ** 2
+        signal = 0.3 * syllables * tone + 0.01 * self._rng.standard_normal(count)
+
+        block = signal.astype(np.float32)[:, np.newaxis]
+        return np.repeat(block, self.channels, axis=1)
+
+
+class FileSource(PacedSource):
+    """Audio file played into the ring at the real-time rate, looped"""
+
+    name = 'FILE'
+
+    def __init__(self, file_path, block_frames=LIVE_BLOCK_FRAMES):
+        from audio_processor import AudioProcessor
+
+        processor = AudioProcessor()
+        processor.load_audio(file_path)
+        planar = processor.planar
+
+        super().__init__(
+            sample_rate=processor.sample_rate,
+            channels=len(planar),
+            block_frames=block_frames
+        )
+        self._planar = planar
+
+    def generate(self, first_frame, count):
+        index = (first_frame + np.arange(count)) % self._planar.shape[1]
+        return self._planar[:, index].T
+
+
+def create_input_source(source=LIVE_SOURCE):
+    """
+    Input source from a LIVE_SOURCE setting
+
+    'mic' (default input device), 'synthetic', or an audio file path
+    """
+    if source == 'mic':
+        return MicrophoneSource()
+    if source == 'synthetic':
+        return SyntheticSource()
+    return FileSource(source)
+
+
+# ════════════════════════════════════════════════════════════════
+# LIVE CAPTURE
+# ════════════════════════════════════════════════════════════════
+
+class LiveCapture:
+    """
+    An input source writing into a RingBuffer of LIVE_BUFFER_SECONDS
+
+    The source thread is the ring's only writer; the GUI thread reads.
+    """
+
+    def __init__(self, source, seconds=LIVE_BUFFER_SECONDS):
+        self.source = source
+        self.ring = RingBuffer(int(seconds * source.sample_rate), source.channels)
+        self.last_block_at = None
+
+    @property
+    def sample_rate(self):
+        return self.source.sample_rate
+
+    @property
+    def channels(self):
+        return self.source.channels
+
+    def _on_frames(self, frames):
+        self.ring.write(frames)
+        self.last_block_at = time.perf_counter()
+
+    def start(self):
+        self.source.start(self._on_frames)
+
+    def stop(self):
+        self.source.stop()
+
+    def reversed_window(self, seconds=LIVE_REVERSE_SECONDS):
+        """
+        The last `seconds` of input, newest frame first
+
+        Like AudioProcessor.reverse_audio, a negative-stride view (here over
+        the ring storage): O(1), nothing is copied. The writer overwrites
+        the oldest frames first, so the view stays intact while less than
+        (LIVE_BUFFER_SECONDS - seconds) of new input arrives.
+        """
+        ring = self.ring
+        written = ring.written
+        start = max(written - int(seconds * self.sample_rate), ring.oldest)
+        return ring.view(start, written)[::-1]
+
+    def reversed_pcm(self, seconds=LIVE_REVERSE_SECONDS):
+        """
+        reversed_window as C-contiguous int16 for pygame.mixer.Sound(buffer=...)
+
+        The scaling pass reads the reversed view directly: no reversed copy
+        is made, only the 16-bit conversion every mixer buffer needs.
+        """
+        scaled = np.multiply(self.reversed_window(seconds), 32767.0)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16)
+
+    def latency_ms(self):
+        """
+        Age of the newest displayed sample's block: one block of buffering
+        plus the time since it arrived (None before the first block)
+        """
+        if self.last_block_at is None:
+            return None
+        block_ms = 1000.0 * self.source.block_frames / self.sample_rate
+        return block_ms + (time.perf_counter() - self.last_block_at) * 1000.0
+
+
+class LiveEnvelope:
+    """
+    Min/max envelope of the newest WINDOW_SIZE_MS of a capture
+
+    Stands in for EnvelopePyramid in the waveform animators (n_samples and
+    trace()). Level-0 blocks are kept in their own ring and only frames
+    captured since the previous trace() are reduced, so the per-frame cost
+    depends on the input rate, not on the window length. Values are not
+    normalized: full scale is +-1.
+    """
+
+    def __init__(self, capture, base_block=ENVELOPE_BASE_BLOCK):
+        self.capture = capture
+        self.base_block = base_block
+        self.n_blocks = max(int(WINDOW_SIZE_MS * capture.sample_rate / 1000) // base_block, 1)
+        self.n_samples = self.n_blocks * base_block
+        self.blocks = RingBuffer(self.n_blocks, channels=2)
+        self._consumed = 0
+
+    def update(self):
+        """Reduce newly captured frames into level-0 blocks"""
+        ring = self.capture.ring
+        block = self.base_block
+
+        # Consumer fell more than a window behind: restart at the window
+        start = max(self._consumed, ring.written - self.n_samples)
+        start -= (start - self._consumed) % block
+        stop = start + ((ring.written - start) // block) * block
+        if stop <= start:
+            return
+
+        frames = ring.read(start, stop)[:, 0]
+        frames = frames[len(frames) % block:]
+        blocks = frames.reshape(-1, block)
+        self.blocks.write(np.stack([blocks.min(axis=1), blocks.max(axis=1)], axis=1))
+        self._consumed = stop
+
+    def trace(self, start, stop, columns):
+        """Same output as EnvelopePyramid.trace, over the newest window"""
+        self.update()
+
+        pairs = self.blocks.view(self.blocks.oldest, self.blocks.written)
+        factor = max(len(pairs) // max(columns, 1), 1)
+        usable = (len(pairs) // factor) * factor
+        pairs = pairs[len(pairs) - usable:]
+        mins = pairs[:, 0].reshape(-1, factor).min(axis=1)
+        maxs = pairs[:, 1].reshape(-1, factor).max(axis=1)
+
+        # Right-aligned: the newest sample sits at the right edge
+        first = self.n_samples - usable * self.base_block
+        positions = first + (np.arange(len(mins)) + 0.5) * (self.base_block * factor)
+
+        values = np.empty(2 * len(mins), dtype=np.float32)
+        values[0::2] = mins
+        values[1::2] = maxs
+        return np.repeat(positions, 2), values
+
+
+class LiveSpectrum:
+    """
+    Spectrum of the newest FFT_SIZE captured frames
+
+    Stands in for Spectrogram in the spectrum animators (frequencies,
+    sample_rate, spectrum_at()). Scaled like Spectrogram.frames - dB above
+    the floor of the display range - with a full-scale sine at the top
+    instead of the file peak. Recomputed only when new frames arrived.
+    """
+
+    def __init__(self, capture, n_fft=FFT_SIZE):
+        # Deferred like in compute_spectrogram (preloaded after startup)
+        from scipy.signal import savgol_filter
+
+        self._savgol = savgol_filter
+        self.capture = capture
+        self.n_fft = n_fft
+        self.sample_rate = capture.sample_rate
+        self.frequencies = np.fft.rfftfreq(n_fft, 1.0 / capture.sample_rate)
+
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+        full_scale_db = 20 * np.log10(self.window.sum() / 2)
+        self.floor_db = full_scale_db - STFT_DYNAMIC_RANGE_DB
+        self._smooth = SAVGOL_WINDOW if len(self.frequencies) > SAVGOL_WINDOW else 0
+
+        self._frame = np.zeros(n_fft, dtype=np.float32)
+        self._magnitude_db = np.zeros(len(self.frequencies), dtype=np.float32)
+        self._computed_at = -1
+
+    def spectrum_at(self, position_ms=None, reverse=False):
+        """Newest spectrum (position and direction do not apply to live input)"""
+        ring = self.capture.ring
+        if ring.written == self._computed_at:
+            return self._magnitude_db
+
+        written = ring.written
+        newest = ring.read(written - self.n_fft, written)[:, 0]
+        self._frame[:self.n_fft - len(newest)] = 0.0
+        self._frame[self.n_fft - len(newest):] = newest
+
+        magnitude_db = 20 * np.log10(np.abs(np.fft.rfft(self._frame * self.window)) + 1e-10)
+        if self._smooth:
+            magnitude_db = self._savgol(magnitude_db, self._smooth, 3)
+
+        self._magnitude_db = np.clip(magnitude_db - self.floor_db, 0, STFT_DYNAMIC_RANGE_DB).astype(np.float32)
+        self._computed_at = written
+        return self._magnitude_db
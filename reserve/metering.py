@@ -0,0 +1,245 @@
+"""
+Metering Module for Reserve Audio Analyzer
+Per-block RMS, sample/true peak and K-weighted loudness (ITU-R BS.1770)
+"""
+
+import numpy as np
+
+from config import METER_BLOCK_MS, METER_OVERSAMPLE, METER_CHUNK_BLOCKS, METER_FLOOR_DB
+
+# Timeline columns
+RMS, PEAK, TRUE_PEAK, MOMENTARY = range(4)
+
+# Momentary loudness window: 400 ms of blocks
+MOMENTARY_MS = 400
+# True-peak interpolator taps per phase (BS.1770 Annex 2: 48 taps at 4x)
+_TRUE_PEAK_TAPS = 12
+
+
+def k_weighting(sample_rate):
+    """
+    K-weighting as an sos array for scipy.signal.sosfilt
+
+    BS.1770 gives the coefficients for 48 kHz only; the two stages
+    (high shelf, then RLB high pass) are re-derived for sample_rate from
+    their analog prototypes through the bilinear transform.
+    """
+    # Stage 1: high shelf (+4 dB above ~1.7 kHz, head diffraction)
+    k = np.tan(np.pi * 1681.974450955533 / sample_rate)
+    q = 0.7071752369554193
+    vh = 10 ** (3.99984385397 / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0,
+        1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0,
+    ]
+
+    # Stage 2: RLB high pass (~38 Hz)
+    k = np.tan(np.pi * 38.13547087613982 / sample_rate)
+    q = 0.5003270373253953
+    a0 = 1.0 + k / q + k * k
+    high_pass = [1.0, -2.0, 1.0, 1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+
+    return np.array([shelf, high_pass])
+
+
+def true_peak_kernel(oversample=METER_OVERSAMPLE):
+    """
+    Polyphase branches of the true-peak interpolation filter, (taps, phases)
+
+    Branch 0 reproduces the input samples (already covered by the sample
+    peak), so only the oversample - 1 in-between phases are kept. The
+    prototype is symmetric, so applying the branches as a correlation
+    only permutes them - harmless when taking the maximum.
+    """
+    from scipy.signal import firwin
+    taps = firwin(_TRUE_PEAK_TAPS * oversample, 1.0 / oversample) * oversample
+    return np.stack([taps[phase::oversample] for phase in range(1, oversample)], axis=1).astype(np.float32)
+
+
+def channel_weights(channels):
+    """BS.1770 channel weights (5.1: LFE excluded, surrounds +1.5 dB)"""
+    if channels == 6:
+        return np.array([1.0, 1.0, 1.0, 0.0, 1.41, 1.41], dtype=np.float32)
+    return np.ones(channels, dtype=np.float32)
+
+
+def _db(power_or_amplitude, scale):
+    with np.errstate(divide='ignore'):
+        return np.maximum(scale * np.log10(power_or_amplitude), METER_FLOOR_DB).astype(np.float32)
+
+
+class MeterTimeline:
+    """
+    Level timeline of a file, one row per METER_BLOCK_MS block
+
+    levels[k] = (RMS dBFS, sample peak dBFS, true peak dBTP, momentary
+    LUFS) for block k, as float32. Momentary loudness covers the 400 ms
+    ending with the block. Lookups during playback are a row index.
+    """
+
+    def __init__(self, levels, block_ms, integrated_lufs, true_peak_db, n_samples, sample_rate):
+        self.levels = levels
+        self.block_ms = block_ms
+        self.integrated_lufs = integrated_lufs
+        self.true_peak_db = true_peak_db
+        self.n_samples = n_samples
+        self.sample_rate = sample_rate
+
+    @property
+    def duration_ms(self):
+        return self.n_samples * 1000.0 / self.sample_rate
+
+    def to_arrays(self):
+        """Arrays and attributes for DecodedAudioCache.store"""
+        attrs = {
+            'block_ms': self.block_ms,
+            'integrated_lufs': float(self.integrated_lufs),
+            'true_peak_db': float(self.true_peak_db),
+            'n_samples': int(self.n_samples),
+            'sample_rate': int(self.sample_rate)
+        }
+        return {'levels': self.levels}, attrs
+
+    @classmethod
+    def from_arrays(cls, arrays, attrs):
+        """Rebuild from DecodedAudioCache.load output (levels stay memory-mapped)"""
+        return cls(
+            arrays['levels'], attrs['block_ms'], attrs['integrated_lufs'],
+            attrs['true_peak_db'], attrs['n_samples'], attrs['sample_rate']
+        )
+
+    def at(self, position_ms, reverse=False):
+        """
+        Levels at a playback position
+
+        reverse: position refers to the reversed signal; block levels are
+        direction-independent except momentary loudness, whose window then
+        trails instead of leads (close enough for a meter)
+        """
+        if reverse:
+            position_ms = self.duration_ms - position_ms
+        index = min(max(int(position_ms / self.block_ms), 0), len(self.levels) - 1)
+        return self.levels[index]
+
+
+def compute_meter(audio_data, sample_rate, progress=None):
+    """
+    Meter a whole file
+
+    Streams the buffer in chunks of METER_CHUNK_BLOCKS blocks, so a
+    memory-mapped signal is paged in a chunk at a time. Within a chunk
+    every measure is vectorized over (channels, blocks, samples):
+    K-weighting runs through sosfilt with its state carried between
+    chunks, and the true peak is the peak of a METER_OVERSAMPLE x
+    polyphase interpolation, computed only for the in-between phases with
+    filter context borrowed from the neighbouring chunks.
+
+    Args:
+        audio_data: normalized planar samples, (channels, n) or mono (n,)
+        sample_rate: sample rate in Hz
+        progress: optional callable(fraction) called after each chunk
+
+    Returns:
+        MeterTimeline, or None if there is no data
+    """
+    if audio_data is None or audio_data.size == 0:
+        return None
+
+    # Deferred: scipy.signal costs ~1s to import; this runs on a worker thread
+    from scipy.signal import sosfilt
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    planar = audio_data[np.newaxis] if audio_data.ndim == 1 else audio_data
+    channels, n_samples = planar.shape
+
+    block = max(int(round(sample_rate * METER_BLOCK_MS / 1000.0)), 1)
+    n_blocks = -(-n_samples // block)
+    chunk = METER_CHUNK_BLOCKS * block
+
+    sos = k_weighting(sample_rate)
+    zi = np.zeros((len(sos), channels, 2))  # Filter starts at rest (silence before the file)
+    weights = channel_weights(channels)
+    kernel = true_peak_kernel()
+    half = _TRUE_PEAK_TAPS // 2
+
+    mean_square = np.empty(n_blocks, dtype=np.float64)
+    weighted_power = np.empty(n_blocks, dtype=np.float64)
+    peak = np.empty(n_blocks, dtype=np.float32)
+    true_peak = np.empty(n_blocks, dtype=np.float32)
+
+    for start in range(0, n_samples, chunk):
+        stop = min(start + chunk, n_samples)
+        length = stop - start
+        first = start // block
+        count = -(-length // block)
+
+        # Chunk zero-padded to whole blocks, with interpolation context from
+        # its neighbours on both sides (zeros past the file edges)
+        wide = np.zeros((channels, half + count * block + half - 1), dtype=np.float32)
+        lo, hi = max(start - half, 0), min(stop + half - 1, n_samples)
+        wide[:, lo - start + half:hi - start + half] = planar[:, lo:hi]
+        x = wide[:, half:half + count * block]
+        blocks = x.reshape(channels, count, block)
+
+        mean_square[first:first + count] = np.square(blocks, dtype=np.float64).mean(axis=(0, 2))
+        peak[first:first + count] = np.abs(blocks).max(axis=(0, 2))
+
+        filtered, zi = sosfilt(sos, x[:, :length], axis=-1, zi=zi)
+        k_power = np.zeros((channels, count * block))
+        np.square(filtered, out=k_power[:, :length])
+        weighted_power[first:first + count] = weights @ k_power.reshape(channels, count, block).mean(axis=2)
+
+        # Interpolated points between each sample and its predecessor: one
+        # matrix product over sliding windows per channel, reduced per block
+        between = np.empty((channels, count * block, kernel.shape[1]), dtype=np.float32)
+        for channel in range(channels):
+            np.matmul(sliding_window_view(wide[channel], _TRUE_PEAK_TAPS), kernel, out=between[channel])
+        np.abs(between, out=between)
+        true_peak[first:first + count] = np.maximum(
+            between.transpose(1, 0, 2).reshape(count, -1).max(axis=1), peak[first:first + count]
+        )
+
+        if progress is not None:
+            progress(stop / n_samples)
+
+    # Momentary loudness: mean power over the last 400 ms of blocks
+    window = max(int(round(MOMENTARY_MS / METER_BLOCK_MS)), 1)
+    cumulative = np.concatenate([[0.0], np.cumsum(weighted_power)])
+    lead = np.maximum(np.arange(1, n_blocks + 1) - window, 0)
+    momentary_power = (cumulative[1:] - cumulative[lead]) / (np.arange(1, n_blocks + 1) - lead)
+
+    levels = np.empty((n_blocks, 4), dtype=np.float32)
+    levels[:, RMS] = _db(mean_square, 10)
+    levels[:, PEAK] = _db(peak, 20)
+    levels[:, TRUE_PEAK] = _db(true_peak, 20)
+    levels[:, MOMENTARY] = _db(momentary_power, 10) - 0.691
+
+    return MeterTimeline(
+        levels, METER_BLOCK_MS,
+        integrated_loudness(momentary_power[window - 1:] if n_blocks >= window else momentary_power),
+        float(levels[:, TRUE_PEAK].max()),
+        n_samples, sample_rate
+    )
+
+
+def integrated_loudness(gating_power):
+    """
+    Gated integrated loudness (BS.1770) from 400 ms block powers
+
+    Absolute gate at -70 LUFS, then a relative gate 10 LU below the
+    loudness of the blocks that passed it.
+    """
+    with np.errstate(divide='ignore'):
+        loudness = -0.691 + 10 * np.log10(gating_power)
+
+    gated = gating_power[loudness > -70.0]
+    if len(gated) == 0:
+        return METER_FLOOR_DB
+
+    relative_gate = -0.691 + 10 * np.log10(gated.mean()) - 10.0
+    gated = gating_power[loudness > max(relative_gate, -70.0)]
+    if len(gated) == 0:
+        return METER_FLOOR_DB
+    return float(-0.691 + 10 * np.log10(gated.mean()))
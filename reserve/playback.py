@@ -0,0 +1,173 @@
+"""
+Playback Timing Module for Reserve Audio Analyzer
+Playhead clock and adaptive animation frame scheduling
+"""
+
+import time
+
+from config import ANIMATION_INTERVAL_MS, ANIMATION_MIN_INTERVAL_MS, FRAME_BUDGET_RATIO
+
+
+class PlaybackClock:
+    """
+    Playhead position read from the audio output, not from timer ticks
+
+    source: optional callable returning milliseconds played so far (e.g.
+    pygame.mixer.music.get_pos), negative when nothing is playing. Without
+    a source (pygame Sound/Channel playback has no position query) the
+    clock runs on the monotonic wall clock and accounts for pauses itself,
+    bounded by the audio handed to the output (start/queue): when a
+    streamed queue runs dry the playhead holds at the last queued sample
+    instead of running ahead of the sound.
+    """
+
+    def __init__(self, source=None):
+        self.source = source
+        self.offset_ms = 0
+        # End of the audio queued so far (None: unbounded)
+        self.queued_end_ms = None
+        self._started_at = None
+        self._paused_at = None
+        self._paused_total = 0.0
+
+    @property
+    def is_running(self):
+        return self._started_at is not None and self._paused_at is None
+
+    def start(self, offset_ms=0, queued_ms=None):
+        """
+        Start counting from offset_ms (position of the first played sample)
+
+        Args:
+            offset_ms: position of the first played sample
+            queued_ms: length of the audio handed to the output (None: all of it)
+        """
+        self.offset_ms = offset_ms
+        self.queued_end_ms = None if queued_ms is None else offset_ms + queued_ms
+        self._started_at = time.perf_counter()
+        self._paused_at = None
+        self._paused_total = 0.0
+
+    def queue(self, duration_ms, restart=False):
+        """
+        Account for duration_ms more audio handed to the output
+
+        Args:
+            duration_ms: length of the queued audio
+            restart: the output had run dry and starts playing again now;
+                counting resumes from the end of the audio queued before
+        """
+        if self.queued_end_ms is None:
+            return
+        if restart and self._started_at is not None:
+            self.offset_ms = self.position_ms()
+            self._started_at = time.perf_counter()
+            self._paused_total = 0.0
+            if self._paused_at is not None:
+                self._paused_at = self._started_at
+        self.queued_end_ms += duration_ms
+
+    def pause(self):
+        if self.is_running:
+            self._paused_at = time.perf_counter()
+
+    def resume(self):
+        if self._paused_at is not None:
+            self._paused_total += time.perf_counter() - self._paused_at
+            self._paused_at = None
+
+    def stop(self):
+        self._started_at = None
+        self._paused_at = None
+
+    def position_ms(self):
+        """Current playhead position in ms"""
+        if self._started_at is None:
+            return self.offset_ms
+
+        if self.source is not None:
+            played = self.source()
+            if played >= 0:
+                return self.offset_ms + played
+
+        now = self._paused_at if self._paused_at is not None else time.perf_counter()
+        position = self.offset_ms + (now - self._started_at - self._paused_total) * 1000.0
+        if self.queued_end_ms is not None:
+            position = min(position, self.queued_end_ms)
+        return position
+
+
+class FrameScheduler:
+    """
+    Adaptive animation frame rate with dropped-frame accounting
+
+    Renders as often as min_interval_ms (display refresh) while frames fit
+    in FRAME_BUDGET_RATIO of the interval, and backs off towards
+    max_interval_ms when rendering gets slow. A tick that arrives more than
+    one interval late counts the skipped frames as dropped.
+    """
+
+    def __init__(self, min_interval_ms=ANIMATION_MIN_INTERVAL_MS,
+                 max_interval_ms=ANIMATION_INTERVAL_MS):
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max(max_interval_ms, min_interval_ms)
+        self.reset()
+
+    def reset(self):
+        """Start a new playback session"""
+        self.interval_ms = self.min_interval_ms
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+        self.last_render_ms = 0.0
+        self._last_tick = None
+        self._frame_start = None
+        self._session_start = time.perf_counter()
+
+    @property
+    def timer_interval(self):
+        """Current interval rounded for QTimer (ms)"""
+        return int(round(self.interval_ms))
+
+    def begin_frame(self):
+        """Call at the start of each timer tick"""
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            late = (now - self._last_tick) * 1000.0 / self.interval_ms
+            if late >= 2.0:
+                self.frames_dropped += int(late) - 1
+        self._last_tick = now
+        self._frame_start = now
+
+    def end_frame(self):
+        """
+        Call after the frame was rendered
+
+        Returns:
+            int: interval in ms until the next frame
+        """
+        if self._frame_start is None:
+            return self.timer_interval
+
+        self.last_render_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        self.frames_rendered += 1
+        budget = self.interval_ms * FRAME_BUDGET_RATIO
+
+        if self.last_render_ms > budget:
+            # Degrade: leave room for the event loop and audio thread
+            self.interval_ms = min(self.last_render_ms / FRAME_BUDGET_RATIO, self.max_interval_ms)
+        elif self.last_render_ms < budget / 2:
+            # Idle CPU: creep back towards display refresh
+            self.interval_ms = max(self.interval_ms * 0.9, self.min_interval_ms)
+
+        return self.timer_interval
+
+    def stats(self):
+        """Frame counters for the current playback session"""
+        elapsed = time.perf_counter() - self._session_start
+        return {
+            'fps': self.frames_rendered / elapsed if elapsed > 0 else 0.0,
+            'rendered': self.frames_rendered,
+            'dropped': self.frames_dropped,
+            'interval_ms': self.interval_ms,
+            'render_ms': self.last_render_ms,
+        }
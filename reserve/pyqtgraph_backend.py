@@ -0,0 +1,343 @@
+"""
+pyqtgraph Render Backend for Reserve Audio Analyzer
+OpenGL oscilloscope at display refresh rate with phosphor persistence
+"""
+
+from collections import deque
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+
+from config import (
+    Colors, WINDOW_SIZE_MS, STFT_DYNAMIC_RANGE_DB,
+    SCOPE_OPENGL, PHOSPHOR_TRAILS, PHOSPHOR_DECAY
+)
+from visualization import (
+    RenderBackend, WAVEFORM_LABELS, SPECTRUM_LABELS, EMPTY_LAYOUT,
+    spectrum_ylim, window_trace, waveform_overlays, spectrum_overlays
+)
+
+
+def _opengl_available():
+    try:
+        from PyQt5 import QtOpenGL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _log_ticks(xlim):
+    """Decade ticks (labelled) and 2..9 minor ticks for a log axis, in decades"""
+    first = int(np.floor(np.log10(xlim[0])))
+    last = int(np.ceil(np.log10(xlim[1])))
+    major = [(float(k), f'{10.0 ** k:g}') for k in range(first, last + 1)]
+    minor = [(np.log10(m * 10.0 ** k), '') for k in range(first, last) for m in range(2, 10)]
+    return [major, minor]
+
+
+def _pen(color, width=1.5, alpha=1.0, style=Qt.SolidLine):
+    qcolor = pg.mkColor(color)
+    qcolor.setAlphaF(alpha)
+    return pg.mkPen(qcolor, width=width, style=style)
+
+
+class ScopePlot(pg.PlotWidget):
+    """
+    Oscilloscope-styled plot widget with persistent items
+
+    Like visualization.ScopeRenderer, the styled axes and every item are
+    created once and drawing only calls setData. With persistence on,
+    the previous traces stay on screen as PHOSPHOR_TRAILS dimmer copies,
+    each PHOSPHOR_DECAY times as bright as the next newer one.
+    """
+
+    def __init__(self, parent, labels, zero_line=False):
+        super().__init__(parent, background=Colors.BLACK)
+        plot = self.getPlotItem()
+        plot.setMenuEnabled(False)
+        plot.setMouseEnabled(x=False, y=False)
+        plot.hideButtons()
+        plot.showGrid(x=True, y=True, alpha=0.8)
+        plot.getViewBox().setBorder(_pen(Colors.BORDER, width=2))
+
+        for side, label in zip(('bottom', 'left'), labels):
+            axis = plot.getAxis(side)
+            axis.setPen(_pen(Colors.BORDER))
+            axis.setTextPen(_pen(Colors.GREEN_MEDIUM))
+            # Grid is drawn by the axes: keep it under the traces
+            axis.setZValue(-200)
+            plot.setLabel(side, label, color=Colors.GREEN_MEDIUM, **{'font-weight': 'bold'})
+
+        self.trails = [
+            plot.plot(pen=_pen(Colors.GREEN_BRIGHT, 1.0, 0.9 * PHOSPHOR_DECAY ** (i + 1)))
+            for i in range(PHOSPHOR_TRAILS)
+        ]
+        self._history = deque(maxlen=PHOSPHOR_TRAILS)
+        self._current = None
+
+        self.zero_line = pg.InfiniteLine(pos=0, angle=0, pen=_pen(Colors.BORDER, 1.5, 0.8))
+        self.zero_line.setVisible(zero_line)
+        plot.addItem(self.zero_line)
+
+        # Other session tracks, under the active trace (created on demand)
+        self.overlays = []
+
+        # 1px pens: Qt strokes wider polylines through a far slower path
+        self.line = plot.plot(pen=_pen(Colors.GREEN_BRIGHT, 1.0, 0.9))
+
+        self.marker = pg.InfiniteLine(angle=90, pen=_pen(Colors.YELLOW, 2, 0.8, Qt.DashLine))
+        self.marker.setVisible(False)
+        plot.addItem(self.marker)
+
+        self.marker_label = pg.TextItem(color=Colors.YELLOW, anchor=(0.5, 1.0))
+        self.marker_label.setFont(QFont('Courier New', 9, QFont.Bold))
+        self.marker_label.setVisible(False)
+        plot.addItem(self.marker_label)
+
+        self.placeholder = pg.TextItem('NO SIGNAL', color=Colors.GREEN_MEDIUM, anchor=(0.5, 0.5))
+        self.placeholder.setFont(QFont('Courier New', 18, QFont.Bold))
+        self.placeholder.setVisible(False)
+        plot.addItem(self.placeholder)
+
+        self._layout = None
+
+    def trace_columns(self):
+        """Full horizontal resolution of the plot in device pixels"""
+        width = self.getPlotItem().getViewBox().width() * self.devicePixelRatioF()
+        return max(int(width), 1)
+
+    def set_layout(self, xlim, ylim, xscale='linear'):
+        """Set axes limits and x scale ('linear' or 'log')"""
+        layout = (tuple(xlim), tuple(ylim), xscale)
+        if layout == self._layout:
+            return
+
+        plot = self.getPlotItem()
+        log_x = xscale == 'log'
+        plot.setLogMode(x=log_x, y=False)
+        plot.getAxis('bottom').setTicks(_log_ticks(xlim) if log_x else None)
+        # In log mode the view range is given in decades
+        plot.setXRange(*(np.log10(xlim) if log_x else xlim), padding=0)
+        plot.setYRange(*ylim, padding=0)
+        self._layout = layout
+
+    def show_placeholder(self, visible):
+        self.placeholder.setVisible(visible)
+        self.line.setVisible(not visible)
+        if visible:
+            self.zero_line.setVisible(False)
+            self.set_overlays([])
+            self.show_marker(None)
+            self.clear_trails()
+            self.set_layout(*EMPTY_LAYOUT)
+            self.placeholder.setPos(0.5, 0.5)
+
+    def show_marker(self, position_ms, label=None, alpha=0.8):
+        """Vertical playhead marker at position_ms (None hides it)"""
+        self.marker.setVisible(position_ms is not None)
+        self.marker_label.setVisible(position_ms is not None and label is not None)
+        if position_ms is None:
+            return
+
+        self.marker.setPen(_pen(Colors.YELLOW, 2, alpha, Qt.DashLine))
+        self.marker.setValue(position_ms)
+        if label is not None:
+            self.marker_label.setText(label)
+            self.marker_label.setPos(position_ms, 1.15)
+
+    def set_fill(self, enabled):
+        """Fill between the trace and 0"""
+        if enabled:
+            brush = pg.mkColor(Colors.GREEN_BRIGHT)
+            brush.setAlphaF(0.2)
+            self.line.setFillLevel(0)
+            self.line.setBrush(brush)
+        else:
+            self.line.setFillLevel(None)
+
+    def set_overlays(self, traces):
+        """Overlay traces of other tracks: list of (x, y, color)"""
+        while len(self.overlays) < len(traces):
+            item = self.getPlotItem().plot()
+            item.setZValue(-1)
+            self.overlays.append(item)
+
+        for item, (x, y, color) in zip(self.overlays, traces):
+            item.setPen(_pen(color, 1.0, 0.6))
+            item.setData(x, y)
+            item.setVisible(True)
+        for item in self.overlays[len(traces):]:
+            item.setVisible(False)
+
+    def set_trace(self, x, y, persist=False):
+        """
+        Replace the trace
+
+        Args:
+            persist: keep the previous traces as phosphor trails
+        """
+        if persist and self._current is not None:
+            self._history.appendleft(self._current)
+            for trail, (trail_x, trail_y) in zip(self.trails, self._history):
+                trail.setData(trail_x, trail_y)
+        elif not persist:
+            self.clear_trails()
+
+        self._current = (x, y)
+        self.line.setData(x, y)
+
+    def clear_trails(self):
+        self._history.clear()
+        for trail in self.trails:
+            trail.setData([], [])
+
+
+class PgWaveformAnimator:
+    """Moving-window waveform on a ScopePlot, with phosphor trails"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._envelope = None
+        self._overlays = []
+
+    @property
+    def is_prepared(self):
+        return self._envelope is not None
+
+    def invalidate_cache(self):
+        """Clear cached data (call when audio changes)"""
+        self._envelope = None
+        self._overlays = []
+
+    def prepare_cache(self, envelope, overlays=()):
+        if envelope is None:
+            return False
+
+        self._envelope = envelope
+        self._overlays = waveform_overlays(overlays)
+        self.canvas.show_placeholder(False)
+        self.canvas.zero_line.setVisible(True)
+        self.canvas.clear_trails()
+        self.canvas.show_marker(WINDOW_SIZE_MS // 3, alpha=0.5)
+        self.canvas.set_layout((0, WINDOW_SIZE_MS), (-1.2, 1.2))
+        return True
+
+    def update(self, playback_position, duration_ms):
+        if self._envelope is None:
+            return
+
+        columns = self.canvas.trace_columns()
+        time_window, values = window_trace(self._envelope, playback_position, duration_ms, columns)
+        self.canvas.set_overlays([
+            overlay.waveform_window(playback_position, columns) for overlay in self._overlays
+        ])
+        self.canvas.set_trace(time_window, values, persist=True)
+
+
+class PgSpectrumAnimator:
+    """Spectrum at the playhead on a ScopePlot, with phosphor trails"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._spectrogram = None
+        self._overlays = []
+
+    @property
+    def is_prepared(self):
+        return self._spectrogram is not None
+
+    def invalidate_cache(self):
+        """Clear cached data (call when audio changes)"""
+        self._spectrogram = None
+        self._overlays = []
+
+    def prepare_cache(self, spectrogram, overlays=()):
+        if spectrogram is None:
+            return False
+
+        self._spectrogram = spectrogram
+        self._overlays = spectrum_overlays(overlays)
+        self.canvas.show_placeholder(False)
+        self.canvas.clear_trails()
+        self.canvas.set_fill(True)
+        self.canvas.set_layout(
+            (20, spectrogram.sample_rate / 2), (0, STFT_DYNAMIC_RANGE_DB * 1.05), 'log'
+        )
+        return True
+
+    def update(self, playback_position, reverse=False):
+        if self._spectrogram is None:
+            return
+
+        magnitude_db = self._spectrogram.spectrum_at(playback_position, reverse)
+        # DC bin has no place on a log axis
+        self.canvas.set_overlays([
+            (x[1:], y[1:], color)
+            for x, y, color in (overlay.spectrum_at(playback_position) for overlay in self._overlays)
+        ])
+        self.canvas.set_trace(
+            self._spectrogram.frequencies[1:], magnitude_db[1:], persist=True
+        )
+
+
+class PyqtgraphBackend(RenderBackend):
+    """
+    pyqtgraph backend
+
+    Draws through a QOpenGL viewport (SCOPE_OPENGL) without Agg
+    rasterisation, so the animated scope keeps up with the display
+    refresh rate at full pixel width.
+    """
+
+    name = 'pyqtgraph'
+
+    def __init__(self, use_opengl=SCOPE_OPENGL):
+        pg.setConfigOptions(antialias=False, useOpenGL=use_opengl and _opengl_available())
+
+    def create_canvas(self, parent, kind):
+        if kind == 'waveform':
+            return ScopePlot(parent, WAVEFORM_LABELS, zero_line=True)
+        return ScopePlot(parent, SPECTRUM_LABELS)
+
+    def draw_waveform_static(self, canvas, envelope, duration_ms, playback_position=0, is_playing=False,
+                             overlays=()):
+        if envelope is None:
+            canvas.show_placeholder(True)
+            return
+
+        canvas.show_placeholder(False)
+        canvas.zero_line.setVisible(True)
+        canvas.set_layout((0, duration_ms), (-1.2, 1.2))
+
+        columns = canvas.trace_columns()
+        positions, values = envelope.trace(0, envelope.n_samples, columns)
+        canvas.set_overlays([overlay.waveform(columns) for overlay in waveform_overlays(overlays)])
+        canvas.set_trace(positions * (duration_ms / envelope.n_samples), values)
+
+        if is_playing and playback_position > 0:
+            canvas.show_marker(playback_position, f'{playback_position:.0f}ms')
+        else:
+            canvas.show_marker(None)
+
+    def draw_spectrum_static(self, canvas, frequencies, magnitude_db, sample_rate, overlays=()):
+        if frequencies is None or magnitude_db is None:
+            canvas.show_placeholder(True)
+            return
+
+        traces = [(x[1:], y[1:], color) for x, y, color in
+                  (overlay.spectrum() for overlay in spectrum_overlays(overlays))]
+        ylim = spectrum_ylim(np.concatenate([magnitude_db] + [y for _, y, _ in traces]))
+
+        canvas.show_placeholder(False)
+        canvas.set_fill(True)
+        canvas.set_layout((20, sample_rate / 2), ylim, 'log')
+        canvas.set_overlays(traces)
+        canvas.set_trace(frequencies[1:], magnitude_db[1:])
+
+    def waveform_animator(self, canvas):
+        return PgWaveformAnimator(canvas)
+
+    def spectrum_animator(self, canvas):
+        return PgSpectrumAnimator(canvas)
@@ -5,9 +5,11 @@ Professional measurement equipment aesthetic with full styling control
 
 import sys
 import os
-import tempfile
-import threading
-import pygame
+import time
+
+# Startup profile origin (before the GUI imports)
+_STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QFileDialog,
                              QFrame, QGridLayout)
@@ -15,18 +17,27 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
 from config import (
-    Colors, Fonts, Layout, get_stylesheet,
+    Colors, Fonts, Layout, get_stylesheet, CACHE_ENABLED,
     DISPLAY_SAMPLES, WINDOW_SIZE_MS,
-    ANIMATION_INTERVAL_MS, PLAYBACK_STEP_MS,
-    FFT_SIZE, SAVGOL_WINDOW
-)
-from visualization import (
-    MplCanvas, style_scope_axis,
-    prepare_waveform_samples, compute_spectrum,
-    draw_waveform_static, draw_spectrum_static,
-    WaveformAnimator
+    ANIMATION_INTERVAL_MS, ANIMATION_MIN_INTERVAL_MS,
+    FFT_SIZE, SAVGOL_WINDOW, PLAYBACK_SPEED, LIVE_SOURCE, LIVE_REVERSE_SECONDS,
+    SESSION_MAX_TRACKS
 )
+from visualization import prepare_waveform_samples, get_render_backend, EnvelopePyramid
+from spectrogram import Spectrogram, SpectrogramCache, compute_spectrogram
+from metering import MeterTimeline, compute_meter, RMS, TRUE_PEAK, MOMENTARY
+from audio_cache import DecodedAudioCache
+from playback import PlaybackClock, FrameScheduler
+from workers import JobRunner
 from audio_processor import AudioProcessor
+from live_input import LiveCapture, LiveEnvelope, LiveSpectrum, create_input_source
+from session import Session
+from startup import StartupProfile, load_module, start_preload
+
+
+def mixer():
+    """pygame.mixer, imported on first use (preloaded after the window shows)"""
+    return load_module('pygame.mixer')
 
 
 class OscilloscopeApp(QMainWindow):
@@ -35,30 +46,80 @@ class OscilloscopeApp(QMainWindow):
     def __init__(self):
         super().__init__()
 
+        # Decoded audio cache (re-opened files are memory-mapped, not decoded)
+        self.audio_cache = DecodedAudioCache() if CACHE_ENABLED else None
+
         # Audio processor
         self.processor = AudioProcessor()
 
-        # Playback state
-        pygame.mixer.init()
+        # Background jobs (decode, reverse, envelope, spectrum)
+        self.jobs = JobRunner(parent=self)
+        self.jobs.progress.connect(self.on_job_progress)
+
+        # Loaded tracks; PCM and analysis are shared per file (A/B overlay)
+        self.session = Session()
+
+        # Min/max envelope pyramids of the active track (built once per file)
+        self.forward_envelope = None
+        self.envelope = None
+
+        # Full-file spectrograms (CH2 follows the playhead by lookup)
+        self.spectrogram_cache = SpectrogramCache()
+        self.spectrogram = None
+
+        # Level timeline of the active track (status bar meter by lookup)
+        self.meter = None
+
+        # Playback state (mixer is opened on first play, in the file's format)
         self.is_playing = False
         self.is_paused = False
-        self.temp_audio_file = None
-        self.playback_start_time = 0
+        self.sound = None
+        self.channel = None
+        self.playback_speed = PLAYBACK_SPEED
+        # Time-stretched chunks still to be queued (speed != 1.0)
+        self.stream_chunks = None
         self.playback_position = 0
-
-        # Animation timer
+        # pygame Sound has no position query: the clock counts time since
+        # play (pause-aware), bounded by the audio queued to the mixer
+        self.playback_clock = PlaybackClock()
+
+        # Live input (ring buffer capture feeding the same animators)
+        self.live = None
+        self.live_envelope = None
+        self.live_spectrum = None
+
+        # Animation timer (interval adapted per frame by the scheduler)
+        self.frame_scheduler = FrameScheduler(
+            min_interval_ms=self.display_frame_interval(),
+            max_interval_ms=ANIMATION_INTERVAL_MS
+        )
         self.animation_timer = QTimer()
+        self.animation_timer.setTimerType(Qt.PreciseTimer)
         self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_timer.setInterval(ANIMATION_INTERVAL_MS)
+        self.animation_timer.setInterval(self.frame_scheduler.timer_interval)
+
+        # Scope render backend (pyqtgraph/OpenGL when available, else Matplotlib)
+        self.render_backend = get_render_backend()
 
-        # Waveform animator (initialized after UI)
+        # Waveform/spectrum animators (initialized after UI)
         self.waveform_animator = None
+        self.spectrum_animator = None
 
         self.init_ui()
         self.apply_stylesheet()
 
         # Initialize waveform animator after canvas is created
-        self.waveform_animator = WaveformAnimator(self.waveform_canvas)
+        self.waveform_animator = self.render_backend.waveform_animator(self.waveform_canvas)
+        self.spectrum_animator = self.render_backend.spectrum_animator(self.spectrum_canvas)
+
+    @staticmethod
+    def display_frame_interval():
+        """Frame interval (ms) matching the primary display refresh rate"""
+        screen = QApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 0
+        if refresh_rate > 0:
+            return max(1000.0 / refresh_rate, 1.0)
+        return ANIMATION_MIN_INTERVAL_MS
 
     def init_ui(self):
         """Initialize UI"""
@@ -136,7 +197,18 @@ class OscilloscopeApp(QMainWindow):
         load_btn.setFont(QFont('Courier New', 17, QFont.Bold))
         load_btn.setFixedHeight(Layout.BUTTON_HEIGHT)
         load_btn.clicked.connect(self.load_file)
-        file_layout.addWidget(load_btn)
+
+        self.live_btn = QPushButton('◉ LIVE')
+        self.live_btn.setObjectName("loadButton")
+        self.live_btn.setFont(QFont('Courier New', 17, QFont.Bold))
+        self.live_btn.setFixedHeight(Layout.BUTTON_HEIGHT)
+        self.live_btn.clicked.connect(self.toggle_live)
+
+        input_layout = QHBoxLayout()
+        input_layout.setSpacing(9)
+        input_layout.addWidget(load_btn, stretch=3)
+        input_layout.addWidget(self.live_btn, stretch=2)
+        file_layout.addLayout(input_layout)
 
         file_section.setLayout(file_layout)
         panel_layout.addWidget(file_section)
@@ -247,6 +319,21 @@ class OscilloscopeApp(QMainWindow):
         panel_layout = QVBoxLayout(panel)
         panel_layout.setSpacing(10)
 
+        # Session tracks (active one green, others overlaid in their color)
+        track_bar = QHBoxLayout()
+        track_bar.setSpacing(9)
+        self.track_buttons = []
+        for index in range(SESSION_MAX_TRACKS):
+            button = QPushButton()
+            button.setObjectName("trackButton")
+            button.setFont(QFont('Courier New', 13, QFont.Bold))
+            button.setFixedHeight(Layout.BUTTON_HEIGHT_SMALL)
+            button.clicked.connect(lambda _, index=index: self.select_track(index))
+            button.hide()
+            track_bar.addWidget(button)
+            self.track_buttons.append(button)
+        panel_layout.addLayout(track_bar)
+
         # CH1 - Waveform
         ch1_label = QLabel('CH1: TIME DOMAIN WAVEFORM')
         ch1_label.setObjectName("channelLabel")
@@ -254,8 +341,7 @@ class OscilloscopeApp(QMainWindow):
         ch1_label.setFont(QFont('Courier New', 17, QFont.Bold))
         panel_layout.addWidget(ch1_label)
 
-        self.waveform_canvas = MplCanvas(self, width=Layout.CANVAS_WIDTH, height=Layout.CANVAS_HEIGHT)
-        style_scope_axis(self.waveform_canvas.axes, 'TIME (ms)', 'AMPLITUDE (V)')
+        self.waveform_canvas = self.render_backend.create_canvas(self, 'waveform')
         panel_layout.addWidget(self.waveform_canvas)
 
         # CH2 - Spectrum
@@ -265,8 +351,7 @@ class OscilloscopeApp(QMainWindow):
         ch2_label.setFont(QFont('Courier New', 17, QFont.Bold))
         panel_layout.addWidget(ch2_label)
 
-        self.spectrum_canvas = MplCanvas(self, width=Layout.CANVAS_WIDTH, height=Layout.CANVAS_HEIGHT)
-        style_scope_axis(self.spectrum_canvas.axes, 'FREQUENCY (Hz)', 'MAGNITUDE (dB)')
+        self.spectrum_canvas = self.render_backend.create_canvas(self, 'spectrum')
         panel_layout.addWidget(self.spectrum_canvas)
 
         layout.addWidget(panel, stretch=1)
@@ -285,6 +370,13 @@ class OscilloscopeApp(QMainWindow):
 
         status_layout.addStretch()
 
+        self.level_label = QLabel('')
+        self.level_label.setObjectName("levelLabel")
+        self.level_label.setFont(QFont('Courier New', 15, QFont.Bold))
+        status_layout.addWidget(self.level_label)
+
+        status_layout.addSpacing(20)
+
         self.time_label = QLabel('00:00.000')
         self.time_label.setObjectName("timeLabel")
         self.time_label.setFont(QFont('Courier New', 17, QFont.Bold))
@@ -327,102 +419,399 @@ class OscilloscopeApp(QMainWindow):
         )
 
         if file_path:
-            try:
-                self.update_status("LOADING SIGNAL...", Colors.YELLOW)
-                self.processor.load_audio(file_path)
+            # A file already open in the session is shared, not decoded again.
+            # Jobs of other tracks keep running: their analysis is still used
+            # (releasing a file's shared audio cancels its own jobs).
+            shared = self.session.shared(file_path)
+            if shared is not None:
+                self.on_load_complete(shared.processor)
+                return
+
+            self.update_status("LOADING SIGNAL...", Colors.YELLOW)
+            self.jobs.submit(
+                'DECODING', self.decode_job, file_path,
+                on_result=self.on_load_complete,
+                on_error=self.on_load_error
+            )
+
+    def decode_job(self, job, file_path):
+        """Worker: decode into a fresh processor (swapped in on completion)"""
+        processor = AudioProcessor(cache=self.audio_cache)
+        processor.load_audio(file_path)
+        return processor
+
+    def envelope_job(self, job, processor):
+        """Worker: envelope pyramid, from the disk cache when available"""
+        def build():
+            return prepare_waveform_samples(processor.planar, processor.channels, progress=job.progress)
+
+        if self.audio_cache is None:
+            return build()
+        return self.audio_cache.get_or_build(
+            processor.cache_key, 'envelope', build,
+            EnvelopePyramid.to_arrays, EnvelopePyramid.from_arrays
+        )
+
+    def spectrum_job(self, job, processor):
+        """Worker: full-file spectrogram (memory LRU, then disk cache, then STFT)"""
+        spectrogram = self.spectrogram_cache.get(processor.file_path)
+        if spectrogram is not None:
+            return spectrogram
+
+        def build():
+            # Frames go to a temporary memmap: the built spectrogram is what
+            # this session keeps, with or without the disk cache
+            return compute_spectrogram(
+                processor.planar, processor.sample_rate, progress=job.progress, on_disk=True
+            )
+
+        if self.audio_cache is None:
+            spectrogram = build()
+        else:
+            spectrogram = self.audio_cache.get_or_build(
+                processor.cache_key, 'spectrogram', build,
+                Spectrogram.to_arrays, Spectrogram.from_arrays
+            )
+        if spectrogram is not None:
+            self.spectrogram_cache.put(processor.file_path, spectrogram)
+        return spectrogram
+
+    def meter_job(self, job, processor):
+        """Worker: level timeline (RMS / true peak / loudness), disk cache when available"""
+        def build():
+            return compute_meter(processor.planar, processor.sample_rate, progress=job.progress)
+
+        if self.audio_cache is None:
+            return build()
+        return self.audio_cache.get_or_build(
+            processor.cache_key, 'meter', build,
+            MeterTimeline.to_arrays, MeterTimeline.from_arrays
+        )
+
+    def on_load_complete(self, processor):
+        """Decode finished: add a session track and start envelope/spectrum jobs"""
+        self.stop_live()
+        self.stop_playback()
+        track = self.session.add(processor)
+        self.show_track(track)
+        self.analyze(track.audio)
+
+    def analyze(self, audio):
+        """
+        Start the envelope/spectrum/meter jobs a shared file still lacks
+
+        The jobs are grouped under the audio's context: releasing the audio
+        (memory budget, closed track) cancels them.
+        """
+        if audio.context is None:
+            audio.context = self.jobs.group('ANALYSIS')
+        if audio.envelope is None and 'envelope' not in audio.analyzing:
+            audio.analyzing.add('envelope')
+            self.jobs.submit(
+                'ENVELOPE', self.envelope_job, audio.processor,
+                on_result=lambda envelope: self.on_envelope_ready(audio, envelope),
+                on_error=lambda error: self.on_analysis_error(error, audio, 'envelope'),
+                parent=audio.context
+            )
+        if audio.spectrogram is None and 'spectrogram' not in audio.analyzing:
+            audio.analyzing.add('spectrogram')
+            self.jobs.submit(
+                'SPECTRUM', self.spectrum_job, audio.processor,
+                on_result=lambda spectrogram: self.on_spectrum_ready(audio, spectrogram),
+                on_error=lambda error: self.on_analysis_error(error, audio, 'spectrogram'),
+                parent=audio.context
+            )
+        if audio.meter is None and 'meter' not in audio.analyzing:
+            audio.analyzing.add('meter')
+            self.jobs.submit(
+                'METERING', self.meter_job, audio.processor,
+                on_result=lambda meter: self.on_meter_ready(audio, meter),
+                on_error=lambda error: self.on_analysis_error(error, audio, 'meter'),
+                parent=audio.context
+            )
+
+        if audio.envelope is None or audio.spectrogram is None:
+            self.update_status("SIGNAL DECODED - ANALYZING...", Colors.YELLOW)
+        else:
+            self.update_status("SIGNAL ACQUIRED")
+
+    def show_track(self, track):
+        """Display a session track (shared data only: no decode, no analysis)"""
+        self.processor = track.processor
+        self.forward_envelope = track.audio.envelope
+        self.envelope = track.envelope
+        self.spectrogram = track.spectrogram
+        self.meter = track.meter
+        self.waveform_animator.invalidate_cache()
+        self.spectrum_animator.invalidate_cache()
+
+        self.file_label.setText(track.name)
+        self.file_label.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
+        if track.is_reversed:
+            self.reverse_status.setText('● REVERSED')
+            self.reverse_status.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
+        else:
+            self.reverse_status.setText('⚫ STANDBY')
+            self.reverse_status.setStyleSheet(f'color: {Colors.GREEN_MEDIUM};')
+        self.update_parameters()
+        self.update_levels()
+        self.update_track_bar()
+        self.draw_waveform()
+        self.draw_spectrum()
 
-                filename = os.path.basename(file_path)
-                self.file_label.setText(filename)
-                self.file_label.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
+    def select_track(self, index):
+        """Track button: make that track the active one"""
+        if index >= len(self.session.tracks):
+            return
+        track = self.session.tracks[index]
+        if track is self.session.active:
+            return
+
+        self.stop_live()
+        self.stop_playback()
+        self.session.activate(track)
+
+        if not track.is_loaded:
+            # Released under the memory budget: reopen (memory-mapped from
+            # the decoded audio cache when it is enabled). Until then there
+            # is no signal, so play/reverse cannot act on the previous track.
+            self.processor = AudioProcessor()
+            self.forward_envelope = self.envelope = None
+            self.spectrogram = self.meter = None
+            self.waveform_animator.invalidate_cache()
+            self.spectrum_animator.invalidate_cache()
+            self.file_label.setText(track.name)
+            self.update_levels()
+            self.update_track_bar()
+            self.draw_waveform()
+            self.draw_spectrum()
+            self.update_status("RELOADING SIGNAL...", Colors.YELLOW)
+            self.jobs.submit(
+                'LOADING', self.decode_job, track.file_path,
+                on_result=lambda processor: self.on_track_reloaded(track, processor),
+                on_error=self.on_load_error
+            )
+            return
+
+        self.show_track(track)
+        self.update_status("SIGNAL ACQUIRED")
+
+    def on_track_reloaded(self, track, processor):
+        """Released track reopened"""
+        if track not in self.session.tracks:
+            return
+        self.session.attach(track, processor)
+        if track is self.session.active:
+            self.show_track(track)
+            self.analyze(track.audio)
+        else:
+            self.update_track_bar()
+
+    def update_track_bar(self):
+        """Track buttons: direction, name, drawing color"""
+        tracks = self.session.tracks
+        for index, button in enumerate(self.track_buttons):
+            if index >= len(tracks):
+                button.hide()
+                continue
+
+            track = tracks[index]
+            color = self.session.color_of(track)
+            background = Colors.GREEN_DARK if track is self.session.active else Colors.BLACK
+            direction = '◀' if track.is_reversed else '▶'
+            button.setText(f"{direction} {track.name[:22]}")
+            button.setToolTip(track.file_path)
+            button.setStyleSheet(
+                f'color: {color}; border-color: {color}; background-color: {background}; padding: 2px;'
+            )
+            button.show()
+
+    def on_load_error(self, error):
+        """Decode failed: show the cause"""
+        error_msg = str(error)
+        # ffmpeg 관련 에러 체크 (missing binaries also raise FileNotFoundError)
+        if 'ffmpeg' in error_msg.lower() or 'ffprobe' in error_msg.lower():
+            self.update_status("ERROR: FFMPEG NOT FOUND", Colors.RED)
+            self.file_label.setText("INSTALL FFMPEG")
+        elif isinstance(error, FileNotFoundError):
+            self.update_status("ERROR: FILE NOT FOUND", Colors.RED)
+            self.file_label.setText("FILE NOT FOUND")
+        elif 'codec' in error_msg.lower() or 'decode' in error_msg.lower():
+            self.update_status("ERROR: UNSUPPORTED CODEC", Colors.RED)
+            self.file_label.setText("CODEC ERROR")
+        else:
+            self.update_status(f"ERROR: {error_msg[:30]}", Colors.RED)
+            self.file_label.setText("LOAD FAILED")
+        self.file_label.setStyleSheet(f'color: {Colors.RED};')
+
+    def on_analysis_error(self, error, audio, kind):
+        """Envelope/spectrum/meter job failed"""
+        audio.analyzing.discard(kind)
+        self.update_status(f"ERROR: {str(error)[:30]}", Colors.RED)
+
+    def on_job_progress(self, label, fraction):
+        """Progress from a background job"""
+        self.update_status(f"{label} {fraction * 100:3.0f}%", Colors.YELLOW)
+
+    def on_envelope_ready(self, audio, envelope):
+        """Envelope pyramid built (for the active track or an overlay)"""
+        audio.analyzing.discard('envelope')
+        if not audio.is_loaded:
+            return  # Released meanwhile
+
+        audio.envelope = envelope
+        self.session.trim()
+        active = self.session.active
+        if active is not None and active.audio is audio:
+            self.forward_envelope = envelope
+            self.envelope = active.envelope
+        self.waveform_animator.invalidate_cache()
+        if not self.is_playing and self.live is None:
+            self.draw_waveform()
+
+    def on_spectrum_ready(self, audio, spectrogram):
+        """Spectrogram computed (or taken from cache)"""
+        audio.analyzing.discard('spectrogram')
+        if not audio.is_loaded:
+            return
+
+        audio.spectrogram = spectrogram
+        self.session.trim()
+        active = self.session.active
+        is_active = active is not None and active.audio is audio
+        if is_active:
+            self.spectrogram = spectrogram
+        self.spectrum_animator.invalidate_cache()
+        if not self.is_playing and self.live is None:
+            self.draw_spectrum()
+            if is_active:
                 self.update_status("SIGNAL ACQUIRED")
 
-                self.update_parameters()
-                self.draw_waveform()
-                self.draw_spectrum()
-
-            except FileNotFoundError:
-                self.update_status("ERROR: FILE NOT FOUND", Colors.RED)
-                self.file_label.setText("FILE NOT FOUND")
-                self.file_label.setStyleSheet(f'color: {Colors.RED};')
-            except Exception as e:
-                error_msg = str(e)
-                # ffmpeg 관련 에러 체크
-                if 'ffmpeg' in error_msg.lower() or 'ffprobe' in error_msg.lower():
-                    self.update_status("ERROR: FFMPEG NOT FOUND", Colors.RED)
-                    self.file_label.setText("INSTALL FFMPEG")
-                elif 'codec' in error_msg.lower() or 'decode' in error_msg.lower():
-                    self.update_status("ERROR: UNSUPPORTED CODEC", Colors.RED)
-                    self.file_label.setText("CODEC ERROR")
-                else:
-                    self.update_status(f"ERROR: {error_msg[:30]}", Colors.RED)
-                    self.file_label.setText("LOAD FAILED")
-                self.file_label.setStyleSheet(f'color: {Colors.RED};')
+    def on_meter_ready(self, audio, meter):
+        """Level timeline computed (or taken from cache)"""
+        audio.analyzing.discard('meter')
+        if not audio.is_loaded:
+            return
+
+        audio.meter = meter
+        self.session.trim()
+        active = self.session.active
+        if active is not None and active.audio is audio:
+            self.meter = meter
+            if not self.is_playing and self.live is None:
+                self.update_levels()
+                if audio.envelope is not None and audio.spectrogram is not None:
+                    self.update_status("SIGNAL ACQUIRED")
 
     def reverse_audio(self):
         """Reverse audio"""
-        if self.processor.audio is None:
+        if self.live is not None:
+            self.reverse_live()
+            return
+
+        if not self.processor.is_loaded:
             self.update_status("ERROR: NO SIGNAL", Colors.RED)
             return
 
-        try:
-            self.update_status("PROCESSING...", Colors.YELLOW)
-            self.reverse_status.setText('⚫ PROCESSING')
-            self.reverse_status.setStyleSheet(f'color: {Colors.YELLOW};')
+        self.update_status("PROCESSING...", Colors.YELLOW)
+        self.reverse_status.setText('⚫ PROCESSING')
+        self.reverse_status.setStyleSheet(f'color: {Colors.YELLOW};')
 
-            def reverse_thread():
-                self.processor.reverse_audio()
-                QTimer.singleShot(0, self.on_reverse_complete)
+        processor = self.processor
+        self.jobs.submit(
+            'REVERSING',
+            lambda job: processor.reverse_audio(),
+            on_result=lambda _: self.on_reverse_complete(processor),
+            on_error=lambda error: self.on_reverse_error(error, processor)
+        )
 
-            thread = threading.Thread(target=reverse_thread, daemon=True)
-            thread.start()
+    def reverse_live(self):
+        """Play the last LIVE_REVERSE_SECONDS of live input backwards, right away"""
+        started = time.perf_counter()
+        try:
+            # Reversed view over the capture ring, converted once for the mixer
+            buffer = self.live.reversed_pcm(LIVE_REVERSE_SECONDS)
+            if len(buffer) == 0:
+                self.update_status("ERROR: NO LIVE SIGNAL YET", Colors.RED)
+                return
 
+            self.stop_sound()
+            self.ensure_mixer(self.live.sample_rate, buffer.shape[1])
+            self.sound = mixer().Sound(buffer=buffer)
+            self.channel = self.sound.play()
         except Exception as e:
-            self.update_status(f"ERROR: {str(e)}", Colors.RED)
-            self.reverse_status.setText('⚫ FAILED')
-            self.reverse_status.setStyleSheet(f'color: {Colors.RED};')
+            self.on_reverse_error(e)
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self.reverse_status.setText(f'● REVERSED LAST {len(buffer) / self.live.sample_rate:.1f}s')
+        self.reverse_status.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
+        self.update_status(f"LIVE REVERSE ({elapsed_ms:.0f} ms)", Colors.YELLOW)
 
-    def on_reverse_complete(self):
-        """Reverse complete"""
+    def on_reverse_error(self, error, processor=None):
+        """Reverse failed (ignored when another track is active by now)"""
+        if processor is not None and processor is not self.processor:
+            return
+        self.update_status(f"ERROR: {str(error)}", Colors.RED)
+        self.reverse_status.setText('⚫ FAILED')
+        self.reverse_status.setStyleSheet(f'color: {Colors.RED};')
+
+    def on_reverse_complete(self, processor):
+        """Reverse of processor complete (the track keeps its new direction)"""
+        if processor is not self.processor:
+            # Another track was activated meanwhile; its display is current
+            self.update_track_bar()
+            return
         self.reverse_status.setText('● REVERSED')
         self.reverse_status.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
         self.update_status("SIGNAL REVERSED")
+        # Reversed envelope is a view over the forward pyramid
+        if self.forward_envelope is not None:
+            self.envelope = self.forward_envelope.reversed()
+        self.update_track_bar()
         # Invalidate animation cache (audio data changed)
         self.waveform_animator.invalidate_cache()
+        self.spectrum_animator.invalidate_cache()
         self.draw_waveform()
         self.draw_spectrum()
 
     def play_audio(self):
         """Play audio"""
-        if self.processor.reversed_audio is None:
+        if not self.processor.is_reversed:
             self.update_status("ERROR: NO REVERSED SIGNAL", Colors.RED)
             return
 
+        self.stop_live()
+
         try:
             if self.is_paused:
-                pygame.mixer.music.unpause()
+                self.channel.unpause()
+                self.playback_clock.resume()
                 self.is_paused = False
+                self.animation_timer.start()
                 self.update_status("PLAYBACK ACTIVE")
             else:
-                audio_to_play = self.processor.change_speed(1.0)
+                self.stop_sound()
 
-                if self.temp_audio_file:
-                    try:
-                        os.remove(self.temp_audio_file)
-                    except OSError:
-                        pass  # File already deleted or in use
-
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                self.temp_audio_file = temp_file.name
-                temp_file.close()
+                if self.playback_speed == 1.0:
+                    # In-memory playback: no resample at 1.0x, no temp WAV
+                    buffer = self.processor.get_playback_buffer(1.0)
+                else:
+                    # Stretched playback starts on the first chunk; the rest
+                    # is stretched and queued while it plays
+                    self.stream_chunks = self.processor.iter_playback_chunks(self.playback_speed)
+                    buffer = next(self.stream_chunks)
 
-                audio_to_play.export(self.temp_audio_file, format='wav')
-                pygame.mixer.music.load(self.temp_audio_file)
-                pygame.mixer.music.play()
+                self.ensure_mixer(self.processor.sample_rate, buffer.shape[1])
+                self.sound = mixer().Sound(buffer=buffer)
+                self.channel = self.sound.play()
+                self.playback_clock.start(queued_ms=self.buffer_ms(buffer))
+                self.feed_stream()
 
                 self.is_playing = True
-                self.playback_start_time = pygame.time.get_ticks()
                 self.playback_position = 0
-                self.animation_timer.start()
+                self.frame_scheduler.reset()
+                self.animation_timer.start(self.frame_scheduler.timer_interval)
                 self.update_status("PLAYING")
 
         except Exception as e:
@@ -431,48 +820,236 @@ class OscilloscopeApp(QMainWindow):
     def pause_audio(self):
         """Pause"""
         if self.is_playing and not self.is_paused:
-            pygame.mixer.music.pause()
+            self.channel.pause()
+            self.playback_clock.pause()
             self.is_paused = True
             self.animation_timer.stop()
             self.update_status("PAUSED", Colors.YELLOW)
 
-    def stop_audio(self):
-        """Stop"""
-        pygame.mixer.music.stop()
+    def ensure_mixer(self, sample_rate, channels):
+        """(Re)initialize the mixer to the buffer format so Sound plays it unconverted"""
+        pygame_mixer = mixer()
+        if pygame_mixer.get_init() != (sample_rate, -16, channels):
+            pygame_mixer.quit()
+            pygame_mixer.init(frequency=sample_rate, size=-16, channels=channels)
+
+    def feed_stream(self):
+        """Queue the next time-stretched chunk once the channel queue is free"""
+        if self.stream_chunks is None or self.channel is None:
+            return
+        if self.channel.get_busy() and self.channel.get_queue() is not None:
+            return
+
+        chunk = next(self.stream_chunks, None)
+        if chunk is None:
+            self.stream_chunks = None
+            return
+
+        sound = mixer().Sound(buffer=chunk)
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+            self.playback_clock.queue(self.buffer_ms(chunk))
+        else:
+            # Starved: the playhead held at the end of the last chunk
+            self.channel.play(sound)
+            self.playback_clock.queue(self.buffer_ms(chunk), restart=True)
+
+    def buffer_ms(self, buffer):
+        """Playing time of a mixer buffer (n_frames, channels) at the file's rate"""
+        return 1000.0 * len(buffer) / self.processor.sample_rate
+
+    def stop_sound(self):
+        """Stop and release the in-memory sound"""
+        if self.channel is not None:
+            self.channel.stop()
+        self.channel = None
+        self.sound = None
+        self.stream_chunks = None
+
+    def stop_playback(self):
+        """Stop sound, clock and animation without redrawing"""
+        was_playing = self.is_playing
+        self.stop_sound()
         self.is_playing = False
         self.is_paused = False
         self.animation_timer.stop()
+        self.playback_clock.stop()
         self.playback_position = 0
+        if was_playing:
+            self.report_frame_stats()
+
+    def stop_audio(self):
+        """Stop"""
+        self.stop_playback()
         # Invalidate animation cache
         self.waveform_animator.invalidate_cache()
+        self.spectrum_animator.invalidate_cache()
         self.draw_waveform()
         self.draw_spectrum()
+        self.update_levels()
         self.update_status("STOPPED", Colors.RED)
 
+    def toggle_live(self):
+        """LIVE INPUT button"""
+        if self.live is None:
+            self.start_live()
+        else:
+            self.stop_live()
+            self.restore_display()
+            self.update_status("LIVE INPUT STOPPED", Colors.RED)
+
+    def start_live(self, source=LIVE_SOURCE):
+        """Capture from the live source and drive both channels from it"""
+        self.stop_playback()
+
+        try:
+            capture = LiveCapture(create_input_source(source))
+            self.live_envelope = LiveEnvelope(capture)
+            self.live_spectrum = LiveSpectrum(capture)
+            capture.start()
+        except Exception as e:
+            self.live_envelope = None
+            self.live_spectrum = None
+            self.update_status(f"ERROR: {str(e)[:30]}", Colors.RED)
+            return
+
+        self.live = capture
+        # Open the mixer in the capture format now, so live reverse starts at once
+        try:
+            self.ensure_mixer(capture.sample_rate, capture.channels)
+        except Exception:
+            pass  # Reported on the first live reverse
+        self.waveform_animator.invalidate_cache()
+        self.spectrum_animator.invalidate_cache()
+
+        self.live_btn.setText('■ LIVE')
+        self.file_label.setText(f"LIVE: {capture.source.name}")
+        self.file_label.setStyleSheet(f'color: {Colors.YELLOW};')
+        self.level_label.setText('')
+        self.param_labels['Fs'][0].setText(f"{capture.sample_rate} {self.param_labels['Fs'][1]}")
+        self.param_labels['CH'][0].setText(f"{capture.channels} {self.param_labels['CH'][1]}")
+        self.update_status("LIVE INPUT", Colors.YELLOW)
+
+        self.frame_scheduler.reset()
+        self.animation_timer.start(self.frame_scheduler.timer_interval)
+
+    def stop_live(self):
+        """Stop capturing (the display is left as is)"""
+        if self.live is None:
+            return
+
+        self.animation_timer.stop()
+        self.live.stop()
+        self.live = None
+        self.live_envelope = None
+        self.live_spectrum = None
+        self.waveform_animator.invalidate_cache()
+        self.spectrum_animator.invalidate_cache()
+        self.live_btn.setText('◉ LIVE')
+        self.report_frame_stats()
+
+    def restore_display(self):
+        """Back to the loaded file after live input"""
+        if self.processor.is_loaded:
+            self.file_label.setText(os.path.basename(self.processor.file_path))
+            self.file_label.setStyleSheet(f'color: {Colors.GREEN_BRIGHT};')
+            self.update_parameters()
+            self.update_levels()
+        else:
+            self.file_label.setText('NO SIGNAL')
+            self.file_label.setStyleSheet(f'color: {Colors.GREEN_MEDIUM};')
+        self.time_label.setText('00:00.000')
+        self.draw_waveform()
+        self.draw_spectrum()
+
+    def update_live(self):
+        """Animation frame in live mode: newest window of the capture ring"""
+        self.frame_scheduler.begin_frame()
+
+        if not self.waveform_animator.is_prepared:
+            self.waveform_animator.prepare_cache(self.live_envelope)
+        if not self.spectrum_animator.is_prepared:
+            self.spectrum_animator.prepare_cache(self.live_spectrum)
+
+        # The envelope spans exactly one window, so position 0 shows all of it
+        self.waveform_animator.update(0, WINDOW_SIZE_MS)
+        self.spectrum_animator.update(0)
+
+        latency_ms = self.live.latency_ms()
+        if latency_ms is not None:
+            self.time_label.setText(f"LIVE {latency_ms:5.1f} ms")
+
+        interval_ms = self.frame_scheduler.end_frame()
+        if interval_ms != self.animation_timer.interval():
+            self.animation_timer.setInterval(interval_ms)
+
     def update_animation(self):
         """Update animation during playback"""
+        if self.live is not None:
+            self.update_live()
+            return
+
         if not self.is_playing or self.is_paused:
             return
 
+        self.feed_stream()
+
         # Check if still playing
-        if not pygame.mixer.music.get_busy():
+        if self.channel is None or not self.channel.get_busy():
             self.stop_audio()
             return
 
-        # Just increment position for visual effect
-        duration_ms = self.processor.duration_ms if self.processor.duration_ms else 1000
-        self.playback_position += PLAYBACK_STEP_MS
+        self.frame_scheduler.begin_frame()
 
-        if self.playback_position >= duration_ms:
-            self.playback_position = 0  # Loop back
+        # Position from the playback clock (immune to dropped ticks, held
+        # while a stretched stream is starved), mapped back to source time
+        # when playing time-stretched
+        duration_ms = self.processor.duration_ms if self.processor.duration_ms else 1000
+        self.playback_position = min(
+            self.playback_clock.position_ms() * self.playback_speed, duration_ms
+        )
 
         # Update time display
         current_time = self.playback_position / 1000.0
         total_time = duration_ms / 1000.0
         self.time_label.setText(f"{current_time:05.2f} / {total_time:05.2f}")
+        self.update_levels(self.playback_position)
 
         # Redraw waveform with moving window effect
         self.draw_waveform_animated()
+        self.draw_spectrum_animated()
+
+        interval_ms = self.frame_scheduler.end_frame()
+        if interval_ms != self.animation_timer.interval():
+            self.animation_timer.setInterval(interval_ms)
+
+    def report_frame_stats(self):
+        """Expose frame counters of the last playback on the time display"""
+        stats = self.frame_scheduler.stats()
+        self.time_label.setToolTip(
+            f"{stats['fps']:.1f} fps | {stats['rendered']} rendered | "
+            f"{stats['dropped']} dropped | {stats['render_ms']:.1f} ms/frame"
+        )
+
+    def update_levels(self, position_ms=None):
+        """
+        Status bar meter: levels at position_ms during playback (one row of
+        the precomputed timeline), the whole-file summary otherwise
+        """
+        if self.meter is None:
+            self.level_label.setText('')
+            return
+
+        if position_ms is None:
+            self.level_label.setText(
+                f"INT {self.meter.integrated_lufs:6.1f} LUFS | TP {self.meter.true_peak_db:5.1f} dBTP"
+            )
+            return
+
+        levels = self.meter.at(position_ms, self.processor.is_reversed)
+        self.level_label.setText(
+            f"RMS {levels[RMS]:6.1f} | TP {levels[TRUE_PEAK]:5.1f} | M {levels[MOMENTARY]:6.1f} LUFS"
+        )
 
     def update_parameters(self):
         """Update parameters"""
@@ -487,22 +1064,20 @@ class OscilloscopeApp(QMainWindow):
 
     def draw_waveform(self):
         """Draw waveform using visualization module"""
-        audio_data = self.processor.get_audio_data()
-        samples = prepare_waveform_samples(audio_data, self.processor.channels)
-        draw_waveform_static(
+        self.render_backend.draw_waveform_static(
             self.waveform_canvas,
-            samples,
+            self.envelope,
             self.processor.duration_ms,
             self.playback_position,
-            self.is_playing
+            self.is_playing,
+            self.session.overlays()
         )
 
     def draw_waveform_animated(self):
         """Draw waveform with blitting using WaveformAnimator"""
         # Initialize animator cache if needed
-        if self.waveform_animator._background is None:
-            audio_data = self.processor.get_audio_data()
-            if not self.waveform_animator.prepare_cache(audio_data):
+        if not self.waveform_animator.is_prepared:
+            if not self.waveform_animator.prepare_cache(self.envelope, self.session.overlays()):
                 return
 
         # Update animation frame
@@ -512,28 +1087,72 @@ class OscilloscopeApp(QMainWindow):
         )
 
     def draw_spectrum(self):
-        """Draw spectrum using visualization module"""
-        audio_data = self.processor.get_audio_data()
-        frequencies, magnitude_db = compute_spectrum(audio_data, self.processor.sample_rate)
-        draw_spectrum_static(
+        """Draw full-file average spectrum using visualization module"""
+        if self.spectrogram is None:
+            frequencies, magnitude_db = None, None
+        else:
+            frequencies, magnitude_db = self.spectrogram.frequencies, self.spectrogram.average
+        self.render_backend.draw_spectrum_static(
             self.spectrum_canvas,
             frequencies,
             magnitude_db,
-            self.processor.sample_rate
+            self.processor.sample_rate,
+            self.session.overlays()
+        )
+
+    def draw_spectrum_animated(self):
+        """Draw spectrum at the playhead with blitting using SpectrumAnimator"""
+        # Initialize animator cache if needed
+        if not self.spectrum_animator.is_prepared:
+            if not self.spectrum_animator.prepare_cache(self.spectrogram, self.session.overlays()):
+                return
+
+        # Update animation frame
+        self.spectrum_animator.update(
+            self.playback_position,
+            self.processor.is_reversed
         )
 
     def closeEvent(self, event):
         """Cleanup on close"""
-        if self.temp_audio_file and os.path.exists(self.temp_audio_file):
-            try:
-                os.remove(self.temp_audio_file)
-            except OSError:
-                pass  # File in use or permission denied
+        self.jobs.shutdown()
+        self.stop_live()
+        self.stop_sound()
         event.accept()
 
 
 if __name__ == '__main__':
+    # --profile-startup: print startup timings once preloading is done, then quit
+    profile = StartupProfile(_STARTED)
+    profile.mark('modules imported')
+
     app = QApplication(sys.argv)
     window = OscilloscopeApp()
+    profile.mark('window created')
     window.show()
+    app.processEvents()
+    profile.mark('window shown')
+    profile.check_deferred()
+
+    # Heavy modules load while the window is already on screen
+    preload = start_preload(profile)
+
+    # --live [mic|synthetic|FILE]: start in live input mode
+    if '--live' in sys.argv:
+        index = sys.argv.index('--live')
+        source = sys.argv[index + 1] if index + 1 < len(sys.argv) else ''
+        if not source or source.startswith('--'):
+            source = LIVE_SOURCE
+        QTimer.singleShot(0, lambda: window.start_live(source))
+
+    if '--profile-startup' in sys.argv:
+        def report_startup():
+            profile.mark('event loop running')
+            preload.join()
+            profile.mark('preload finished')
+            print(profile.report())
+            app.quit()
+
+        QTimer.singleShot(0, report_startup)
+
     sys.exit(app.exec_())
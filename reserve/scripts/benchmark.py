@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+렌더링 벤치마크 (헤드리스)
+- Agg 오프스크린 캔버스 + 합성 신호 (1초 ~ 60분)
+- prepare_waveform_samples / compute_spectrum / draw_waveform_static /
+  WaveformAnimator.update 의 지연 시간 백분위수와 메모리 측정
+  (분석 입력은 앱과 같은 정규화 float32 planar)
+- 기준 결과(--baseline) 대비 임계값 이상 느려지면 실패 (exit 1)
+
+사용 예:
+    python scripts/benchmark.py --save-baseline bench_baseline.json
+    python scripts/benchmark.py --baseline bench_baseline.json --threshold 0.25
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# reserve/ 를 모듈 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from config import Colors, Layout
+from audio_processor import normalize_pcm
+from visualization import (
+    prepare_waveform_samples, compute_spectrum, draw_waveform_static, WaveformAnimator
+)
+
+SAMPLE_RATE = 44100
+DEFAULT_DURATIONS = [1, 10, 60, 600, 3600]
+GENERATE_CHUNK = 1 << 20
+
+# 측정 항목 (리포트 순서)
+STAGES = ['prepare_waveform_samples', 'compute_spectrum', 'draw_waveform_static', 'WaveformAnimator.update']
+
+
+class OffscreenCanvas(FigureCanvasAgg):
+    """MplCanvas와 같은 구성의 Agg 캔버스 (Qt 창 없음, blit은 버퍼 안에서 끝남)"""
+
+    def __init__(self, width=Layout.CANVAS_WIDTH, height=Layout.CANVAS_HEIGHT, dpi=Layout.CANVAS_DPI):
+        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor=Colors.BLACK)
+        self.axes = self.fig.add_subplot(111)
+        self.axes.set_facecolor(Colors.BLACK)
+        self.scope = None
+        super().__init__(self.fig)
+
+
+def make_signal(duration_s, sample_rate=SAMPLE_RATE, seed=0):
+    """
+    합성 테스트 신호 (int16 모노): 로그 처프 + 진폭 변조 + 노이즈
+
+    60분 신호도 float64 전체 사본 없이 청크 단위로 생성
+    """
+    n_samples = int(duration_s * sample_rate)
+    samples = np.empty(n_samples, dtype=np.int16)
+    rng = np.random.default_rng(seed)
+
+    f0, f1 = 50.0, 8000.0
+    rate = np.log(f1 / f0) / max(duration_s, 1e-9)
+    for start in range(0, n_samples, GENERATE_CHUNK):
+        t = np.arange(start, min(start + GENERATE_CHUNK, n_samples)) / sample_rate
+        phase = 2 * np.pi * f0 * (np.exp(rate * t) - 1) / rate
+        envelope = 0.6 + 0.3 * np.sin(2 * np.pi * 0.5 * t)
+        chunk = envelope * np.sin(phase) + 0.05 * rng.standard_normal(len(t))
+        samples[start:start + len(t)] = np.clip(chunk * 32767, -32768, 32767)
+
+    return samples
+
+
+def summarize(durations_s):
+    """호출별 소요 시간(초) → 밀리초 백분위수"""
+    ms = np.asarray(durations_s) * 1000.0
+    return {
+        'count': int(len(ms)),
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+    }
+
+
+def measure(fn, repeat, args_for=None, warmup=1):
+    """
+    fn을 repeat번 실행해 지연 시간과 메모리 피크 측정
+
+    측정 전 warmup번 실행은 기록하지 않음 (지연 import, 첫 그리기 캐시 등
+    1회성 비용이 p95/p99에 섞이지 않도록)
+
+    Args:
+        fn: 측정할 함수
+        repeat: 반복 횟수
+        args_for: 반복 i의 인자 튜플을 돌려주는 함수 (없으면 인자 없음)
+        warmup: 기록하지 않는 사전 실행 횟수
+
+    Returns:
+        tuple: (마지막 반환값, 요약 dict)
+    """
+    for i in range(warmup):
+        fn(*(args_for(i) if args_for else ()))
+
+    timings = []
+    result = None
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for i in range(repeat):
+        args = args_for(i) if args_for else ()
+        started = time.perf_counter()
+        result = fn(*args)
+        timings.append(time.perf_counter() - started)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    summary = summarize(timings)
+    summary['peak_mb'] = peak / 1024 ** 2
+    return result, summary
+
+
+def bench_duration(duration_s, frames, analysis_repeat):
+    """한 신호 길이에 대한 전체 측정"""
+    # 앱과 같은 입력: 정규화된 float32 planar (AudioProcessor.planar)
+    samples = normalize_pcm(make_signal(duration_s))
+    duration_ms = 1000.0 * samples.shape[1] / SAMPLE_RATE
+    results = {}
+
+    envelope, results['prepare_waveform_samples'] = measure(
+        lambda: prepare_waveform_samples(samples, 1), analysis_repeat
+    )
+    _, results['compute_spectrum'] = measure(
+        lambda: compute_spectrum(samples, SAMPLE_RATE), analysis_repeat
+    )
+
+    # 정적 다시 그리기 (정지/역재생 시)
+    canvas = OffscreenCanvas()
+    _, results['draw_waveform_static'] = measure(
+        lambda: draw_waveform_static(canvas, envelope, duration_ms), frames
+    )
+
+    # 재생 애니메이션: 파일 전체를 고르게 훑는 프레임
+    animator = WaveformAnimator(OffscreenCanvas())
+    animator.prepare_cache(envelope)
+    positions = np.linspace(0, duration_ms, frames, endpoint=False)
+    _, results['WaveformAnimator.update'] = measure(
+        animator.update, frames, lambda i: (positions[i], duration_ms)
+    )
+
+    return results
+
+
+def format_label(duration_s):
+    if duration_s >= 60:
+        return f"{duration_s / 60:g}min"
+    return f"{duration_s:g}s"
+
+
+def print_report(report):
+    print(f"{'signal':>8} {'stage':<26} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'peak MB':>9}")
+    print("-" * 84)
+    for label, stages in report['results'].items():
+        for stage in STAGES:
+            s = stages[stage]
+            print(f"{label:>8} {stage:<26} {s['p50_ms']:9.2f} {s['p95_ms']:9.2f} "
+                  f"{s['p99_ms']:9.2f} {s['max_ms']:9.2f} {s['peak_mb']:9.1f}")
+    print("-" * 84)
+    print("(ms, Agg 오프스크린)")
+
+
+def find_regressions(report, baseline, threshold):
+    """
+    기준 결과 대비 회귀 목록
+
+    p95 지연과 메모리 피크가 (1 + threshold)배를 넘으면 회귀.
+    1ms / 1MB 미만의 차이는 측정 노이즈로 보고 무시.
+    """
+    regressions = []
+    for label, stages in report['results'].items():
+        for stage, current in stages.items():
+            previous = baseline.get('results', {}).get(label, {}).get(stage)
+            if previous is None:
+                continue
+            for metric, floor in (('p95_ms', 1.0), ('peak_mb', 1.0)):
+                limit = previous[metric] * (1 + threshold)
+                if current[metric] > limit and current[metric] - previous[metric] > floor:
+                    regressions.append(
+                        f"{label} {stage} {metric}: {previous[metric]:.2f} → {current[metric]:.2f} "
+                        f"(+{(current[metric] / previous[metric] - 1) * 100:.0f}%)"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ASA-2000 렌더링 벤치마크 (헤드리스)')
+    parser.add_argument('--durations', '-d', type=float, nargs='+', default=DEFAULT_DURATIONS,
+                        help='합성 신호 길이(초) 목록 (기본: 1 10 60 600 3600)')
+    parser.add_argument('--frames', '-n', type=int, default=200, help='그리기 측정 프레임 수')
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='분석 단계 반복 횟수')
+    parser.add_argument('--output', '-o', help='결과 JSON 저장 경로')
+    parser.add_argument('--save-baseline', help='결과를 기준 파일로 저장')
+    parser.add_argument('--baseline', '-b', help='비교할 기준 JSON')
+    parser.add_argument('--threshold', '-t', type=float, default=0.25,
+                        help='허용 회귀 비율 (기본 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    report = {
+        'machine': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'frames': args.frames,
+        'results': {},
+    }
+
+    for duration_s in args.durations:
+        label = format_label(duration_s)
+        print(f"⏱️  {label} 신호 측정 중...", flush=True)
+        report['results'][label] = bench_duration(duration_s, args.frames, args.repeat)
+
+    print()
+    print_report(report)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"💾 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (임계값 {args.threshold * 100:.0f}%)")
+            for line in regressions:
+                print(f"   - {line}")
+            sys.exit(1)
+        print(f"\n✅ 기준 대비 회귀 없음 (임계값 {args.threshold * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Session Module for Reserve Audio Analyzer
+Several loaded tracks sharing decoded PCM and analysis under a memory budget
+"""
+
+import mmap
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from config import Colors, SESSION_MAX_TRACKS, SESSION_MEMORY_BUDGET
+from visualization import TrackOverlay
+
+
+def resident_bytes(array):
+    """Bytes an array keeps in process memory (0 when memory-mapped)"""
+    if array is None:
+        return 0
+
+    base = array
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return 0
+        base = getattr(base, 'base', None)
+    return array.nbytes
+
+
+class SharedAudio:
+    """
+    Decoded PCM and analysis of one file, shared by all of its tracks
+
+    processor holds the forward signal; tracks work on clones over the
+    same samples. envelope is the forward pyramid (reversed tracks use a
+    reversed view of it); meter is the level timeline, looked up by
+    playback direction. context is the JobContext group of its analysis
+    jobs, with analyzing the kinds still in flight; releasing the audio
+    cancels them, so they never write into released data.
+    """
+
+    def __init__(self, key, processor):
+        self.key = key
+        self.processor = processor
+        self.envelope = None
+        self.spectrogram = None
+        self.meter = None
+        self.context = None
+        self.analyzing = set()
+
+    @property
+    def is_loaded(self):
+        return self.processor is not None
+
+    @property
+    def nbytes(self):
+        total = 0
+        if self.processor is not None:
+            total += resident_bytes(self.processor.samples)
+            total += resident_bytes(self.processor.planar_samples.array)
+        if self.envelope is not None:
+            total += sum(resident_bytes(level) for level in self.envelope.mins + self.envelope.maxs)
+        if self.spectrogram is not None:
+            total += resident_bytes(self.spectrogram.frames)
+        if self.meter is not None:
+            total += resident_bytes(self.meter.levels)
+        return total
+
+    def release(self):
+        if self.context is not None:
+            self.context.cancel()
+        self.analyzing.clear()
+        self.processor = None
+        self.envelope = None
+        self.spectrogram = None
+        self.meter = None
+
+
+class Track:
+    """A file in the session, with its own direction (forward / reversed)"""
+
+    def __init__(self, audio):
+        self.file_path = audio.processor.file_path
+        self.name = os.path.basename(self.file_path)
+        self.audio = audio
+        self.processor = audio.processor.clone()
+        self._reversed = False
+
+    @property
+    def is_loaded(self):
+        return self.processor is not None
+
+    @property
+    def is_reversed(self):
+        if self.processor is None:
+            return self._reversed
+        return self.processor.is_reversed
+
+    @property
+    def envelope(self):
+        """Envelope in playback direction (a view when reversed)"""
+        if self.audio is None or self.audio.envelope is None:
+            return None
+        return self.audio.envelope.reversed() if self.is_reversed else self.audio.envelope
+
+    @property
+    def spectrogram(self):
+        return None if self.audio is None else self.audio.spectrogram
+
+    @property
+    def meter(self):
+        return None if self.audio is None else self.audio.meter
+
+    def release(self):
+        """Drop the samples (evicted); the direction is kept for the reload"""
+        self._reversed = self.is_reversed
+        self.processor = None
+        self.audio = None
+
+    def attach(self, audio):
+        """Point the track at (re)loaded shared audio"""
+        self.audio = audio
+        self.processor = audio.processor.clone()
+        if self._reversed:
+            self.processor.reverse_audio()
+
+    def overlay(self, color):
+        """TrackOverlay for drawing this track under another one"""
+        return TrackOverlay(
+            color,
+            self.envelope,
+            self.processor.duration_ms,
+            self.spectrogram,
+            self.is_reversed
+        )
+
+
+class Session:
+    """
+    Loaded tracks and the shared audio behind them
+
+    A file opened twice (e.g. a forward and a reversed take) is decoded and
+    analysed once. Shared audio is kept in least-recently-activated order;
+    when the resident total exceeds the memory budget, the oldest files
+    not used by the active track are released. Their tracks stay listed
+    and reload on activation - from the decoded audio cache, so without
+    decoding again.
+    """
+
+    def __init__(self, budget=SESSION_MEMORY_BUDGET, max_tracks=SESSION_MAX_TRACKS):
+        self.budget = budget
+        self.max_tracks = max_tracks
+        self.tracks = []
+        self.active = None
+        self._audio = OrderedDict()
+
+    @staticmethod
+    def key_for(file_path):
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def nbytes(self):
+        return sum(audio.nbytes for audio in self._audio.values())
+
+    def shared(self, file_path):
+        """Loaded shared audio of file_path, or None"""
+        try:
+            audio = self._audio.get(self.key_for(file_path))
+        except OSError:
+            return None
+        return audio if audio is not None and audio.is_loaded else None
+
+    def _share(self, processor):
+        key = self.key_for(processor.file_path)
+        audio = self._audio.get(key)
+        if audio is None or not audio.is_loaded:
+            audio = SharedAudio(key, processor)
+            self._audio[key] = audio
+        self._audio.move_to_end(key)
+        return audio
+
+    def add(self, processor):
+        """
+        New track for a loaded processor; it becomes the active track
+
+        With max_tracks already open, the oldest inactive track is closed
+        (the active one when it is the only track).
+        """
+        if self.tracks and len(self.tracks) >= self.max_tracks:
+            oldest = next((t for t in self.tracks if t is not self.active), self.active)
+            self.remove(oldest)
+
+        track = Track(self._share(processor))
+        self.tracks.append(track)
+        self.active = track
+        self.trim()
+        return track
+
+    def attach(self, track, processor):
+        """Reload an evicted track (and others of the same file) from a fresh processor"""
+        audio = self._share(processor)
+        for other in self.tracks:
+            if other is track or (not other.is_loaded and other.file_path == track.file_path):
+                other.attach(audio)
+        self.trim()
+
+    def activate(self, track):
+        self.active = track
+        if track.audio is not None:
+            self._audio.move_to_end(track.audio.key)
+
+    def remove(self, track):
+        self.tracks.remove(track)
+        if self.active is track:
+            self.active = self.tracks[-1] if self.tracks else None
+        self._drop_unused()
+
+    def overlays(self):
+        """TrackOverlay of every loaded inactive track"""
+        return [
+            track.overlay(self.color_of(track))
+            for track in self.tracks
+            if track is not self.active and track.is_loaded
+        ]
+
+    def color_of(self, track):
+        """Color a track is drawn in (the active track in the primary color)"""
+        if track is self.active:
+            return Colors.TRACKS[0]
+        others = [t for t in self.tracks if t is not self.active]
+        return Colors.TRACKS[1 + others.index(track)]
+
+    def trim(self):
+        """Release least recently activated audio until under the budget"""
+        active_audio = self.active.audio if self.active is not None else None
+        for key in list(self._audio):
+            if self.nbytes <= self.budget:
+                break
+            audio = self._audio[key]
+            if audio is active_audio:
+                continue
+            for track in self.tracks:
+                if track.audio is audio:
+                    track.release()
+            audio.release()
+            del self._audio[key]
+
+    def _drop_unused(self):
+        used = {id(track.audio) for track in self.tracks}
+        for key, audio in list(self._audio.items()):
+            if id(audio) not in used:
+                audio.release()
+                del self._audio[key]
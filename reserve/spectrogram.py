@@ -0,0 +1,213 @@
+"""
+Spectrogram Module for Reserve Audio Analyzer
+Streaming short-time FFT over the whole file, cached per file
+"""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from config import (
+    FFT_SIZE, SAVGOL_WINDOW,
+    STFT_HOP_MS, STFT_BATCH_FRAMES, STFT_DYNAMIC_RANGE_DB, STFT_CACHE_ENTRIES
+)
+
+
+class Spectrogram:
+    """
+    Full-file magnitude spectrogram
+
+    frames[k] is the spectrum of the window centred on sample k * hop,
+    stored as float16 dB above the noise floor (0 .. STFT_DYNAMIC_RANGE_DB).
+    """
+
+    def __init__(self, frequencies, frames, average, hop, sample_rate, n_samples):
+        self.frequencies = frequencies
+        self.frames = frames
+        self.average = average
+        self.hop = hop
+        self.sample_rate = sample_rate
+        self.n_samples = n_samples
+
+    @property
+    def duration_ms(self):
+        return self.n_samples * 1000.0 / self.sample_rate
+
+    def to_arrays(self):
+        """Arrays and attributes for DecodedAudioCache.store"""
+        arrays = {'frequencies': self.frequencies, 'frames': self.frames, 'average': self.average}
+        attrs = {'hop': self.hop, 'sample_rate': self.sample_rate, 'n_samples': self.n_samples}
+        return arrays, attrs
+
+    @classmethod
+    def from_arrays(cls, arrays, attrs):
+        """Rebuild from DecodedAudioCache.load output (frames stay memory-mapped)"""
+        return cls(
+            arrays['frequencies'], arrays['frames'], arrays['average'],
+            attrs['hop'], attrs['sample_rate'], attrs['n_samples']
+        )
+
+    def spectrum_at(self, position_ms, reverse=False):
+        """
+        Spectrum at a playback position (table lookup, no FFT)
+
+        Args:
+            position_ms: playback position in ms
+            reverse: position refers to the reversed signal; the magnitude
+                spectrum of a time-reversed frame is unchanged, so the
+                forward frame at the mirrored position is used
+
+        Returns:
+            float32 magnitude in dB
+        """
+        if reverse:
+            position_ms = self.duration_ms - position_ms
+
+        index = int(round(position_ms * self.sample_rate / 1000.0 / self.hop))
+        index = min(max(index, 0), len(self.frames) - 1)
+        return self.frames[index].astype(np.float32)
+
+
+def iter_stft_batches(samples, n_fft, hop, batch_frames=STFT_BATCH_FRAMES):
+    """
+    Stream windowed rfft frames over samples in batches
+
+    Frames are strided views (sliding_window_view) over each batch's
+    segment; only the batch is zero-padded at the file edges.
+
+    Yields:
+        tuple: (first_frame_index, magnitude) with magnitude of shape
+        (frames_in_batch, n_fft // 2 + 1)
+    """
+    n_samples = len(samples)
+    n_frames = n_samples // hop + 1
+    half = n_fft // 2
+    # Periodic Hann (scipy.signal.get_window('hann', n_fft))
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+
+    for first in range(0, n_frames, batch_frames):
+        count = min(batch_frames, n_frames - first)
+
+        # Sample span covered by this batch (frame k is centred on k * hop)
+        lo = first * hop - half
+        hi = (first + count - 1) * hop + half + (n_fft % 2)
+        segment = np.zeros(hi - lo, dtype=np.float32)
+        src_lo, src_hi = max(lo, 0), min(hi, n_samples)
+        segment[src_lo - lo:src_hi - lo] = samples[src_lo:src_hi]
+
+        frames = np.lib.stride_tricks.sliding_window_view(segment, n_fft)[::hop]
+        yield first, np.abs(np.fft.rfft(frames * window, axis=1))
+
+
+def temp_frames(shape, dtype):
+    """
+    Writable array backed by an unlinked temporary file
+
+    Pages are written back to disk under memory pressure instead of staying
+    resident; the file disappears when the array is released.
+    """
+    with tempfile.TemporaryFile(prefix='asa-stft-') as f:
+        return np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+
+
+def compute_spectrogram(audio_data, sample_rate, progress=None, on_disk=False):
+    """
+    Compute the full-file spectrogram
+
+    Args:
+        audio_data: normalized planar samples, (channels, n) or mono (n,)
+        sample_rate: audio sample rate in Hz
+        progress: optional callable(fraction) called after each batch;
+            an exception raised from it aborts the computation
+        on_disk: keep the frames in a temporary memory-mapped file rather
+            than in RAM (~295 MB per hour of audio otherwise)
+
+    Returns:
+        Spectrogram, or None if there is no data
+    """
+    if audio_data is None or len(audio_data) == 0:
+        return None
+
+    # Deferred: scipy.signal costs ~1s to import; this runs on a worker thread
+    from scipy.signal import savgol_filter
+
+    # Extract mono channel
+    samples = audio_data[0] if audio_data.ndim > 1 else audio_data
+
+    n_fft = FFT_SIZE
+    hop = max(int(sample_rate * STFT_HOP_MS / 1000), 1)
+    n_frames = len(samples) // hop + 1
+    n_bins = n_fft // 2 + 1
+
+    if on_disk:
+        frames = temp_frames((n_frames, n_bins), np.float16)
+    else:
+        frames = np.empty((n_frames, n_bins), dtype=np.float16)
+    power_sum = np.zeros(n_bins, dtype=np.float64)
+    peak_db = -np.inf
+
+    smooth = SAVGOL_WINDOW if n_bins > SAVGOL_WINDOW else 0
+
+    for first, magnitude in iter_stft_batches(samples, n_fft, hop):
+        power_sum += np.square(magnitude, dtype=np.float64).sum(axis=0)
+
+        magnitude_db = 20 * np.log10(magnitude + 1e-10)
+        if smooth:
+            magnitude_db = savgol_filter(magnitude_db, smooth, 3, axis=1)
+
+        peak_db = max(peak_db, float(magnitude_db.max()))
+        frames[first:first + len(magnitude_db)] = magnitude_db
+
+        if progress is not None:
+            progress((first + len(magnitude_db)) / n_frames)
+
+    # dB above the floor of the display's dynamic range
+    floor_db = peak_db - STFT_DYNAMIC_RANGE_DB
+    for first in range(0, n_frames, STFT_BATCH_FRAMES):
+        batch = frames[first:first + STFT_BATCH_FRAMES]
+        np.clip(batch - floor_db, 0, STFT_DYNAMIC_RANGE_DB, out=batch)
+
+    # Average spectrum over the whole file
+    average = 10 * np.log10(power_sum / n_frames + 1e-20)
+    average = average - np.min(average)
+    if smooth:
+        average = savgol_filter(average, smooth, 3)
+
+    frequencies = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+
+    return Spectrogram(frequencies, frames, average, hop, sample_rate, len(samples))
+
+
+class SpectrogramCache:
+    """Keeps the spectrograms of recently opened files (LRU, thread-safe)"""
+
+    def __init__(self, max_entries=STFT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(file_path):
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, file_path):
+        """Cached spectrogram for file_path, or None"""
+        key = self._key(file_path)
+        with self._lock:
+            spectrogram = self._entries.get(key)
+            if spectrogram is not None:
+                self._entries.move_to_end(key)
+        return spectrogram
+
+    def put(self, file_path, spectrogram):
+        """Store a spectrogram, evicting the least recently used entries"""
+        key = self._key(file_path)
+        with self._lock:
+            self._entries[key] = spectrogram
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
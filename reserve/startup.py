@@ -0,0 +1,83 @@
+"""
+Startup Module for Reserve Audio Analyzer
+Deferred loading of heavy modules and the startup profile report
+"""
+
+import importlib
+import sys
+import threading
+import time
+
+# Kept off the startup path: imported on a background thread once the
+# window is up (or on first use, whichever comes first)
+DEFERRED_MODULES = ('scipy.signal', 'pydub', 'pygame.mixer')
+
+
+def load_module(name):
+    """Import a deferred module (pydub goes through load_pydub for the ffmpeg PATH)"""
+    if name == 'pydub':
+        from audio_processor import load_pydub
+        return load_pydub()
+    return importlib.import_module(name)
+
+
+class StartupProfile:
+    """
+    Startup milestones and deferred import timings
+
+    Times are seconds since `started` (perf_counter taken before the GUI
+    imports). mark() may be called from any thread.
+    """
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = []
+        self.imports = []
+        self.eager = []
+        self._lock = threading.Lock()
+
+    def mark(self, label):
+        with self._lock:
+            self.marks.append((label, time.perf_counter() - self.started))
+
+    def record_import(self, name, seconds):
+        with self._lock:
+            self.imports.append((name, seconds))
+
+    def check_deferred(self):
+        """Remember deferred modules that were already imported (startup regressions)"""
+        self.eager = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+    def report(self):
+        lines = ["Startup profile (ms since qt_scope import)"]
+        for label, seconds in self.marks:
+            lines.append(f"  {label:<28} {seconds * 1000:8.1f}")
+
+        lines.append("Deferred imports (background thread)")
+        for name, seconds in self.imports:
+            lines.append(f"  {name:<28} {seconds * 1000:8.1f}")
+
+        if self.eager:
+            lines.append(f"WARNING: imported before the window was shown: {', '.join(self.eager)}")
+        return "\n".join(lines)
+
+
+def preload_deferred(profile=None, modules=DEFERRED_MODULES):
+    """Import the deferred modules one by one (background thread target)"""
+    for name in modules:
+        started = time.perf_counter()
+        try:
+            load_module(name)
+        except Exception:
+            continue  # Surfaces again, with context, on first real use
+        if profile is not None:
+            profile.record_import(name, time.perf_counter() - started)
+
+
+def start_preload(profile=None):
+    """Start preloading the deferred modules on a daemon thread"""
+    thread = threading.Thread(
+        target=preload_deferred, args=(profile,), name='asa-preload', daemon=True
+    )
+    thread.start()
+    return thread
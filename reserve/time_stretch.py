@@ -0,0 +1,184 @@
+"""
+Time-Stretch Module for Reserve Audio Analyzer
+Pitch-preserving speed change (phase vocoder) on NumPy frames, streamable
+"""
+
+import numpy as np
+
+from config import STRETCH_FFT_SIZE, STRETCH_HOP, STRETCH_BATCH_FRAMES, STRETCH_CHUNK_FRAMES
+
+
+class PhaseVocoder:
+    """
+    Streaming phase vocoder
+
+    Output frames are spaced STRETCH_HOP apart; analysis frames advance by
+    hop * rate through the input. Every batch of frames is gathered with
+    one fancy-index, transformed with a single rfft/irfft call, and
+    phase-accumulated with cumsum, so the per-frame Python cost is zero.
+    State (phase, overlap tail, fractional read position) carries over
+    between process() calls, so input can arrive in arbitrary chunks.
+
+    rate: speed factor (2.0 = twice as fast, same pitch)
+    """
+
+    def __init__(self, rate, channels, n_fft=STRETCH_FFT_SIZE, hop=STRETCH_HOP):
+        if rate <= 0:
+            raise ValueError("Stretch rate must be positive")
+        if n_fft % hop:
+            raise ValueError("n_fft must be a multiple of hop")
+
+        self.rate = rate
+        self.channels = channels
+        self.n_fft = n_fft
+        self.hop = hop
+
+        # Periodic Hann: constant overlap-add of window^2 at n_fft / hop overlap
+        self.window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+        self._gain = hop / float(np.sum(self.window ** 2))
+        self._omega = 2 * np.pi * hop * np.arange(n_fft // 2 + 1) / n_fft
+
+        # Half a frame of leading silence centres the first frame on sample 0;
+        # the matching output latency is skipped
+        self._input = np.zeros((n_fft // 2, channels), dtype=np.float32)
+        self._position = 0.0
+        self._phase = None
+        self._overlap = np.zeros((n_fft - hop, channels), dtype=np.float32)
+        self._skip = n_fft // 2
+        self._consumed = 0
+        self._emitted = 0
+
+    def process(self, chunk):
+        """
+        Feed input samples
+
+        Args:
+            chunk: float32 array of shape (n, channels)
+
+        Returns:
+            float32 array of stretched samples ready so far (may be empty)
+        """
+        self._consumed += len(chunk)
+        self._input = np.concatenate([self._input, chunk.astype(np.float32, copy=False)])
+        return self._drain()
+
+    def flush(self):
+        """Finish the stream and return the remaining output"""
+        emitted = self._emitted
+        remaining = max(int(round(self._consumed / self.rate)) - emitted, 0)
+
+        # Zero padding lets the last frames run past the end of the input
+        padding = self.n_fft * (2 + int(np.ceil(self.rate))) + self.hop
+        self._input = np.concatenate([self._input, np.zeros((padding, self.channels), np.float32)])
+        out = self._drain()[:remaining]
+
+        self._emitted = emitted + len(out)
+        return out
+
+    def _drain(self):
+        outputs = []
+        while True:
+            frames = self._synthesize_batch()
+            if frames is None:
+                break
+            outputs.append(frames)
+
+        if not outputs:
+            return np.zeros((0, self.channels), dtype=np.float32)
+
+        out = np.concatenate(outputs)
+        if self._skip:
+            skipped = min(self._skip, len(out))
+            out = out[skipped:]
+            self._skip -= skipped
+
+        self._emitted += len(out)
+        return out
+
+    def _synthesize_batch(self):
+        n_fft, hop = self.n_fft, self.hop
+        step = hop * self.rate
+
+        # Frames whose analysis pair [p, p + hop + n_fft) is fully buffered
+        available = len(self._input) - n_fft - hop - self._position
+        if available < 0:
+            return None
+        count = min(int(available // step) + 1, STRETCH_BATCH_FRAMES)
+
+        positions = self._position + np.arange(count) * step
+        index = np.floor(positions).astype(np.int64)[:, None] + np.arange(n_fft)[None, :]
+
+        # (count, channels, n_fft) windowed frame pairs, one hop apart
+        frames = self._input[index].transpose(0, 2, 1) * self.window
+        frames_next = self._input[index + hop].transpose(0, 2, 1) * self.window
+        spectrum = np.fft.rfft(frames, axis=-1)
+        spectrum_next = np.fft.rfft(frames_next, axis=-1)
+
+        # Instantaneous phase advance per hop (deviation wrapped to +-pi)
+        delta = np.angle(spectrum_next) - np.angle(spectrum) - self._omega
+        delta -= 2 * np.pi * np.round(delta / (2 * np.pi))
+        advance = self._omega + delta
+
+        if self._phase is None:
+            self._phase = np.angle(spectrum[0])
+        phase = np.empty_like(advance)
+        phase[0] = self._phase
+        np.cumsum(advance[:-1], axis=0, out=phase[1:])
+        phase[1:] += self._phase
+        self._phase = np.mod(phase[-1] + advance[-1], 2 * np.pi)
+
+        synth = np.fft.irfft(np.abs(spectrum) * np.exp(1j * phase), n=n_fft, axis=-1)
+        synth = (synth * (self.window * self._gain)).astype(np.float32)
+
+        # Overlap-add: each frame splits into n_fft / hop hop-sized segments
+        ratio = n_fft // hop
+        out = np.zeros((count * hop + n_fft - hop, self.channels), dtype=np.float32)
+        out[:n_fft - hop] += self._overlap
+        segments = synth.reshape(count, self.channels, ratio, hop)
+        for j in range(ratio):
+            out[j * hop:j * hop + count * hop] += (
+                segments[:, :, j, :].transpose(0, 2, 1).reshape(count * hop, self.channels)
+            )
+        self._overlap = out[count * hop:].copy()
+
+        # Drop input that no future frame will read
+        next_position = self._position + count * step
+        consumed = int(next_position)
+        self._input = self._input[consumed:]
+        self._position = next_position - consumed
+
+        return out[:count * hop]
+
+
+def stretch_chunks(samples, rate, chunk_frames=STRETCH_CHUNK_FRAMES):
+    """
+    Time-stretch samples chunk by chunk
+
+    Args:
+        samples: float32 array of shape (n,) or (n, channels)
+        rate: speed factor (2.0 = twice as fast, same pitch)
+        chunk_frames: input frames consumed per yielded chunk
+
+    Yields:
+        float32 arrays shaped like the input (mono stays 1-D)
+    """
+    mono = samples.ndim == 1
+    frames = samples[:, np.newaxis] if mono else samples
+    vocoder = PhaseVocoder(rate, frames.shape[1])
+
+    for start in range(0, len(frames), chunk_frames):
+        out = vocoder.process(frames[start:start + chunk_frames])
+        if len(out):
+            yield out[:, 0] if mono else out
+
+    out = vocoder.flush()
+    if len(out):
+        yield out[:, 0] if mono else out
+
+
+def time_stretch(samples, rate):
+    """Time-stretch a whole signal (see stretch_chunks)"""
+    chunks = list(stretch_chunks(samples, rate))
+    if not chunks:
+        return samples[:0].astype(np.float32)
+    return np.concatenate(chunks)
@@ -3,13 +3,19 @@ Visualization Module for Reserve Audio Analyzer
 Matplotlib canvas and oscilloscope-style plotting utilities
 """
 
+from abc import ABC, abstractmethod
+
 import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
 from matplotlib import patches
-from scipy import signal
 
-from config import Colors, DISPLAY_SAMPLES, WINDOW_SIZE_MS, FFT_SIZE, SAVGOL_WINDOW
+from config import (
+    Colors, Layout, RENDER_BACKEND, DISPLAY_SAMPLES, WINDOW_SIZE_MS, ENVELOPE_BASE_BLOCK, ENVELOPE_CHUNK_BLOCKS,
+    STFT_DYNAMIC_RANGE_DB
+)
+from spectrogram import compute_spectrogram
 
 
 class MplCanvas(FigureCanvasQTAgg):
@@ -19,6 +25,8 @@ class MplCanvas(FigureCanvasQTAgg):
         self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor=Colors.BLACK)
         self.axes = self.fig.add_subplot(111)
         self.axes.set_facecolor(Colors.BLACK)
+        # Persistent ScopeRenderer, created on first draw
+        self.scope = None
         super().__init__(self.fig)
 
 
@@ -56,41 +64,195 @@ def style_scope_axis(ax, xlabel, ylabel):
     ax.add_patch(rect)
 
 
-def prepare_waveform_samples(audio_data, channels):
+class EnvelopePyramid:
+    """
+    Multi-resolution min/max envelope of a waveform
+
+    Level 0 holds the min/max of every ENVELOPE_BASE_BLOCK samples and each
+    following level halves the resolution (2x decimation), down to a single
+    block. Values are normalized to the file peak. Drawing picks the level
+    that matches the pixel width, so it costs the same for any file length
+    and transients survive decimation.
+    """
+
+    def __init__(self, mins, maxs, n_samples, base_block=ENVELOPE_BASE_BLOCK, offsets=None):
+        self.mins = mins
+        self.maxs = maxs
+        self.n_samples = n_samples
+        self.base_block = base_block
+        # Sample position of the first block of each level (0 when forward;
+        # when reversed each level differs, as its tail is padded to a whole block)
+        self.offsets = list(offsets) if offsets is not None else [0] * len(mins)
+
+    @classmethod
+    def from_samples(cls, audio_data, base_block=ENVELOPE_BASE_BLOCK, progress=None):
+        """
+        Build the pyramid from audio samples
+
+        Level 0 is computed in chunks of ENVELOPE_CHUNK_BLOCKS blocks, so a
+        memory-mapped file is streamed page by page instead of being pulled
+        into memory at once.
+
+        Args:
+            audio_data: normalized planar samples, (channels, n) or mono (n,)
+            base_block: samples per block at level 0
+            progress: optional callable(fraction) called after each chunk
+
+        Returns:
+            EnvelopePyramid, or None if there is no data
+        """
+        if audio_data is None or len(audio_data) == 0:
+            return None
+
+        # Extract mono channel
+        samples = audio_data[0] if audio_data.ndim > 1 else audio_data
+        n_samples = len(samples)
+
+        n_blocks = -(-n_samples // base_block)
+        level_min = np.empty(n_blocks, dtype=np.float32)
+        level_max = np.empty(n_blocks, dtype=np.float32)
+
+        chunk = ENVELOPE_CHUNK_BLOCKS * base_block
+        for start in range(0, n_samples, chunk):
+            block = samples[start:start + chunk]
+            full = (len(block) // base_block) * base_block
+            first = start // base_block
+
+            blocks = block[:full].reshape((-1, base_block))
+            level_min[first:first + len(blocks)] = blocks.min(axis=1)
+            level_max[first:first + len(blocks)] = blocks.max(axis=1)
+            if full < len(block):
+                level_min[-1] = block[full:].min()
+                level_max[-1] = block[full:].max()
+
+            if progress is not None:
+                progress(min(start + chunk, n_samples) / n_samples)
+
+        mins = [level_min]
+        maxs = [level_max]
+
+        # Normalize
+        peak = max(abs(float(mins[0].min())), abs(float(maxs[0].max()))) + 1e-10
+        mins[0] /= peak
+        maxs[0] /= peak
+
+        # 2x decimation per level (odd tails pair with themselves)
+        while len(mins[-1]) > 1:
+            lo, hi = mins[-1], maxs[-1]
+            if len(lo) % 2:
+                lo = np.append(lo, lo[-1])
+                hi = np.append(hi, hi[-1])
+            mins.append(np.minimum(lo[0::2], lo[1::2]))
+            maxs.append(np.maximum(hi[0::2], hi[1::2]))
+
+        return cls(mins, maxs, n_samples, base_block)
+
+    def to_arrays(self):
+        """Flatten the levels for DecodedAudioCache.store"""
+        arrays = {'mins': np.concatenate(self.mins), 'maxs': np.concatenate(self.maxs)}
+        attrs = {
+            'sizes': [len(level) for level in self.mins],
+            'n_samples': self.n_samples,
+            'base_block': self.base_block,
+            'offsets': [int(offset) for offset in self.offsets]
+        }
+        return arrays, attrs
+
+    @classmethod
+    def from_arrays(cls, arrays, attrs):
+        """Rebuild from DecodedAudioCache.load output (levels are views)"""
+        bounds = np.cumsum([0] + attrs['sizes'])
+        return cls(
+            [arrays['mins'][a:b] for a, b in zip(bounds[:-1], bounds[1:])],
+            [arrays['maxs'][a:b] for a, b in zip(bounds[:-1], bounds[1:])],
+            attrs['n_samples'],
+            attrs['base_block'],
+            attrs.get('offsets')
+        )
+
+    def reversed(self):
+        """Envelope of the reversed signal, as views over this one"""
+        return EnvelopePyramid(
+            [level[::-1] for level in self.mins],
+            [level[::-1] for level in self.maxs],
+            self.n_samples,
+            self.base_block,
+            offsets=[
+                self.n_samples - len(level) * (self.base_block << index) - offset
+                for index, (level, offset) in enumerate(zip(self.mins, self.offsets))
+            ]
+        )
+
+    def trace(self, start, stop, columns):
+        """
+        Min/max trace for samples [start, stop)
+
+        Args:
+            start: first sample index
+            stop: end sample index (exclusive)
+            columns: horizontal resolution (pixels) of the target plot
+
+        Returns:
+            tuple: (positions, values) - block centres in samples, each
+            repeated twice, and the interleaved min/max envelope
+        """
+        start = max(int(start), 0)
+        stop = min(int(stop), self.n_samples)
+        span = max(stop - start, 1)
+
+        # Finest level with at most one block per column (drawing cost
+        # stays bounded by the pixel width, not the span)
+        level = 0
+        while (level + 1 < len(self.mins)
+               and span / (self.base_block << level) > columns):
+            level += 1
+
+        block = self.base_block << level
+        offset = self.offsets[level]
+        first = max((start - offset) // block, 0)
+        last = min(-(-(stop - offset) // block), len(self.mins[level]))
+
+        mins = self.mins[level][first:last]
+        maxs = self.maxs[level][first:last]
+
+        positions = offset + (np.arange(first, last) + 0.5) * block
+        values = np.empty(2 * len(mins), dtype=np.float32)
+        values[0::2] = mins
+        values[1::2] = maxs
+
+        return np.repeat(positions, 2), values
+
+
+def prepare_waveform_samples(audio_data, channels, progress=None):
     """
     Prepare audio samples for waveform display
 
     Args:
-        audio_data: numpy array of audio samples
+        audio_data: normalized planar samples (AudioProcessor.planar)
         channels: number of audio channels
+        progress: optional callable(fraction) for long files
 
     Returns:
-        Normalized, downsampled samples ready for plotting
+        EnvelopePyramid built once per load, or None
     """
     if audio_data is None:
         return None
 
-    # Extract mono channel
-    if len(audio_data.shape) > 1:
-        samples = audio_data[:, 0]
-    else:
-        samples = audio_data
-
-    # Downsample for display
-    if len(samples) > DISPLAY_SAMPLES:
-        step = len(samples) // DISPLAY_SAMPLES
-        samples = samples[::step]
+    return EnvelopePyramid.from_samples(audio_data, progress=progress)
 
-    # Normalize
-    samples = samples / (np.max(np.abs(samples)) + 1e-10)
 
-    return samples
+def _trace_columns(ax):
+    """Horizontal pixel resolution of an axis, capped at DISPLAY_SAMPLES"""
+    return max(min(int(ax.bbox.width), DISPLAY_SAMPLES), 1)
 
 
 def compute_spectrum(audio_data, sample_rate):
     """
     Compute frequency spectrum from audio data
 
+    Averages the streaming STFT over the whole file (not just its first
+    frame). Use spectrogram.SpectrogramCache to reuse the result.
+
     Args:
         audio_data: numpy array of audio samples
         sample_rate: audio sample rate in Hz
@@ -98,98 +260,389 @@ def compute_spectrum(audio_data, sample_rate):
     Returns:
         tuple: (frequencies, magnitude_db)
     """
-    if audio_data is None:
+    spectrogram = compute_spectrogram(audio_data, sample_rate)
+    if spectrogram is None:
         return None, None
 
-    # Extract mono channel
-    if len(audio_data.shape) > 1:
-        samples = audio_data[:, 0]
-    else:
-        samples = audio_data
+    return spectrogram.frequencies, spectrogram.average
+
+
+WAVEFORM_LABELS = ('TIME (ms)', 'AMPLITUDE (V)')
+SPECTRUM_LABELS = ('FREQUENCY (Hz)', 'MAGNITUDE (dB)')
+
+# Axes layout of the 'NO SIGNAL' screen (matplotlib defaults)
+EMPTY_LAYOUT = ((0, 1), (0, 1), 'linear')
+
+
+class ScopeRenderer:
+    """
+    Persistent styled axes and artists of one canvas
+
+    The axes are styled (grid, labels, border) once, and every data artist
+    is animated, so a full Agg render only draws the static scope. That
+    background is rendered once per axes layout (limits, scale, canvas
+    size) and cached; after that, drawing new data is a background restore,
+    a few draw_artist calls and a blit. Static redraws and the playback
+    animators share the same artists.
+    """
+
+    def __init__(self, canvas, xlabel, ylabel, zero_line=False):
+        self.canvas = canvas
+        self.ax = ax = canvas.axes
+
+        ax.clear()
+        style_scope_axis(ax, xlabel, ylabel)
+
+        self.zero_line = ax.axhline(
+            y=0, color=Colors.BORDER, linewidth=1.5, alpha=0.8,
+            animated=True, visible=zero_line
+        )
+        self.fill = None
+        # Other session tracks, under the active trace (created on demand)
+        self.overlays = []
+        self.overlay_bands = []
+        # Min/max envelope band (waveform); an unstroked filled polygon is far
+        # cheaper for Agg than stroking a zigzag (or an outline) through every
+        # block, so band_verts pads it to at least a pixel high instead
+        self.band = PolyCollection(
+            [], facecolors=Colors.GREEN_BRIGHT, linewidths=0,
+            alpha=0.9, animated=True, visible=False
+        )
+        ax.add_collection(self.band)
+        self.line, = ax.plot(
+            [], [], color=Colors.GREEN_BRIGHT, linewidth=1.5, alpha=0.9, animated=True
+        )
+        self.marker = ax.axvline(
+            x=0, color=Colors.YELLOW, linewidth=2, alpha=0.8, linestyle='--',
+            animated=True, visible=False
+        )
+        self.marker_label = ax.text(
+            0, 1.1, '', color=Colors.YELLOW, fontsize=9, ha='center', weight='bold',
+            animated=True, visible=False
+        )
+        self.placeholder = ax.text(
+            0.5, 0.5, 'NO SIGNAL',
+            ha='center', va='center',
+            transform=ax.transAxes,
+            color=Colors.GREEN_MEDIUM, fontsize=18, weight='bold',
+            animated=True, visible=False
+        )
+
+        self._layout = None
+        self._backgrounds = {}
+        self._layout_changed = True
+        self._rendering = False
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_fill(self, x, y):
+        """Fill under the line (created on first use)"""
+        if self.fill is None:
+            self.fill = self.ax.fill_between(
+                x, 0, 0, color=Colors.GREEN_BRIGHT, alpha=0.2, animated=True
+            )
+        self.fill.set_verts([fill_verts(x, y)])
+        self.fill.set_visible(True)
+
+    def set_band(self, x, values):
+        """Show an envelope trace (x repeated twice, interleaved min/max) as a band"""
+        self.band.set_verts([band_verts(x, values, self.pixel_height())])
+        self.band.set_visible(True)
+        self.line.set_visible(False)
+
+    def set_overlays(self, traces):
+        """
+        Overlay traces of other tracks
+
+        Args:
+            traces: list of (x, y, color); lines beyond it are hidden
+        """
+        while len(self.overlays) < len(traces):
+            line, = self.ax.plot([], [], linewidth=1.0, alpha=0.6, animated=True)
+            self.overlays.append(line)
+
+        for line, (x, y, color) in zip(self.overlays, traces):
+            line.set_data(x, y)
+            line.set_color(color)
+            line.set_visible(True)
+        for line in self.overlays[len(traces):]:
+            line.set_visible(False)
+
+    def set_overlay_bands(self, traces):
+        """
+        Envelope traces of other tracks, drawn as bands
+
+        Args:
+            traces: list of (x, values, color) envelope traces; bands beyond it are hidden
+        """
+        while len(self.overlay_bands) < len(traces):
+            band = PolyCollection([], linewidths=0, alpha=0.5, animated=True)
+            self.ax.add_collection(band)
+            self.overlay_bands.append(band)
+
+        min_height = self.pixel_height()
+        for band, (x, values, color) in zip(self.overlay_bands, traces):
+            band.set_verts([band_verts(x, values, min_height)])
+            band.set_facecolor(color)
+            band.set_visible(True)
+        for band in self.overlay_bands[len(traces):]:
+            band.set_visible(False)
+
+    def pixel_height(self):
+        """Height of one device pixel in y data units"""
+        low, high = self.ax.get_ylim()
+        return abs(high - low) / max(self.ax.bbox.height, 1.0)
+
+    def set_layout(self, xlim, ylim, xscale='linear'):
+        """
+        Switch axes limits/scale, rendering the static background only
+        the first time a layout is seen at the current canvas size
+        """
+        layout = (tuple(xlim), tuple(ylim), xscale)
+        if layout != self._layout:
+            # Switch to log only once the limits are positive
+            if xscale == 'log':
+                self.ax.set_xlim(*xlim)
+            if self.ax.get_xscale() != xscale:
+                self.ax.set_xscale(xscale)
+                self.ax.minorticks_on()
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(*ylim)
+            self._layout = layout
+            self._layout_changed = True
+
+        key = (layout, self.canvas.get_width_height())
+        if key not in self._backgrounds:
+            self._rendering = True
+            try:
+                self.canvas.draw()
+            finally:
+                self._rendering = False
+            self._backgrounds[key] = self.canvas.copy_from_bbox(self.canvas.fig.bbox)
+
+    def blit(self):
+        """Restore the cached background, draw visible artists, blit"""
+        key = (self._layout, self.canvas.get_width_height())
+        background = self._backgrounds.get(key)
+        if background is None:
+            return
+
+        self.canvas.restore_region(background)
+        self._draw_artists()
+
+        # Tick labels live outside the axes: blit the figure after a layout switch
+        if self._layout_changed:
+            self.canvas.blit(self.canvas.fig.bbox)
+            self._layout_changed = False
+        else:
+            self.canvas.blit(self.ax.bbox)
+
+    def _draw_artists(self):
+        for artist in (self.zero_line, self.fill, *self.overlay_bands, *self.overlays, self.band,
+                       self.line, self.marker, self.marker_label, self.placeholder):
+            if artist is not None and artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        # A full draw from outside (resize, expose) wipes the animated
+        # artists: re-cache the background and paint them back on top
+        if self._rendering or self._layout is None:
+            return
+        self._backgrounds.clear()
+        key = (self._layout, self.canvas.get_width_height())
+        self._backgrounds[key] = self.canvas.copy_from_bbox(self.canvas.fig.bbox)
+        self._draw_artists()
 
-    # FFT computation
-    fft_size = min(FFT_SIZE, len(samples))
-    chunk = samples[:fft_size]
 
-    fft = np.fft.fft(chunk)
-    freqs = np.fft.fftfreq(len(chunk), 1.0 / sample_rate)
+def scope_renderer(canvas, labels, zero_line=False):
+    """ScopeRenderer of a canvas, created on first use"""
+    if canvas.scope is None:
+        canvas.scope = ScopeRenderer(canvas, *labels, zero_line=zero_line)
+    return canvas.scope
 
-    # Get positive frequencies only
-    positive_freqs = freqs[:len(freqs)//2]
-    magnitude = np.abs(fft[:len(fft)//2])
 
-    # Convert to dB and normalize
-    magnitude_db = 20 * np.log10(magnitude + 1e-10)
-    magnitude_db = magnitude_db - np.min(magnitude_db)
+def waveform_renderer(canvas):
+    return scope_renderer(canvas, WAVEFORM_LABELS, zero_line=True)
 
-    # Smooth with Savitzky-Golay filter
-    if len(magnitude_db) > SAVGOL_WINDOW:
-        magnitude_db = signal.savgol_filter(magnitude_db, SAVGOL_WINDOW, 3)
 
-    return positive_freqs, magnitude_db
+def spectrum_renderer(canvas):
+    return scope_renderer(canvas, SPECTRUM_LABELS)
 
 
-def draw_waveform_static(canvas, samples, duration_ms, playback_position=0, is_playing=False):
+def fill_verts(x, y):
+    """Closed polygon between the curve (x, y) and 0"""
+    verts = np.empty((2 * len(x), 2))
+    verts[:len(x), 0] = x
+    verts[:len(x), 1] = y
+    verts[len(x):, 0] = x[::-1]
+    verts[len(x):, 1] = 0
+    return verts
+
+
+def band_verts(x, values, min_height=0.0):
+    """
+    Closed polygon of an envelope trace: maxima left to right, then minima back
+
+    Args:
+        x: block positions, each repeated twice (EnvelopePyramid.trace)
+        values: interleaved min/max values
+        min_height: blocks thinner than this are widened around their
+            centre, so silence still shows as a line
+    """
+    x = x[0::2]
+    mins = values[0::2]
+    maxs = values[1::2]
+    if min_height > 0:
+        centre = (mins + maxs) / 2
+        half = np.maximum((maxs - mins) / 2, min_height / 2)
+        mins, maxs = centre - half, centre + half
+
+    verts = np.empty((2 * len(x), 2))
+    verts[:len(x), 0] = x
+    verts[:len(x), 1] = maxs
+    verts[len(x):, 0] = x[::-1]
+    verts[len(x):, 1] = mins[::-1]
+    return verts
+
+
+def spectrum_ylim(magnitude_db):
+    """Limits of an autoscaled plot of the curve and its fill down to 0"""
+    low = min(float(np.min(magnitude_db)), 0.0)
+    high = max(float(np.max(magnitude_db)), 0.0)
+    margin = (high - low) * 0.05
+    return low - margin, high + margin
+
+
+def window_trace(envelope, playback_position, duration_ms, columns):
+    """
+    Envelope trace of the WINDOW_SIZE_MS window starting at the playhead
+
+    Returns:
+        tuple: (time in ms from the window start, interleaved min/max values)
+    """
+    total_points = envelope.n_samples
+    window_size_points = int((WINDOW_SIZE_MS / duration_ms) * total_points)
+
+    # Calculate window position
+    start_point = int((playback_position / duration_ms) * total_points)
+    if start_point >= total_points:
+        start_point = 0
+    end_point = start_point + window_size_points
+
+    # Envelope level matching the pixel width (constant cost per frame)
+    positions, values = envelope.trace(start_point, end_point, columns)
+    time_window = (positions - start_point) * (WINDOW_SIZE_MS / max(window_size_points, 1))
+    return time_window, values
+
+
+class TrackOverlay:
+    """
+    Another session track drawn under the active one (A/B comparison)
+
+    envelope is already in the track's playback direction (a reversed
+    view for reversed tracks); spectrogram lookups take `reverse`.
+    Overlays follow the active track's playhead position.
+    """
+
+    def __init__(self, color, envelope, duration_ms, spectrogram=None, reverse=False):
+        self.color = color
+        self.envelope = envelope
+        self.duration_ms = duration_ms
+        self.spectrogram = spectrogram
+        self.reverse = reverse
+
+    def waveform(self, columns):
+        """Whole-track trace in ms"""
+        positions, values = self.envelope.trace(0, self.envelope.n_samples, columns)
+        return positions * (self.duration_ms / self.envelope.n_samples), values, self.color
+
+    def waveform_window(self, playback_position, columns):
+        """WINDOW_SIZE_MS window at the playhead (empty past the track's end)"""
+        if playback_position >= self.duration_ms:
+            return np.empty(0), np.empty(0), self.color
+        time_window, values = window_trace(self.envelope, playback_position, self.duration_ms, columns)
+        return time_window, values, self.color
+
+    def spectrum(self):
+        """Whole-track average spectrum"""
+        return self.spectrogram.frequencies, self.spectrogram.average, self.color
+
+    def spectrum_at(self, playback_position):
+        """Spectrum at the playhead (empty past the track's end)"""
+        if playback_position >= self.duration_ms:
+            return np.empty(0), np.empty(0), self.color
+        return (
+            self.spectrogram.frequencies,
+            self.spectrogram.spectrum_at(playback_position, self.reverse),
+            self.color
+        )
+
+
+def waveform_overlays(overlays):
+    return [overlay for overlay in overlays if overlay.envelope is not None]
+
+
+def spectrum_overlays(overlays):
+    return [overlay for overlay in overlays if overlay.spectrogram is not None]
+
+
+def _show_placeholder(renderer, visible):
+    renderer.placeholder.set_visible(visible)
+    renderer.line.set_visible(not visible)
+    if visible:
+        renderer.band.set_visible(False)
+        renderer.set_overlays([])
+        renderer.set_overlay_bands([])
+        renderer.marker.set_visible(False)
+        renderer.marker_label.set_visible(False)
+        if renderer.fill is not None:
+            renderer.fill.set_visible(False)
+        renderer.set_layout(*EMPTY_LAYOUT)
+
+
+def draw_waveform_static(canvas, envelope, duration_ms, playback_position=0, is_playing=False, overlays=()):
     """
     Draw static waveform on canvas
 
     Args:
         canvas: MplCanvas instance
-        samples: prepared waveform samples (normalized, downsampled)
+        envelope: EnvelopePyramid from prepare_waveform_samples
         duration_ms: total duration in milliseconds
         playback_position: current playback position in ms
         is_playing: whether audio is currently playing
+        overlays: TrackOverlay list of other tracks
     """
-    ax = canvas.axes
-    ax.clear()
+    renderer = waveform_renderer(canvas)
 
-    if samples is None:
-        style_scope_axis(ax, 'TIME (ms)', 'AMPLITUDE (V)')
-        ax.text(
-            0.5, 0.5, 'NO SIGNAL',
-            ha='center', va='center',
-            transform=ax.transAxes,
-            color=Colors.GREEN_MEDIUM, fontsize=18, weight='bold'
-        )
-        canvas.draw()
+    if envelope is None:
+        renderer.zero_line.set_visible(False)
+        _show_placeholder(renderer, True)
+        renderer.blit()
         return
 
-    # Create time axis
-    time_ms = np.linspace(0, duration_ms, len(samples))
+    _show_placeholder(renderer, False)
+    renderer.zero_line.set_visible(True)
+    renderer.set_layout((0, duration_ms), (-1.2, 1.2))
 
-    # Plot waveform
-    ax.plot(time_ms, samples, color=Colors.GREEN_BRIGHT, linewidth=1.5, alpha=0.9)
-
-    # Set limits
-    ax.set_xlim(0, duration_ms)
-    ax.set_ylim(-1.2, 1.2)
-    style_scope_axis(ax, 'TIME (ms)', 'AMPLITUDE (V)')
-
-    # Zero line
-    ax.axhline(y=0, color=Colors.BORDER, linewidth=1.5, alpha=0.8)
+    # Min/max envelope at the level matching the pixel width
+    columns = _trace_columns(renderer.ax)
+    positions, values = envelope.trace(0, envelope.n_samples, columns)
+    renderer.set_band(positions * (duration_ms / envelope.n_samples), values)
+    renderer.set_overlay_bands([overlay.waveform(columns) for overlay in waveform_overlays(overlays)])
 
     # Playback position marker
-    if is_playing and playback_position > 0:
-        ax.axvline(
-            x=playback_position,
-            color=Colors.YELLOW,
-            linewidth=2,
-            alpha=0.8,
-            linestyle='--'
-        )
-        ax.text(
-            playback_position, 1.1,
-            f'{playback_position:.0f}ms',
-            color=Colors.YELLOW,
-            fontsize=9,
-            ha='center',
-            weight='bold'
-        )
+    show_marker = is_playing and playback_position > 0
+    renderer.marker.set_visible(show_marker)
+    renderer.marker_label.set_visible(show_marker)
+    if show_marker:
+        renderer.marker.set_xdata([playback_position, playback_position])
+        renderer.marker.set_alpha(0.8)
+        renderer.marker_label.set_position((playback_position, 1.1))
+        renderer.marker_label.set_text(f'{playback_position:.0f}ms')
 
-    canvas.draw()
+    renderer.blit()
 
 
-def draw_spectrum_static(canvas, frequencies, magnitude_db, sample_rate):
+def draw_spectrum_static(canvas, frequencies, magnitude_db, sample_rate, overlays=()):
     """
     Draw frequency spectrum on canvas
 
@@ -198,31 +651,25 @@ def draw_spectrum_static(canvas, frequencies, magnitude_db, sample_rate):
         frequencies: frequency array
         magnitude_db: magnitude in dB
         sample_rate: audio sample rate in Hz
+        overlays: TrackOverlay list of other tracks
     """
-    ax = canvas.axes
-    ax.clear()
+    renderer = spectrum_renderer(canvas)
 
     if frequencies is None or magnitude_db is None:
-        style_scope_axis(ax, 'FREQUENCY (Hz)', 'MAGNITUDE (dB)')
-        ax.text(
-            0.5, 0.5, 'NO SIGNAL',
-            ha='center', va='center',
-            transform=ax.transAxes,
-            color=Colors.GREEN_MEDIUM, fontsize=18, weight='bold'
-        )
-        canvas.draw()
+        _show_placeholder(renderer, True)
+        renderer.blit()
         return
 
-    # Plot spectrum
-    ax.plot(frequencies, magnitude_db, color=Colors.GREEN_BRIGHT, linewidth=1.5, alpha=0.9)
-    ax.fill_between(frequencies, magnitude_db, 0, color=Colors.GREEN_BRIGHT, alpha=0.2)
+    _show_placeholder(renderer, False)
 
-    # Set limits and scale
-    ax.set_xlim(20, sample_rate / 2)
-    ax.set_xscale('log')
-    style_scope_axis(ax, 'FREQUENCY (Hz)', 'MAGNITUDE (dB)')
+    traces = [overlay.spectrum() for overlay in spectrum_overlays(overlays)]
+    ylim = spectrum_ylim(np.concatenate([magnitude_db] + [y for _, y, _ in traces]))
+    renderer.set_layout((20, sample_rate / 2), ylim, 'log')
 
-    canvas.draw()
+    renderer.line.set_data(frequencies, magnitude_db)
+    renderer.set_fill(frequencies, magnitude_db)
+    renderer.set_overlays(traces)
+    renderer.blit()
 
 
 class WaveformAnimator:
@@ -232,92 +679,225 @@ class WaveformAnimator:
 
     def __init__(self, canvas):
         self.canvas = canvas
-        self._background = None
-        self._line = None
-        self._marker = None
-        self._cached_samples = None
+        self._envelope = None
+        self._overlays = []
+
+    @property
+    def is_prepared(self):
+        return self._envelope is not None
 
     def invalidate_cache(self):
         """Clear cached data (call when audio changes)"""
-        self._background = None
-        self._cached_samples = None
+        self._envelope = None
+        self._overlays = []
 
-    def prepare_cache(self, audio_data):
+    def prepare_cache(self, envelope, overlays=()):
         """
         Prepare cached data for animation
 
         Args:
-            audio_data: numpy array of audio samples
+            envelope: EnvelopePyramid from prepare_waveform_samples
+            overlays: TrackOverlay list of other tracks
 
         Returns:
             bool: True if cache prepared successfully
         """
-        if audio_data is None:
+        if envelope is None:
             return False
 
-        # Prepare and cache samples
-        samples = prepare_waveform_samples(audio_data, 1)
-        if samples is None:
-            return False
+        self._envelope = envelope
+        self._overlays = waveform_overlays(overlays)
 
-        self._cached_samples = samples
+        # Moving-window layout (background rendered once, then cached)
+        renderer = waveform_renderer(self.canvas)
+        _show_placeholder(renderer, False)
+        renderer.zero_line.set_visible(True)
+        renderer.marker_label.set_visible(False)
+        renderer.marker.set_visible(True)
+        renderer.marker.set_alpha(0.5)
+        renderer.marker.set_xdata([WINDOW_SIZE_MS // 3] * 2)
+        renderer.set_layout((0, WINDOW_SIZE_MS), (-1.2, 1.2))
 
-        # Setup static background
-        ax = self.canvas.axes
-        ax.clear()
-        ax.set_xlim(0, WINDOW_SIZE_MS)
-        ax.set_ylim(-1.2, 1.2)
-        style_scope_axis(ax, 'TIME (ms)', 'AMPLITUDE (V)')
-        ax.axhline(y=0, color=Colors.BORDER, linewidth=1.5, alpha=0.8)
-
-        # Create empty line for animation
-        self._line, = ax.plot([], [], color=Colors.GREEN_BRIGHT, linewidth=1.5, alpha=0.9)
-        self._marker = ax.axvline(
-            x=WINDOW_SIZE_MS // 3,
-            color=Colors.YELLOW,
-            linewidth=2,
-            alpha=0.5,
-            linestyle='--'
+        return True
+
+    def update(self, playback_position, duration_ms):
+        """
+        Update animation frame using blitting
+
+        Args:
+            playback_position: current playback position in ms
+            duration_ms: total duration in ms
+        """
+        if self._envelope is None:
+            return
+
+        renderer = self.canvas.scope
+        columns = _trace_columns(renderer.ax)
+        time_window, window_samples = window_trace(
+            self._envelope, playback_position, duration_ms, columns
         )
 
-        # Draw and cache background
-        self.canvas.draw()
-        self._background = self.canvas.copy_from_bbox(ax.bbox)
+        renderer.set_band(time_window, window_samples)
+        renderer.set_overlay_bands([
+            overlay.waveform_window(playback_position, columns) for overlay in self._overlays
+        ])
+        renderer.blit()
+
+
+class SpectrumAnimator:
+    """
+    Live CH2 spectrum following the playhead, using blitting
+
+    Each frame is a row lookup into a precomputed Spectrogram, so no FFT
+    runs on the UI thread during playback.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._spectrogram = None
+        self._overlays = []
+
+    @property
+    def is_prepared(self):
+        return self._spectrogram is not None
+
+    def invalidate_cache(self):
+        """Clear cached data (call when audio changes)"""
+        self._spectrogram = None
+        self._overlays = []
+
+    def prepare_cache(self, spectrogram, overlays=()):
+        """
+        Prepare cached background and artists for animation
+
+        Args:
+            spectrogram: Spectrogram from spectrogram.compute_spectrogram
+            overlays: TrackOverlay list of other tracks
+
+        Returns:
+            bool: True if cache prepared successfully
+        """
+        if spectrogram is None:
+            return False
+
+        self._spectrogram = spectrogram
+        self._overlays = spectrum_overlays(overlays)
+
+        # Fixed dB range so frames are comparable (background cached per layout)
+        renderer = spectrum_renderer(self.canvas)
+        _show_placeholder(renderer, False)
+        renderer.set_layout(
+            (20, spectrogram.sample_rate / 2), (0, STFT_DYNAMIC_RANGE_DB * 1.05), 'log'
+        )
 
         return True
 
-    def update(self, playback_position, duration_ms):
+    def update(self, playback_position, reverse=False):
         """
         Update animation frame using blitting
 
         Args:
             playback_position: current playback position in ms
-            duration_ms: total duration in ms
+            reverse: playback runs over the reversed signal
         """
-        # Initialize cache if needed
-        if self._background is None or self._cached_samples is None:
+        if self._spectrogram is None:
             return
 
-        ax = self.canvas.axes
-        total_points = len(self._cached_samples)
-        window_size_points = int((WINDOW_SIZE_MS / duration_ms) * total_points)
-
-        # Calculate window position
-        start_point = int((playback_position / duration_ms) * total_points)
-        if start_point >= total_points:
-            start_point = 0
-        end_point = min(start_point + window_size_points, total_points)
-
-        # Get window samples
-        window_samples = self._cached_samples[start_point:end_point]
-        if len(window_samples) == 0:
-            window_samples = self._cached_samples[:window_size_points]
-
-        time_window = np.linspace(0, WINDOW_SIZE_MS, len(window_samples))
-
-        # Restore background and update line (blitting)
-        self.canvas.restore_region(self._background)
-        self._line.set_data(time_window, window_samples)
-        ax.draw_artist(self._line)
-        ax.draw_artist(self._marker)
-        self.canvas.blit(ax.bbox)
+        renderer = self.canvas.scope
+        frequencies = self._spectrogram.frequencies
+        magnitude_db = self._spectrogram.spectrum_at(playback_position, reverse)
+
+        renderer.line.set_data(frequencies, magnitude_db)
+        renderer.set_fill(frequencies, magnitude_db)
+        renderer.set_overlays([overlay.spectrum_at(playback_position) for overlay in self._overlays])
+        renderer.blit()
+
+
+class RenderBackend(ABC):
+    """
+    Scope render backend interface
+
+    A backend creates the CH1/CH2 widgets ('waveform' / 'spectrum'),
+    draws the static views into them and provides the playback animators
+    (prepare_cache / update / invalidate_cache / is_prepared). Both take
+    TrackOverlay lists of other session tracks to draw underneath. The app
+    only talks to this interface, so the plotting library can be swapped.
+    """
+
+    name = None
+
+    @abstractmethod
+    def create_canvas(self, parent, kind):
+        """Create the scope widget for kind 'waveform' or 'spectrum'"""
+
+    @abstractmethod
+    def draw_waveform_static(self, canvas, envelope, duration_ms, playback_position=0, is_playing=False,
+                             overlays=()):
+        """Draw the full waveform envelope with the playhead at playback_position"""
+
+    @abstractmethod
+    def draw_spectrum_static(self, canvas, frequencies, magnitude_db, sample_rate, overlays=()):
+        """Draw the whole-file spectrum"""
+
+    @abstractmethod
+    def waveform_animator(self, canvas):
+        """Return the playback animator for a waveform canvas"""
+
+    @abstractmethod
+    def spectrum_animator(self, canvas):
+        """Return the playback animator for a spectrum canvas"""
+
+
+class MatplotlibBackend(RenderBackend):
+    """
+    Matplotlib (Agg + blitting) backend
+
+    Always available; its figures can also be saved with fig.savefig for
+    static exports.
+    """
+
+    name = 'matplotlib'
+
+    def create_canvas(self, parent, kind):
+        canvas = MplCanvas(parent, width=Layout.CANVAS_WIDTH, height=Layout.CANVAS_HEIGHT)
+        if kind == 'waveform':
+            waveform_renderer(canvas)
+        else:
+            spectrum_renderer(canvas)
+        return canvas
+
+    def draw_waveform_static(self, canvas, envelope, duration_ms, playback_position=0, is_playing=False,
+                             overlays=()):
+        draw_waveform_static(canvas, envelope, duration_ms, playback_position, is_playing, overlays)
+
+    def draw_spectrum_static(self, canvas, frequencies, magnitude_db, sample_rate, overlays=()):
+        draw_spectrum_static(canvas, frequencies, magnitude_db, sample_rate, overlays)
+
+    def waveform_animator(self, canvas):
+        return WaveformAnimator(canvas)
+
+    def spectrum_animator(self, canvas):
+        return SpectrumAnimator(canvas)
+
+
+def get_render_backend(name=RENDER_BACKEND):
+    """
+    Render backend by name
+
+    Args:
+        name: 'auto' (pyqtgraph when installed, else Matplotlib),
+            'pyqtgraph' or 'matplotlib'
+
+    Returns:
+        RenderBackend instance
+    """
+    if name in ('auto', 'pyqtgraph'):
+        try:
+            from pyqtgraph_backend import PyqtgraphBackend
+        except ImportError:
+            if name == 'pyqtgraph':
+                raise
+        else:
+            return PyqtgraphBackend()
+
+    return MatplotlibBackend()
@@ -0,0 +1,151 @@
+"""
+Background Worker Module for Reserve Audio Analyzer
+Thread pool jobs with cancellation and progress signals for the Qt UI
+"""
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from config import WORKER_THREADS
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once it has been cancelled"""
+
+
+class JobContext:
+    """
+    Handle passed to every job as its first argument
+
+    Long-running jobs call progress() between batches; it raises
+    JobCancelled when the job was cancelled, which ends the job quietly.
+    A job submitted with a parent context (JobRunner.group) is also
+    cancelled when its parent is.
+    """
+
+    def __init__(self, runner, label, generation, parent=None):
+        self.label = label
+        self.generation = generation
+        self.parent = parent
+        self.future = None
+        self._runner = runner
+        self._cancelled = False
+
+    @property
+    def cancelled(self):
+        return (
+            self._cancelled
+            or self.generation != self._runner.generation
+            or (self.parent is not None and self.parent.cancelled)
+        )
+
+    def cancel(self):
+        """Cancel this job, or every job submitted under this group"""
+        self._cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+        self._runner.cancel_children(self)
+
+    def check(self):
+        """Raise JobCancelled if the job should stop"""
+        if self.cancelled:
+            raise JobCancelled(self.label)
+
+    def progress(self, fraction):
+        """Report progress (0..1) to the UI and honour cancellation"""
+        self.check()
+        self._runner.progress.emit(self.label, float(fraction))
+
+
+class JobRunner(QObject):
+    """
+    Runs load/analysis jobs on a thread pool
+
+    Results and errors are delivered on the Qt main thread through queued
+    signals, so callbacks may touch widgets. Cancelling a job - directly or
+    through the group() context it was submitted under, e.g. when the
+    shared audio it analyses is released - stops it at its next progress()
+    call and discards its late result; a job still queued never starts.
+    cancel_all() (on shutdown) does this for every job.
+    """
+
+    progress = pyqtSignal(str, float)
+    _finished = pyqtSignal(int, object, object)
+
+    def __init__(self, max_workers=WORKER_THREADS, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asa-worker')
+        self._jobs = {}
+        self._ids = itertools.count()
+        self._finished.connect(self._on_finished)
+
+    def submit(self, label, fn, *args, on_result=None, on_error=None, parent=None):
+        """
+        Queue fn(context, *args) on the pool
+
+        Args:
+            label: short job name shown in progress reports
+            fn: callable taking a JobContext followed by args
+            on_result: called on the main thread with the return value
+            on_error: called on the main thread with the raised exception
+            parent: group context; cancelling it cancels this job too
+
+        Returns:
+            JobContext of the queued job
+        """
+        job_id = next(self._ids)
+        context = JobContext(self, label, self.generation, parent)
+        self._jobs[job_id] = (context, on_result, on_error)
+        context.future = self._executor.submit(self._run, job_id, context, fn, args)
+        context.future.add_done_callback(lambda future: self._on_done(job_id, context, future))
+        return context
+
+    def group(self, label):
+        """Context that cancels every job submitted with it as parent"""
+        return JobContext(self, label, self.generation)
+
+    def _run(self, job_id, context, fn, args):
+        try:
+            context.check()
+            result = fn(context, *args)
+        except Exception as e:
+            self._finished.emit(job_id, None, e)
+        else:
+            self._finished.emit(job_id, result, None)
+
+    def _on_done(self, job_id, context, future):
+        # A job cancelled before it started never runs _run: report it
+        # here so _on_finished still drops it from _jobs
+        if future.cancelled():
+            self._finished.emit(job_id, None, JobCancelled(context.label))
+
+    def _on_finished(self, job_id, result, error):
+        context, on_result, on_error = self._jobs.pop(job_id, (None, None, None))
+        if context is None or context.cancelled or isinstance(error, JobCancelled):
+            return
+
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+        elif on_result is not None:
+            on_result(result)
+
+    def cancel_children(self, parent):
+        """Cancel the jobs submitted under a group context"""
+        for context, _, _ in list(self._jobs.values()):
+            if context.parent is parent and not context._cancelled:
+                context.cancel()
+
+    def cancel_all(self):
+        """Cancel every job submitted so far"""
+        self.generation += 1
+        for context, _, _ in list(self._jobs.values()):
+            context.cancel()
+
+    def shutdown(self):
+        """Cancel outstanding jobs and release the pool"""
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)